@@ -230,6 +230,7 @@ def test_manual_adjustments():
 
         if "Matteo Gigante" in filler.simulator.analyzer.calculated_stats:
             filler.simulator.analyzer.calculated_stats["Matteo Gigante"]['return_points_won'] = adj['gigante_return']
+        filler.simulator.analyzer.invalidate_player_cache()
 
         # Test simulation
         wins = 0
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Import-Time Benchmark
+Location: tennis/scripts/benchmark_import_time.py
+
+Times the package entry points in fresh interpreters (as worker processes and CLI
+invocations pay it) and checks that the core point engine does not pull in pandas,
+pyarrow or the enhanced analytics stack. Exits with status 1 when an entry point
+imports a module it should not, or takes longer than --budget-ms.
+
+Usage: python scripts/benchmark_import_time.py [--repeat N] [--budget-ms MS]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+SIM_MODELS_DIR = os.path.join(os.path.dirname(__file__), '..', 'sim_models')
+
+# Modules that only CSV/parquet export or simulate_match_enhanced() may import
+HEAVY_MODULES = (
+    'pandas',
+    'pyarrow',
+    'main_sim.enhanced_analytics',
+    'main_sim.enhanced_profiles',
+    'main_sim.enhanced_data_engine',
+)
+
+# Entry point -> heavy modules it must not import
+ENTRY_POINTS = {
+    'main_sim': HEAVY_MODULES + ('numpy', 'main_sim.simulator'),
+    'main_sim.stats': HEAVY_MODULES + ('numpy',),
+    'main_sim.simulator': HEAVY_MODULES,
+    'main_sim.slate_simulator': HEAVY_MODULES,
+    'main_sim.batch_runner': HEAVY_MODULES,
+}
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{'ms': elapsed * 1000, 'loaded': [m for m in {forbidden!r} if m in sys.modules]}}))
+"""
+
+
+def time_import(module: str, forbidden, repeat: int):
+    """(best import time in ms, forbidden modules loaded) over `repeat` fresh interpreters"""
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(SIM_MODELS_DIR))
+    best, loaded = None, []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, forbidden=tuple(forbidden))],
+                                env=env, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        best = result['ms'] if best is None else min(best, result['ms'])
+        loaded = result['loaded']
+    return best, loaded
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark package import time")
+    parser.add_argument('--repeat', type=int, default=5, help="Fresh interpreters per entry point (best time is kept)")
+    parser.add_argument('--budget-ms', type=float, default=None, help="Fail when an entry point takes longer")
+    args = parser.parse_args()
+
+    print("⏱️ IMPORT TIME (best of {})".format(args.repeat))
+    print("=" * 60)
+    failures = []
+    for module, forbidden in ENTRY_POINTS.items():
+        ms, loaded = time_import(module, forbidden, args.repeat)
+        status = "✅"
+        if loaded:
+            status = "❌"
+            failures.append(f"{module} imports {', '.join(loaded)}")
+        if args.budget_ms is not None and ms > args.budget_ms:
+            status = "❌"
+            failures.append(f"{module} took {ms:.0f}ms (budget {args.budget_ms:.0f}ms)")
+        print(f"  {status} {module:<28} {ms:8.1f}ms")
+
+    if failures:
+        print("\n⚠️ Import guard failed:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n✅ Core entry points import without pandas, pyarrow or the enhanced analytics stack")
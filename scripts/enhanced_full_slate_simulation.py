@@ -9,6 +9,7 @@ import sys
 import json
 import pandas as pd
 import logging
+import time
 from datetime import datetime
 from typing import Dict, List, Tuple
 
@@ -17,6 +18,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from scripts.enhanced_player_data_filler import EnhancedPlayerDataFiller
 from scripts.load_tennis_abstract_stats import load_tennis_abstract_stats
+from sim_models.main_sim.progress import ProgressTracker
 
 
 class EnhancedSlateSimulator:
@@ -224,6 +226,7 @@ class EnhancedSlateSimulator:
                                 'first_serve_win_rate': min(85.0, player_stats['service_points_won'] + 12.0),
                                 'second_serve_win_rate': max(35.0, player_stats['service_points_won'] - 8.0)
                             })
+                            self.filler.simulator.analyzer.invalidate_player_cache(player_name)
 
                         print(f"📊 {player_name}: Estimated (Hold: {estimated_hold:.1f}%, Break: {estimated_break:.1f}%)")
 
@@ -449,8 +452,18 @@ class EnhancedSlateSimulator:
             }
         }
 
-    def run_full_slate_simulation(self, num_simulations: int = 1000) -> Dict:
-        """Run the full slate simulation with enhanced stats."""
+    @staticmethod
+    def _print_progress(event):
+        if not event.done:
+            print(f"  Completed {event.completed}/{event.total} simulations...")
+
+    def run_full_slate_simulation(self, num_simulations: int = 1000, progress_callback=None) -> Dict:
+        """
+        Run the full slate simulation with enhanced stats.
+
+        progress_callback receives a ProgressEvent every 200 simulations (printed when
+        omitted); returning False stops the run early.
+        """
         print(f"\n🎾 ENHANCED FULL SLATE SIMULATION")
         print("=" * 70)
 
@@ -474,11 +487,13 @@ class EnhancedSlateSimulator:
                 'opponent': player['opponent']
             }
 
+        tracker = ProgressTracker(num_simulations, progress_callback or self._print_progress,
+                                  every=200, label='enhanced_slate')
+
         # Run simulations
+        completed = 0
         for sim in range(num_simulations):
-            if (sim + 1) % 200 == 0:
-                print(f"  Completed {sim + 1}/{num_simulations} simulations...")
-
+            started = time.perf_counter()
             for player in players:
                 player_name = player['name']
                 opponent_name = player['opponent']
@@ -502,6 +517,12 @@ class EnhancedSlateSimulator:
                         player_results[opponent_name]['wins'] += 1
                     player_results[opponent_name]['total_fantasy_points'] += match_details['p2_fantasy_points']
 
+            completed += 1
+            if not tracker.step(matches=len(players), busy_seconds=time.perf_counter() - started):
+                break
+
+        tracker.finish()
+
         # Calculate final statistics
         final_results = []
         for player_name, results in player_results.items():
@@ -524,7 +545,7 @@ class EnhancedSlateSimulator:
         return {
             'results': final_results,
             'enhancement_summary': enhancement_results,
-            'simulation_count': num_simulations,
+            'simulation_count': completed,
             'surface': surface
         }
 
@@ -9,10 +9,20 @@ import sys
 import json
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 # Add the project root to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+from pathlib import Path
+
 from sim_models.main_sim.simulator import FantasyTennisSimulator
+from sim_models.main_sim.analyzer_registry import get_shared_analyzer
+from sim_models.main_sim.elo_index import EloIndex
+
+# Stats approximated from players with a similar ELO
+APPROXIMATED_STATS = ('service_points_won', 'return_points_won', 'ace_rate',
+                      'double_fault_rate', 'first_serve_percentage')
 
 
 class EnhancedPlayerDataFiller:
@@ -26,14 +36,20 @@ class EnhancedPlayerDataFiller:
             min_matches_threshold: Minimum matches required to consider data sufficient
         """
         self.min_matches_threshold = min_matches_threshold
-        self.simulator = FantasyTennisSimulator()
+        self.shared_analyzer = get_shared_analyzer()
+        # Enhanced players are written into the simulator's data, so it gets a private copy
+        self.simulator = FantasyTennisSimulator(analyzer=self.shared_analyzer.copy())
         self.all_players_data = self._load_all_players_data()
+        self._elo_indexes = {}  # surface -> EloIndex over all_players_data
 
     def _load_all_players_data(self) -> Dict:
-        """Load all player data from the processed stats file."""
+        """Load all player data from the processed stats file (reused if the analyzer loaded it)."""
         all_players_file = os.path.join(
             os.path.dirname(__file__), '..', 'data', 'processed', 'player_stats.json'
         )
+        stats_source = self.shared_analyzer.stats_source
+        if stats_source and Path(stats_source).resolve() == Path(all_players_file).resolve():
+            return self.shared_analyzer.calculated_stats
         with open(all_players_file, 'r') as f:
             return json.load(f)
 
@@ -71,77 +87,51 @@ class EnhancedPlayerDataFiller:
 
         return enhancement_needs
 
+    def _elo_index(self, surface: str) -> EloIndex:
+        """All players sorted by surface-weighted ELO, match counts from the simulator's stats (built once per surface)."""
+        if surface not in self._elo_indexes:
+            self._elo_indexes[surface] = EloIndex.build(self.simulator.analyzer, surface,
+                                                        stats=self.all_players_data,
+                                                        counts=self.simulator.analyzer.calculated_stats)
+        return self._elo_indexes[surface]
+
+    def _approximation_weights(self, elo_diffs: np.ndarray, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """ELO proximity times data quality; players with too few matches get no weight."""
+        sufficient = (columns['surface_matches'] >= self.min_matches_threshold) | (columns['matches'] >= 20)
+        elo_weight = 1 / (1 + elo_diffs / 50)
+        data_quality_weight = np.minimum(2.0, columns['matches'] / 20)  # Bonus weight for more matches
+        return np.where(sufficient, elo_weight * data_quality_weight, 0.0)
+
     def calculate_elo_based_stats(self, target_elo: float, surface: str = 'Clay',
                                  elo_range: int = 100) -> Tuple[Optional[Dict[str, float]], List[Dict]]:
         """Calculate stats based on average of players with similar ELO ratings."""
-        similar_players = []
+        index = self._elo_index(surface)
 
-        # Get players with similar ELO ratings
-        for player_name, player_data in self.all_players_data.items():
-            if isinstance(player_data, dict):
-                player_elo = self.simulator.analyzer.get_player_elo(player_name, surface)
-
-                if player_elo and abs(player_elo - target_elo) <= elo_range:
-                    # Check if this player has sufficient data
-                    if player_name in self.simulator.analyzer.calculated_stats:
-                        calc_data = self.simulator.analyzer.calculated_stats[player_name]
-                        surface_matches = calc_data.get(f'{surface.lower()}_matches', 0)
-                        total_matches = calc_data.get('matches', 0)
-
-                        # Only use players with sufficient data for approximation
-                        if surface_matches >= self.min_matches_threshold or total_matches >= 20:
-                            similar_players.append({
-                                'name': player_name,
-                                'elo': player_elo,
-                                'stats': {
-                                    'service_points_won': player_data.get('service_points_won', 60.0),
-                                    'return_points_won': player_data.get('return_points_won', 40.0),
-                                    'ace_rate': player_data.get('ace_rate', 6.0),
-                                    'double_fault_rate': player_data.get('double_fault_rate', 4.0),
-                                    'first_serve_percentage': player_data.get('first_serve_percentage', 62.0)
-                                },
-                                'matches': total_matches,
-                                'surface_matches': surface_matches
-                            })
+        # Weighted average over the ELO window, based on ELO proximity and data quality
+        count, means = index.aggregate(target_elo, elo_range, weight=self._approximation_weights)
 
         # If not enough similar players, expand search range
-        if len(similar_players) < 5:
+        if count < 5:
+            if index.span(target_elo - elo_range, target_elo + elo_range) == (0, len(index)):
+                return None, []  # Already searching every player
             return self.calculate_elo_based_stats(target_elo, surface, elo_range * 2)
 
-        if similar_players:
-            # Calculate weighted average based on ELO proximity and data quality
-            total_weight = 0
-            weighted_stats = {
-                'service_points_won': 0.0,
-                'return_points_won': 0.0,
-                'ace_rate': 0.0,
-                'double_fault_rate': 0.0,
-                'first_serve_percentage': 0.0
-            }
-
-            for player in similar_players:
-                # Weight based on ELO proximity and data quality
-                elo_diff = abs(player['elo'] - target_elo)
-                elo_weight = 1 / (1 + elo_diff / 50)
+        weighted_stats = {stat_name: means[stat_name] for stat_name in APPROXIMATED_STATS}
 
-                # Bonus weight for more matches
-                data_quality_weight = min(2.0, player['matches'] / 20)
-
-                weight = elo_weight * data_quality_weight
-                total_weight += weight
-
-                for stat_name in weighted_stats.keys():
-                    if stat_name in player['stats']:
-                        weighted_stats[stat_name] += player['stats'][stat_name] * weight
-
-            # Normalize by total weight
-            if total_weight > 0:
-                for stat_name in weighted_stats.keys():
-                    weighted_stats[stat_name] /= total_weight
-
-            return weighted_stats, similar_players
-
-        return None, []
+        # Players the average was based on (in data file order)
+        similar_players = []
+        for position in sorted(index.within(target_elo, elo_range), key=index.order.__getitem__):
+            total_matches = int(index.columns['matches'][position])
+            surface_matches = int(index.columns['surface_matches'][position])
+            if surface_matches >= self.min_matches_threshold or total_matches >= 20:
+                similar_players.append({
+                    'name': index.names[position],
+                    'elo': index.elos[position],
+                    'matches': total_matches,
+                    'surface_matches': surface_matches
+                })
+
+        return weighted_stats, similar_players
 
     def enhance_player_data(self, player_name: str, surface: str = 'Clay') -> bool:
         """
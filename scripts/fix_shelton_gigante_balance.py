@@ -73,10 +73,12 @@ def fix_shelton_gigante_balance():
     if "Ben Shelton" in filler.simulator.analyzer.calculated_stats:
         filler.simulator.analyzer.calculated_stats["Ben Shelton"]['service_points_won'] = new_shelton_service
         filler.simulator.analyzer.calculated_stats["Ben Shelton"]['return_points_won'] = new_shelton_return
+        filler.simulator.analyzer.invalidate_player_cache("Ben Shelton")
     
     if "Matteo Gigante" in filler.simulator.analyzer.calculated_stats:
         filler.simulator.analyzer.calculated_stats["Matteo Gigante"]['service_points_won'] = new_gigante_service
         filler.simulator.analyzer.calculated_stats["Matteo Gigante"]['return_points_won'] = new_gigante_return
+        filler.simulator.analyzer.invalidate_player_cache("Matteo Gigante")
     
     # Test the adjusted simulation
     print(f"\n3. TESTING ADJUSTED SIMULATION:")
@@ -192,10 +194,12 @@ def test_multiple_adjustments():
         if "Ben Shelton" in filler.simulator.analyzer.calculated_stats:
             filler.simulator.analyzer.calculated_stats["Ben Shelton"]['service_points_won'] = case['shelton_service']
             filler.simulator.analyzer.calculated_stats["Ben Shelton"]['return_points_won'] = case['shelton_return']
+            filler.simulator.analyzer.invalidate_player_cache("Ben Shelton")
         
         if "Matteo Gigante" in filler.simulator.analyzer.calculated_stats:
             filler.simulator.analyzer.calculated_stats["Matteo Gigante"]['service_points_won'] = case['gigante_service']
             filler.simulator.analyzer.calculated_stats["Matteo Gigante"]['return_points_won'] = case['gigante_return']
+            filler.simulator.analyzer.invalidate_player_cache("Matteo Gigante")
         
         # Test simulation
         wins = 0
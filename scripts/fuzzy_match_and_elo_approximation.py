@@ -16,6 +16,8 @@ from typing import Dict, List, Optional, Tuple, Union
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from sim_models.main_sim.simulator import FantasyTennisSimulator
+from sim_models.main_sim.name_resolution import NameIndex
+from sim_models.main_sim.elo_index import EloIndex
 
 
 def similarity(a: str, b: str) -> float:
@@ -23,18 +25,10 @@ def similarity(a: str, b: str) -> float:
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
 
-def fuzzy_match_player(target_name: str, candidate_names: List[str], threshold: float = 0.7) -> Optional[str]:
-    """Find the best fuzzy match for a player name."""
-    best_match = None
-    best_score = 0.0
-
-    for candidate in candidate_names:
-        score = similarity(target_name, candidate)
-        if score > best_score and score >= threshold:
-            best_score = score
-            best_match = candidate
-
-    return best_match if best_score >= threshold else None
+def fuzzy_match_player(target_name: str, candidate_names: Union[List[str], NameIndex], threshold: float = 0.7) -> Optional[str]:
+    """Find the best fuzzy match for a player name (pass a NameIndex when matching many names)."""
+    index = candidate_names if isinstance(candidate_names, NameIndex) else NameIndex(candidate_names)
+    return index.match(target_name, threshold)
 
 
 def load_tmcp_player_names() -> Dict[str, List[str]]:
@@ -86,53 +80,27 @@ def load_tmcp_player_names() -> Dict[str, List[str]]:
     }
 
 
-def calculate_elo_based_stats(target_elo: float, all_players_data: Dict, surface: str = 'Clay', simulator=None) -> Tuple[Optional[Dict[str, float]], List[Dict]]:
-    """Calculate stats based on average of players with similar ELO ratings."""
+def calculate_elo_based_stats(target_elo: float, all_players_data: Dict, surface: str = 'Clay', simulator=None,
+                              elo_index: Optional[EloIndex] = None) -> Tuple[Optional[Dict[str, float]], List[Dict]]:
+    """Calculate stats based on average of players with similar ELO ratings (pass elo_index to reuse it)."""
     if not simulator:
         return None, []
 
-    elo_range = 100  # ±100 ELO points
+    index = elo_index or EloIndex.build(simulator.analyzer, surface, stats=all_players_data)
     similar_players = []
 
-    # Get players with similar ELO ratings
-    for player_name, player_data in all_players_data.items():
-        if isinstance(player_data, dict):
-            # Get ELO rating for this player
-            player_elo = simulator.analyzer.get_player_elo(player_name, surface)
-
-            if player_elo and abs(player_elo - target_elo) <= elo_range:
-                # Use the stats directly from player_data
-                similar_players.append({
-                    'name': player_name,
-                    'elo': player_elo,
-                    'stats': {
-                        'service_points_won': player_data.get('service_points_won', 60.0),
-                        'return_points_won': player_data.get('return_points_won', 40.0),
-                        'ace_rate': player_data.get('ace_rate', 6.0),
-                        'double_fault_rate': player_data.get('double_fault_rate', 4.0),
-                        'first_serve_percentage': player_data.get('first_serve_percentage', 62.0)
-                    }
-                })
-
-    if not similar_players:
-        # Expand search range if no similar players found
-        elo_range = 200
-        for player_name, player_data in all_players_data.items():
-            if isinstance(player_data, dict):
-                player_elo = simulator.analyzer.get_player_elo(player_name, surface)
-
-                if player_elo and abs(player_elo - target_elo) <= elo_range:
-                    similar_players.append({
-                        'name': player_name,
-                        'elo': player_elo,
-                        'stats': {
-                            'service_points_won': player_data.get('service_points_won', 60.0),
-                            'return_points_won': player_data.get('return_points_won', 40.0),
-                            'ace_rate': player_data.get('ace_rate', 6.0),
-                            'double_fault_rate': player_data.get('double_fault_rate', 4.0),
-                            'first_serve_percentage': player_data.get('first_serve_percentage', 62.0)
-                        }
-                    })
+    # Get players with similar ELO ratings (±100, else ±200 ELO points), in data file order
+    for elo_range in (100, 200):
+        for position in sorted(index.within(target_elo, elo_range), key=index.order.__getitem__):
+            stats = index.player(position)
+            del stats['matches'], stats['surface_matches']
+            similar_players.append({
+                'name': index.names[position],
+                'elo': index.elos[position],
+                'stats': stats
+            })
+        if similar_players:
+            break
 
     if similar_players:
         # Calculate weighted average based on ELO proximity
@@ -208,16 +176,16 @@ def analyze_missing_players():
     print(f"\n🔍 ATTEMPTING FUZZY MATCHING...")
     print("-" * 60)
 
+    # Try both men's and women's names (indexed once for all lookups)
+    tmcp_index = NameIndex(tmcp_names['men'] + tmcp_names['women'])
+
     fuzzy_matches = {}
     for player in missing_players:
         player_name = player['name']
 
-        # Try both men's and women's names
-        all_tmcp_names = tmcp_names['men'] + tmcp_names['women']
-
         # Try different similarity thresholds
         for threshold in [0.8, 0.7, 0.6]:
-            match = fuzzy_match_player(player_name, all_tmcp_names, threshold)
+            match = fuzzy_match_player(player_name, tmcp_index, threshold)
             if match:
                 fuzzy_matches[player_name] = {
                     'match': match,
@@ -237,6 +205,7 @@ def analyze_missing_players():
     all_players_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'processed', 'player_stats.json')
     with open(all_players_file, 'r') as f:
         all_players_data = json.load(f)
+    elo_index = EloIndex.build(simulator.analyzer, surface, stats=all_players_data)
 
     elo_approximations = {}
     for player in missing_players:
@@ -244,7 +213,7 @@ def analyze_missing_players():
         player_elo = player['elo']
 
         if player_elo:
-            approximated_stats, similar_players = calculate_elo_based_stats(player_elo, all_players_data, surface, simulator)
+            approximated_stats, similar_players = calculate_elo_based_stats(player_elo, all_players_data, surface, simulator, elo_index)
 
             if approximated_stats:
                 elo_approximations[player_name] = {
@@ -7,12 +7,14 @@ Uses actual player pool with real salaries and matchups.
 import os
 import sys
 import json
+import time
 import numpy as np
 
 # Add the project root to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from sim_models.main_sim.simulator import FantasyTennisSimulator
+from sim_models.main_sim.progress import ProgressTracker
 
 
 def load_player_pool():
@@ -46,9 +48,21 @@ def load_player_pool():
     return matchups, salary_map, surface
 
 
-def simulate_player_pool(custom_simulator=None):
-    """Simulate 1000 matches using the actual player pool."""
-    print("🎾 PLAYER POOL TENNIS SIMULATION - 1000 MATCHES")
+def print_percent_progress(event):
+    """Default progress output: percentage complete on one line."""
+    if event.done:
+        print("Complete!")
+    else:
+        print(f"{int(100 * event.fraction)}%", end=" ", flush=True)
+
+
+def simulate_player_pool(custom_simulator=None, num_simulations=1000, progress_callback=None):
+    """
+    Simulate matches using the actual player pool.
+
+    progress_callback receives a ProgressEvent every 100 matches; returning False stops the run.
+    """
+    print(f"🎾 PLAYER POOL TENNIS SIMULATION - {num_simulations} MATCHES")
     print("=" * 80)
 
     simulator = custom_simulator if custom_simulator else FantasyTennisSimulator()
@@ -69,18 +83,19 @@ def simulate_player_pool(custom_simulator=None):
         player_wins[player] = 0
         player_matches[player] = 0
 
-    print("\nRunning 1000 simulations...")
-    print("Progress: ", end="", flush=True)
-
-    # Run 1000 simulations by cycling through matchups
-    for i in range(1000):
-        if i % 100 == 0:
-            print(f"{i//10}%", end=" ", flush=True)
+    print(f"\nRunning {num_simulations} simulations...")
+    if progress_callback is None:
+        print("Progress: ", end="", flush=True)
+    tracker = ProgressTracker(num_simulations, progress_callback or print_percent_progress,
+                              every=100, label='player_pool')
 
+    # Run simulations by cycling through matchups
+    for i in range(num_simulations):
         # Cycle through matchups
         matchup_idx = i % len(matchups)
         player1, player2, match_surface = matchups[matchup_idx]
 
+        started = time.perf_counter()
         try:
             p1_stats, p2_stats, _ = simulator.simulate_match_detailed(
                 player1, player2, match_surface, verbose=False
@@ -105,9 +120,12 @@ def simulate_player_pool(custom_simulator=None):
 
         except Exception as e:
             # Skip problematic matchups
-            continue
+            pass
+
+        if not tracker.step(matches=1, busy_seconds=time.perf_counter() - started):
+            break
 
-    print("100% Complete!")
+    tracker.finish()
 
     # Calculate percentiles for each player
     print(f"\n📊 FANTASY POINTS PERCENTILE ANALYSIS")
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Tennis Slate Batch Runner
+Location: tennis/scripts/run_slate_batch.py
+
+Simulates every slate file in a directory, simulating matches shared between
+slates (classic and showdown contests) only once.
+
+Usage: python scripts/run_slate_batch.py [slate_dir] [num_simulations] [output_dir]
+"""
+
+import sys
+import os
+
+# Add paths for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'sim_models'))
+
+from main_sim.slate_simulator import TennisSlateSimulator
+from main_sim.batch_runner import SlateBatchRunner
+
+
+if __name__ == "__main__":
+    slate_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join('data', 'slates')
+    num_simulations = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    output_dir = sys.argv[3] if len(sys.argv) > 3 else os.path.join('outputs', 'slates')
+
+    if not os.path.isdir(slate_dir):
+        print(f"❌ Slate directory not found: {slate_dir}")
+        sys.exit(1)
+
+    runner = SlateBatchRunner(TennisSlateSimulator(), simulation_workers=os.cpu_count() or 1)
+    jobs = runner.run(slate_dir, num_simulations=num_simulations, output_dir=output_dir)
+
+    print(f"\n🏁 Wrote outputs for {len(jobs)} slates to {output_dir}")
@@ -80,17 +80,21 @@ class SimulationDiagnostics:
             'player_pairs': []
         }
 
+        # Precompute ELO ratings and pairwise win probabilities for every player once
+        matchups = self.simulator.build_matchup_matrix(
+            [name for match in matches for name in (match['player1'], match['player2'])])
+
         for match in matches:
             p1, p2 = match['player1'], match['player2']
             surface = match.get('surface', 'Clay')
 
             # Get ELO ratings
-            p1_elo = self.simulator.analyzer.get_player_elo(p1, surface)
-            p2_elo = self.simulator.analyzer.get_player_elo(p2, surface)
+            p1_elo = matchups.player_elo(p1, surface)
+            p2_elo = matchups.player_elo(p2, surface)
 
             if p1_elo and p2_elo:
                 elo_diff = p1_elo - p2_elo
-                theoretical_prob = self.simulator.calculate_elo_win_probability(p1, p2, surface)
+                theoretical_prob = matchups.win_probability(p1, p2, surface)
 
                 # Run simulations to get actual win rate
                 p1_wins = 0
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Checkpoint resume check: an interrupted and resumed slate run must match an
+uninterrupted run with the same seed.
+Location: tennis/scripts/test_checkpoint_resume.py
+
+The first run goes straight through; the second is stopped by its progress
+callback after a checkpoint and finished by a fresh simulator resuming from it.
+Summary, per-player statistics and correlations must be identical.
+"""
+
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sim_models.main_sim.slate_simulator import TennisSlateSimulator, Match
+
+
+MATCHES = [Match("Carlos Alcaraz", "Jannik Sinner", "Hard"),
+           Match("Novak Djokovic", "Alexander Zverev", "Hard")]
+PLAYERS = [name for match in MATCHES for name in (match.player1, match.player2)]
+
+
+def snapshot(simulator: TennisSlateSimulator):
+    """Everything a caller reads after the run (timestamps excluded)"""
+    summary = {k: v for k, v in simulator.summary().items() if k != 'latest_simulation'}
+    stats = {name: simulator.get_player_statistics(name) for name in PLAYERS}
+    ids = [sim.simulation_id for sim in simulator.results_history]
+    return summary, stats, ids, simulator.get_player_correlations()
+
+
+def test_resume_matches_uninterrupted(num_simulations: int = 30, stop_at: int = 10, seed: int = 11):
+    """Stop after `stop_at` simulations, resume in a new simulator, compare with a straight run"""
+    print("🎾 CHECKPOINT RESUME EQUIVALENCE")
+    print("=" * 60)
+    with redirect_stdout(io.StringIO()):
+        straight = TennisSlateSimulator(seed=seed)
+        straight.simulate_multiple_slates(MATCHES, num_simulations, verbose=False)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'slate.ckpt')
+            interrupted = TennisSlateSimulator(seed=seed)
+            interrupted.simulate_multiple_slates(
+                MATCHES, num_simulations, verbose=False, checkpoint_path=path,
+                checkpoint_every=stop_at, progress_every=stop_at,
+                progress_callback=lambda event: event.completed < stop_at)
+
+            resumed = TennisSlateSimulator(seed=seed + 1)
+            run = resumed.simulate_multiple_slates(MATCHES, num_simulations, verbose=False,
+                                                   checkpoint_path=path, resume_from=path)
+
+    expected, got = snapshot(straight), snapshot(resumed)
+    failures = 0
+    for label, a, b in zip(("summary", "player statistics", "simulation ids", "correlations"),
+                           expected, got):
+        ok = a == b
+        failures += not ok
+        print(f"  {'✅' if ok else '❌'} {label} {'match' if ok else 'differ'}")
+    run_ok = len(run) == num_simulations - stop_at
+    failures += not run_ok
+    print(f"  {'✅' if run_ok else '❌'} resumed call ran {len(run)} of {num_simulations} simulations")
+    return failures
+
+
+if __name__ == "__main__":
+    failures = test_resume_matches_uninterrupted()
+    print(f"\n{'✅ All checks passed' if not failures else f'❌ {failures} checks failed'}")
+    sys.exit(1 if failures else 0)
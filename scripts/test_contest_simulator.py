@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+GPP contest simulator checks on small synthetic slates.
+Location: tennis/scripts/test_contest_simulator.py
+
+Tied lineups must split the prizes of the ranks they share, the sampled field must
+reproduce the projected ownership, and the default field must fill the contest.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sim_models.main_sim.scenarios import ScenarioMatrix
+from sim_models.main_sim.contest_simulator import ContestSimulator, PayoutStructure
+
+
+def make_slate(seed: int, num_matches: int = 10, num_simulations: int = 200):
+    """Random scenario matrix, salaries and ownership for a slate of `num_matches` matches"""
+    rng = np.random.default_rng(seed)
+    players = [f"Player {i}" for i in range(2 * num_matches)]
+    opponents = {players[i]: players[i ^ 1] for i in range(len(players))}
+    points = rng.normal(30, 10, (num_simulations, len(players)))
+    salaries = {name: int(rng.integers(60, 110)) * 100 for name in players}
+    ownership = {name: min(float(share), 0.95)
+                 for name, share in zip(players, rng.dirichlet(np.full(len(players), 0.7)) * 6)}
+    return ScenarioMatrix(players=players, points=points, opponents=opponents), salaries, ownership
+
+
+def test_tie_split_payouts():
+    """Our lineup and two identical field lineups share first place and split ranks 1-3"""
+    print("🎾 TIE-SPLIT PAYOUTS")
+    print("=" * 60)
+    players = [f"Player {i}" for i in range(12)]
+    points = np.tile(np.arange(12, 0, -1, dtype=float), (5, 1))  # Player 0 always scores most
+    scenarios = ScenarioMatrix(players=players, points=points,
+                               opponents={players[i]: players[i ^ 1] for i in range(12)})
+    payouts = PayoutStructure.from_tiers(entry_fee=10, tiers=[(1, 300), (2, 200), (3, 100), (4, 50)])
+    contest = ContestSimulator(scenarios, {name: 5000 for name in players}, payouts, seed=0)
+
+    best = [0, 2, 4, 6, 8, 10]
+    worse = [1, 3, 5, 7, 9, 11]
+    results = contest.simulate(np.array([best, worse]), field=np.array([best, best, worse]))
+
+    checks = [
+        ("tied winners get (300 + 200 + 100) / 3", results.expected_payout[0], 200.0),
+        ("tied winners share the win", results.win_rate[0], 1 / 3),
+        ("tied winners average ranks 1-3", results.mean_rank[0], 2.0),
+        # Our lineups are ranked against the field only, not against each other
+        ("tied losers split ranks 3-4", results.expected_payout[1], 75.0),
+        ("tied losers average ranks 3-4", results.mean_rank[1], 3.5),
+    ]
+    failures = 0
+    for label, got, expected in checks:
+        ok = abs(got - expected) < 1e-9
+        failures += not ok
+        print(f"  {'✅' if ok else '❌'} {label}: {got:.4f} (expected {expected:.4f})")
+    return failures
+
+
+def test_field_ownership(tolerance: float = 0.02):
+    """
+    Realized field ownership matches the projection once opponent pairs are capped at 100%
+
+    The cap rejects the priciest lineups but leaves room for the projected ownership
+    (its average lineup salary is under the cap).
+    """
+    print("\n📊 FIELD OWNERSHIP")
+    print("=" * 60)
+    failures = 0
+    for seed in range(3):
+        scenarios, salaries, ownership = make_slate(seed)
+        contest = ContestSimulator(scenarios, salaries, PayoutStructure.power_curve(20, 5000),
+                                   ownership=ownership, seed=seed, salary_cap=60000)
+        field = contest.generate_field(100000)
+        realized = np.bincount(field.ravel(), minlength=scenarios.num_players) / len(field)
+        target = contest._target_ownership()
+        error = float(np.abs(realized - target).max())
+
+        opponents = contest.opponents[field]
+        rules_ok = (contest.salaries[field].sum(axis=1) <= contest.salary_cap).all() and \
+            not (field[:, :, None] == opponents[:, None, :]).any()
+        ok = error <= tolerance and rules_ok
+        failures += not ok
+        print(f"  {'✅' if ok else '❌'} slate {seed}: max ownership error {error:.3f}, "
+              f"rules {'kept' if rules_ok else 'broken'}")
+    return failures
+
+
+def test_default_field_size():
+    """Without a field size the field fills the contest's entries alongside our lineups"""
+    print("\n📦 DEFAULT FIELD SIZE")
+    print("=" * 60)
+    scenarios, salaries, ownership = make_slate(0)
+    contest = ContestSimulator(scenarios, salaries, PayoutStructure.power_curve(20, 500),
+                               ownership=ownership, seed=0, salary_cap=54000)
+    lineups = contest.generate_field(3)
+    results = contest.simulate(lineups)
+    ok = results.field_size == 497
+    print(f"  {'✅' if ok else '❌'} field of {results.field_size} for 3 lineups in a 500-entry contest")
+    return int(not ok)
+
+
+if __name__ == "__main__":
+    failures = test_tie_split_payouts() + test_field_ownership() + test_default_field_size()
+    print(f"\n{'✅ All checks passed' if not failures else f'❌ {failures} checks failed'}")
+    sys.exit(1 if failures else 0)
@@ -33,6 +33,7 @@ def test_high_variance_solution():
     if "Matteo Gigante" in filler.simulator.analyzer.calculated_stats:
         filler.simulator.analyzer.calculated_stats["Matteo Gigante"]['service_points_won'] = 59.0
         filler.simulator.analyzer.calculated_stats["Matteo Gigante"]['return_points_won'] = 40.0
+    filler.simulator.analyzer.invalidate_player_cache()
     
     print("1. CONSERVATIVE STATS:")
     print("-" * 40)
@@ -93,6 +94,7 @@ def test_high_variance_solution():
         if "Matteo Gigante" in filler.simulator.analyzer.calculated_stats:
             filler.simulator.analyzer.calculated_stats["Matteo Gigante"]['service_points_won'] = case['gigante_service']
             filler.simulator.analyzer.calculated_stats["Matteo Gigante"]['return_points_won'] = case['gigante_return']
+        filler.simulator.analyzer.invalidate_player_cache()
         
         # Test with high variance
         filler.simulator.surface_adjustments[surface]['variance_multiplier'] = 0.8
@@ -129,6 +131,7 @@ def test_high_variance_solution():
     if "Matteo Gigante" in filler.simulator.analyzer.calculated_stats:
         filler.simulator.analyzer.calculated_stats["Matteo Gigante"]['service_points_won'] = 60.0
         filler.simulator.analyzer.calculated_stats["Matteo Gigante"]['return_points_won'] = 40.0
+    filler.simulator.analyzer.invalidate_player_cache()
     
     print("Equal stats: Both players 60% service, 40% return")
     print("Let ELO create the skill difference")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Lineup optimizer check against brute force on small synthetic slates.
+Location: tennis/scripts/test_lineup_optimizer.py
+
+Every feasible lineup of a 16-player pool is scored exactly and the best objective
+must equal the optimizer's (mean, percentile and win probability objectives, with
+and without the opponent rule). Exposure limits are checked on the same slates.
+"""
+
+import os
+import sys
+from itertools import combinations
+
+import numpy as np
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sim_models.main_sim.scenarios import ScenarioMatrix
+from sim_models.main_sim.lineup_optimizer import LineupOptimizer
+
+
+def make_slate(seed: int, num_matches: int = 8, num_simulations: int = 300):
+    """Scenario matrix where the match winner scores more, with salaries only loosely tied to points"""
+    rng = np.random.default_rng(seed)
+    players = [f"Player {i}" for i in range(2 * num_matches)]
+    opponents = {}
+    points = np.empty((num_simulations, len(players)))
+    salaries = {}
+    for match in range(num_matches):
+        p1, p2 = 2 * match, 2 * match + 1
+        opponents[players[p1]], opponents[players[p2]] = players[p2], players[p1]
+        p1_wins = rng.random(num_simulations) < rng.uniform(0.1, 0.9)
+        for column, wins in ((p1, p1_wins), (p2, ~p1_wins)):
+            points[:, column] = (np.where(wins, rng.uniform(35, 60), rng.uniform(10, 30))
+                                 + rng.normal(0, 8, num_simulations))
+            salaries[players[column]] = int(rng.integers(50, 120)) * 100
+    return ScenarioMatrix(players=players, points=points, opponents=opponents), salaries
+
+
+def brute_force(scenarios, salaries, objective, percentile, target, exclude_opponents, salary_cap=50000):
+    """Best objective over every feasible lineup"""
+    names = scenarios.players
+    best = -np.inf
+    for lineup in combinations(range(len(names)), 6):
+        if sum(salaries[names[i]] for i in lineup) > salary_cap:
+            continue
+        members = {names[i] for i in lineup}
+        if exclude_opponents and any(scenarios.opponents[names[i]] in members for i in lineup):
+            continue
+        totals = scenarios.points[:, list(lineup)].sum(axis=1)
+        if objective == 'mean':
+            value = totals.mean()
+        elif objective == 'percentile':
+            value = np.percentile(totals, percentile)
+        else:
+            value = (totals >= target).mean()
+        best = max(best, value)
+    return best
+
+
+def test_optimizer_matches_brute_force(num_slates: int = 40, num_full_slates: int = 4):
+    """Optimizer objective equals the exhaustive optimum (mean on every slate, all objectives on a few)"""
+    print("🎾 OPTIMIZER vs BRUTE FORCE")
+    print("=" * 60)
+    failures = 0
+    for seed in range(num_slates):
+        scenarios, salaries = make_slate(seed)
+        optimizer = LineupOptimizer(scenarios, salaries)
+        target = float(np.percentile(scenarios.points.sum(axis=1) * 6 / scenarios.num_players, 95))
+        objectives = ('mean', 'percentile', 'win_probability') if seed < num_full_slates else ('mean',)
+        for exclude_opponents in (True, False):
+            for objective in objectives:
+                lineups = optimizer.optimize(1, objective, percentile=90, target=target,
+                                             exclude_opponents=exclude_opponents)
+                expected = brute_force(scenarios, salaries, objective, 90, target, exclude_opponents)
+                got = lineups[0].objective if lineups else -np.inf
+                if abs(got - expected) > 1e-9 * max(1.0, abs(expected)):
+                    failures += 1
+                    print(f"  ❌ slate {seed} {objective} (opponents excluded={exclude_opponents}): "
+                          f"optimizer {got:.4f}, brute force {expected:.4f}")
+    print(f"  {'✅' if not failures else '❌'} {num_slates} slates, {failures} mismatches")
+    return failures
+
+
+def test_exposure_limits():
+    """A zero exposure keeps a player out; a 50% exposure caps appearances"""
+    print("\n📊 EXPOSURE LIMITS")
+    print("=" * 60)
+    scenarios, salaries = make_slate(1)
+    optimizer = LineupOptimizer(scenarios, salaries)
+    best = optimizer.optimize(1)[0].players[0]
+
+    lineups = optimizer.optimize(5, max_exposure={best: 0.0})
+    zero_ok = all(best not in lineup.players for lineup in lineups)
+    print(f"  {'✅' if zero_ok else '❌'} 0% exposure: {best} in "
+          f"{sum(best in lineup.players for lineup in lineups)} of {len(lineups)} lineups")
+
+    lineups = optimizer.optimize(4, max_exposure=0.5)
+    counts = {name: sum(name in lineup.players for lineup in lineups) for name in scenarios.players}
+    cap_ok = max(counts.values()) <= 2
+    print(f"  {'✅' if cap_ok else '❌'} 50% exposure: most used player in {max(counts.values())} of {len(lineups)} lineups")
+    return (not zero_ok) + (not cap_ok)
+
+
+if __name__ == "__main__":
+    failures = test_optimizer_matches_brute_force() + test_exposure_limits()
+    print(f"\n{'✅ All checks passed' if not failures else f'❌ {failures} checks failed'}")
+    sys.exit(1 if failures else 0)
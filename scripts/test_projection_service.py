@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Projection service cache checks on a two-match slate.
+Location: tennis/scripts/test_projection_service.py
+
+A repeated request must be a cache hit, and editing a player's stats (in place,
+without calling invalidate_player_cache) must make the next request recompute.
+"""
+
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sim_models.main_sim.analyzer_registry import get_shared_analyzer
+from sim_models.main_sim.slate_simulator import TennisSlateSimulator, Match
+from sim_models.main_sim.projection_service import ProjectionService
+
+
+def test_cache_invalidation_after_edit(num_simulations: int = 200):
+    """Hit on repeat; after an in-place edit the projection is recomputed and moves"""
+    print("🎾 PROJECTION CACHE INVALIDATION")
+    print("=" * 60)
+    with redirect_stdout(io.StringIO()):
+        slate_simulator = TennisSlateSimulator(seed=7)
+    # Private copy so the edit below does not leak into the shared analyzer
+    analyzer = slate_simulator.simulator.analyzer = get_shared_analyzer().copy()
+    service = ProjectionService(slate_simulator, num_simulations=num_simulations)
+
+    matches = [Match("Carlos Alcaraz", "Jannik Sinner", "Hard"),
+               Match("Novak Djokovic", "Alexander Zverev", "Hard")]
+    salaries = {"Carlos Alcaraz": 11000, "Jannik Sinner": 10800,
+                "Novak Djokovic": 9800, "Alexander Zverev": 9400}
+
+    before = service.project(matches, salaries)
+    repeat = service.project(matches, salaries)
+    hit_ok = repeat is before and service.hits == 1
+    print(f"  {'✅' if hit_ok else '❌'} repeated request: {service.hits} hit, {service.misses} miss")
+
+    name = analyzer.resolve_player_name("Carlos Alcaraz", analyzer.calculated_stats)
+    analyzer.calculated_stats[name]['service_points_won'] = 0.35  # In place, no invalidation call
+
+    after = service.project(matches, salaries)
+    old_points = before.players["Carlos Alcaraz"].mean_fantasy_points
+    new_points = after.players["Carlos Alcaraz"].mean_fantasy_points
+    miss_ok = after is not before and service.misses == 2
+    moved_ok = new_points < old_points
+    print(f"  {'✅' if miss_ok else '❌'} request after the edit: {service.hits} hit, {service.misses} misses")
+    print(f"  {'✅' if moved_ok else '❌'} Carlos Alcaraz projection {old_points:.1f} -> {new_points:.1f}")
+    return (not hit_ok) + (not miss_ok) + (not moved_ok)
+
+
+if __name__ == "__main__":
+    failures = test_cache_invalidation_after_edit()
+    print(f"\n{'✅ All checks passed' if not failures else f'❌ {failures} checks failed'}")
+    sys.exit(1 if failures else 0)
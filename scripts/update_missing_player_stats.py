@@ -13,6 +13,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from scripts.fuzzy_match_and_elo_approximation import analyze_missing_players
 from sim_models.main_sim.simulator import FantasyTennisSimulator
+from sim_models.main_sim.analyzer_registry import get_shared_analyzer
 
 
 def update_simulator_with_approximated_stats():
@@ -27,8 +28,8 @@ def update_simulator_with_approximated_stats():
         print("❌ No ELO approximations found to update")
         return
     
-    # Load the simulator
-    simulator = FantasyTennisSimulator()
+    # Load the simulator (players are added to its data, so it gets a private copy of the shared analyzer)
+    simulator = FantasyTennisSimulator(analyzer=get_shared_analyzer().copy())
     
     print(f"\n📝 UPDATING CALCULATED STATS...")
     print("-" * 40)
@@ -64,6 +65,8 @@ def update_simulator_with_approximated_stats():
         print(f"   Return: {stats['return_points_won']:.1f}%")
         print(f"   Based on: {approximation_data.get('elo_range', 'unknown')} ELO range")
     
+    simulator.analyzer.invalidate_player_cache()  # New players: rebuild name lookups and ELO indexes
+    
     print(f"\n🎯 TESTING UPDATED STATS...")
     print("-" * 40)
     
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Time-Weighted Player Stats Update
+Location: tennis/scripts/update_time_weighted_stats.py
+
+Folds newly charted matches into the decayed per-player serve/return sums,
+rewrites data/processed/time_weighted_player_stats.json (overlaid onto the
+measured rates by TennisStatsAnalyzer(time_weighted_stats=True)) and rebuilds
+that analyzer's player database snapshot. Unchanged
+charting files are skipped and changed ones are read only down to the lookback
+window, so a daily update takes seconds; pass --rebuild to start again from the
+full charting history (e.g. after older matches were charted).
+
+Usage: python scripts/update_time_weighted_stats.py [--rebuild] [--half-life DAYS]
+"""
+
+import argparse
+import sys
+import os
+import time
+
+# Add paths for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'sim_models'))
+
+from main_sim.analyzer import TennisStatsAnalyzer
+from main_sim.incremental_stats import DEFAULT_HALF_LIFE_DAYS, DEFAULT_LOOKBACK_DAYS, TimeWeightedStatsBuilder
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally update time-weighted player stats")
+    parser.add_argument('--rebuild', action='store_true', help="Ignore the saved state and fold in every match")
+    parser.add_argument('--half-life', type=float, default=DEFAULT_HALF_LIFE_DAYS, help="Decay half-life in days")
+    parser.add_argument('--lookback', type=int, default=DEFAULT_LOOKBACK_DAYS,
+                        help="Re-read matches up to this many days older than the newest folded match")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.rebuild:
+        builder = TimeWeightedStatsBuilder(args.half_life)
+    else:
+        builder = TimeWeightedStatsBuilder.load(half_life_days=args.half_life)
+    known_rows = len(builder.seen)
+
+    added = builder.update(lookback_days=args.lookback)
+    state_path, stats_path = builder.save()
+
+    print(f"🎾 Folded in {added} new match rows ({known_rows} already in {state_path})")
+    print(f"✅ Wrote time-weighted stats for {len(builder.player_stats())} players to {stats_path}")
+    print(f"⏱️ Update took {time.perf_counter() - started:.2f}s")
+
+    if added or args.rebuild:
+        snapshot_path = TennisStatsAnalyzer(use_snapshot=False, time_weighted_stats=True).save_snapshot()
+        print(f"📦 Rebuilt player database snapshot {snapshot_path}")
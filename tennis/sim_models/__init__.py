@@ -13,11 +13,17 @@ Quick Start:
     result = simulator.simulate_match(market)
 """
 
-# Import betting market simulator
-from .bet_mkt_based.match_simulator import BettingSimulator
-from .bet_mkt_based.odds_converter import BettingMarket, SAMPLE_MARKETS
-from .bet_mkt_based.results_tracker import MatchResult
-from .bet_mkt_based.validator import BettingSimulatorValidator
+import importlib
+
+# Betting market simulator exports, imported on first access so that
+# `import sim_models.main_sim` does not load the betting stack
+_EXPORTS = {
+    'BettingSimulator': '.bet_mkt_based.match_simulator',
+    'BettingMarket': '.bet_mkt_based.odds_converter',
+    'SAMPLE_MARKETS': '.bet_mkt_based.odds_converter',
+    'MatchResult': '.bet_mkt_based.results_tracker',
+    'BettingSimulatorValidator': '.bet_mkt_based.validator',
+}
 
 # Export everything from betting simulator
 __all__ = [
@@ -31,3 +37,16 @@ __all__ = [
 # Version info
 __version__ = "2.0.0"
 __author__ = "Tennis Simulation Engine"
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,36 @@
 """
 Tennis Simulation Package
 Main tennis simulation classes for fantasy tennis analysis
+
+Exports are loaded on first access (PEP 562 module __getattr__), so importing one
+submodule, e.g. main_sim.stats, does not import the simulator, the player data
+stack or numpy. Heavy optional dependencies (pandas, pyarrow, the enhanced
+analytics modules) are imported only by the functions that use them.
 """
 
-from .simulator import FantasyTennisSimulator
-from .stats import FantasyStats, SetResult, GameResult, MatchResult
-from .analyzer import TennisStatsAnalyzer
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'FantasyTennisSimulator': '.simulator',
+    'FantasyStats': '.stats',
+    'SetResult': '.stats',
+    'GameResult': '.stats',
+    'MatchResult': '.stats',
+    'TennisStatsAnalyzer': '.analyzer',
+}
 
 __all__ = ['FantasyTennisSimulator', 'FantasyStats', 'SetResult', 'GameResult', 'MatchResult', 'TennisStatsAnalyzer']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,17 +3,253 @@ Tennis Statistics Analyzer
 Loads and processes player statistics from various data sources
 """
 
+import copy
+import hashlib
 import json
 import csv
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from .player_snapshot import (SNAPSHOT_ATTRIBUTES, TIME_WEIGHTED_SNAPSHOT_PATH, load_snapshot, save_snapshot,
+                              source_fingerprint)
+from .player_table import PlayerTable
+from .elo_index import EloIndex
+from .incremental_stats import DEFAULT_OUTPUT_PATH as TIME_WEIGHTED_STATS_PATH
+from .name_resolution import AliasTable, NameResolver
+
+
+CHARTING_PLAYER_COLUMNS = ('Player 1', 'Player 2')
+
+
+def stable_player_hash(player_name: str) -> int:
+    """
+    Per-player integer for deterministic synthetic stats. Unlike hash(), which Python
+    salts per process (PYTHONHASHSEED), this is identical in every run and worker.
+    """
+    digest = hashlib.blake2b(player_name.encode('utf-8'), digest_size=8, person=b'tennis-player').digest()
+    return int.from_bytes(digest, 'big')
+
+
+def count_charting_matches(path) -> Dict[str, int]:
+    """
+    Matches per player in a Match Charting Project matches file, in order of first
+    appearance. Reads only the two player columns as categoricals and counts them
+    with one vectorized pass (falls back to csv.DictReader without pandas).
+    """
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        counts: Dict[str, int] = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                for column in CHARTING_PLAYER_COLUMNS:
+                    player = (row.get(column) or '').strip()
+                    if player:
+                        counts[player] = counts.get(player, 0) + 1
+        return counts
+
+    frame = pd.read_csv(path, usecols=list(CHARTING_PLAYER_COLUMNS), dtype='category',
+                        keep_default_na=False, encoding='utf-8')
+    # Interleave Player 1 / Player 2 per row so first appearance matches a row-by-row scan
+    players = np.column_stack([frame[column].str.strip().to_numpy() for column in CHARTING_PLAYER_COLUMNS]).ravel()
+    codes, names = pd.factorize(players)
+    counts = np.bincount(codes, minlength=len(names))
+    return {name: int(count) for name, count in zip(names, counts) if name}
+
+
+def _elo_inputs(baseline_stats: Dict[str, Any], surface: str) -> tuple:
+    """The baseline stats values the surface-weighted ELO depends on"""
+    return baseline_stats.get('matches', 0), baseline_stats.get('surface_preferences', {}).get(surface)
+
+
+# Measured rates replaced by their time-weighted values when the overlay is enabled
+TIME_WEIGHTED_FIELDS = ('ace_rate', 'double_fault_rate', 'first_serve_percentage',
+                        'service_points_won', 'return_points_won')
+
+# Surface-specific adjustments based on tennis knowledge
+SURFACE_STAT_ADJUSTMENTS = {
+    'Clay': {
+        'ace_rate_multiplier': 0.85,      # Fewer aces on clay
+        'double_fault_multiplier': 1.1,   # Slightly more DFs on clay
+        'service_points_multiplier': 0.98, # Slightly lower service dominance
+        'return_points_multiplier': 1.02,  # Slightly better return opportunities
+    },
+    'Hard': {
+        'ace_rate_multiplier': 1.0,       # Baseline
+        'double_fault_multiplier': 1.0,   # Baseline
+        'service_points_multiplier': 1.0, # Baseline
+        'return_points_multiplier': 1.0,  # Baseline
+    },
+    'Grass': {
+        'ace_rate_multiplier': 1.15,      # More aces on grass
+        'double_fault_multiplier': 0.9,   # Fewer DFs on grass
+        'service_points_multiplier': 1.05, # Higher service dominance
+        'return_points_multiplier': 0.95,  # Harder to return
+    }
+}
+
 
 class TennisStatsAnalyzer:
     """Analyzes tennis statistics and provides player data."""
 
-    def __init__(self, data_source: str = None):
+    def __init__(self, data_source: str = None, use_snapshot: bool = True, snapshot_path: str = None,
+                 time_weighted_stats: bool = False):
+        """
+        Args:
+            data_source: Optional extra data file
+            use_snapshot: Load from the binary player database snapshot when it is
+                current, and rebuild it after parsing the source files otherwise
+            snapshot_path: Snapshot location (default data/cache/player_database.pkl, or
+                data/cache/player_database_time_weighted.pkl with time_weighted_stats)
+            time_weighted_stats: Overlay the decayed serve/return rates written by
+                scripts/update_time_weighted_stats.py onto the measured rates
+        """
         self.data_source = data_source
+        self.use_snapshot = use_snapshot
+        self.time_weighted_stats = time_weighted_stats
+        self.snapshot_path = snapshot_path or (TIME_WEIGHTED_SNAPSHOT_PATH if time_weighted_stats else None)
+        self.data_version = 0  # Incremented by reload(); caches of derived data key on it
+        self.cache_version = 0  # Incremented by invalidate_player_cache(), also via check_player_edits()
+        self._player_table = None
+        self._player_table_version = None
+        self._aliases = None
+        self._name_resolver = None
+        self._name_resolver_version = None
+        self._load_all()
+
+    def _load_all(self):
+        self.invalidate_player_cache()
+        # Size and mtime of every source file as loaded; identifies the data across processes
+        self.source_fingerprint = source_fingerprint(self.data_source)
+        if self.use_snapshot and self._load_snapshot():
+            return
+
+        self._load_sources()
+
+        if self.use_snapshot:
+            try:
+                self.save_snapshot()
+            except OSError as e:
+                print(f"Warning: Could not write player database snapshot: {e}")
+
+    def _load_snapshot(self) -> bool:
+        """Restore all loaded data from a current snapshot; False when there is none"""
+        state = load_snapshot(self.data_source, self.snapshot_path, self.time_weighted_stats)
+        if state is None:
+            return False
+        for name in SNAPSHOT_ATTRIBUTES:
+            setattr(self, name, state[name])
+        print(f"✅ Loaded player database snapshot: {len(self.calculated_stats)} players, "
+              f"{len(self.elo_ratings)} ELO ratings")
+        if self.time_weighted_stats:
+            updated = sum('time_weighted_as_of' in stats for stats in self.calculated_stats.values())
+            print(f"✅ Time-weighted serve/return rates applied to {updated} players")
+        return True
+
+    def save_snapshot(self, path: str = None):
+        """Write the loaded data to the binary snapshot used for fast startup"""
+        return save_snapshot({name: getattr(self, name) for name in SNAPSHOT_ATTRIBUTES},
+                             self.data_source, path or self.snapshot_path, self.time_weighted_stats)
+
+    def copy(self) -> 'TennisStatsAnalyzer':
+        """Independent copy whose player data can be edited without affecting shared analyzers"""
+        clone = copy.copy(self)
+        for name in SNAPSHOT_ATTRIBUTES:
+            setattr(clone, name, copy.deepcopy(getattr(self, name)))
+        clone.invalidate_player_cache()
+        return clone
+
+    @property
+    def player_table(self) -> PlayerTable:
+        """Columnar view of all player data (rebuilt after reload(); call
+        invalidate_player_table() after editing player dicts directly)"""
+        if self._player_table is None or self._player_table_version != self.data_version:
+            self._player_table = PlayerTable.build(self)
+            self._player_table_version = self.data_version
+        return self._player_table
+
+    def invalidate_player_table(self):
+        self._player_table = None
+
+    def invalidate_player_cache(self, player_name: str = None):
+        """
+        Drop memoized surface-weighted stats and ELO (for one player or all), the ELO
+        indexes and the player table, and bump cache_version. Needed after adding
+        players or editing ELO ratings; replacing a player's stats dict and calling
+        reload() are detected automatically, and check_player_edits() finds stats
+        dicts edited in place.
+        """
+        if player_name is None or not hasattr(self, '_surface_stats_cache'):
+            self._surface_stats_cache = {}  # (player, surface) -> (baseline dict, snapshot, weighted stats)
+            self._elo_cache = {}            # (player, surface) -> (stats spelling, baseline dict, ELO inputs, weighted ELO)
+            self._name_resolver = None      # Known names may have changed
+        else:
+            for key in [key for key in self._surface_stats_cache if key[0] == player_name]:
+                del self._surface_stats_cache[key]
+            for key in [key for key, entry in self._elo_cache.items()
+                        if player_name in (key[0], entry[0])]:
+                del self._elo_cache[key]
+        self._elo_indexes = {}  # (surface, tour) -> EloIndex; any player's ELO may have moved
+        self.invalidate_player_table()
+        self.cache_version += 1
+
+    def check_player_edits(self) -> int:
+        """
+        Invalidate players whose memoized stats dict was edited in place since it was
+        cached; returns the number of players invalidated (cache_version is bumped).
+        Lookups only check that the stats dict was not replaced, so the simulator and
+        projection service run this scan before reusing cached results.
+        """
+        edited = {key[0] for key, (baseline, snapshot, _) in self._surface_stats_cache.items()
+                  if snapshot != baseline}
+        edited.update(entry[0] for key, entry in self._elo_cache.items()
+                      if entry[2] != _elo_inputs(entry[1] or {}, key[1]))
+        for player_name in edited:
+            self.invalidate_player_cache(player_name)
+        return len(edited)
+
+    def elo_index(self, surface: str, tour: str = None) -> EloIndex:
+        """Players with stats sorted by surface-weighted ELO, optionally one tour ('ATP'/'WTA')"""
+        key = (surface, tour)
+        index = self._elo_indexes.get(key)
+        if index is None:
+            index = EloIndex.build(self, surface, tour)
+            self._elo_indexes[key] = index
+        return index
+
+    @property
+    def name_resolver(self) -> NameResolver:
+        """Normalization, alias and fuzzy lookup over all known player names (rebuilt after reload())"""
+        if self._name_resolver is None or self._name_resolver_version != self.data_version:
+            if self._aliases is None:
+                self._aliases = AliasTable()
+            names = dict.fromkeys(self.calculated_stats)
+            names.update(dict.fromkeys(self.elo_ratings))
+            self._name_resolver = NameResolver(names, self._aliases)
+            self._name_resolver_version = self.data_version
+        return self._name_resolver
+
+    def resolve_player_name(self, player_name: str, within=None) -> str:
+        """
+        Spelling of a player's name used in `within` (e.g. self.elo_ratings), resolving
+        accents, case, punctuation and the alias table; the name itself when unresolved
+        """
+        if within is not None and player_name in within:
+            return player_name
+        return self.name_resolver.resolve(player_name, within) or player_name
+
+    def find_player(self, player_name: str, threshold: float = 0.7) -> Optional[str]:
+        """Exact, alias or fuzzy match of a name among all known players"""
+        return self.name_resolver.match(player_name, threshold)
+
+    def add_player_alias(self, alias: str, canonical: str, save: bool = True):
+        """Record an alternative name (persisted to data/player_aliases.json)"""
+        self.name_resolver.add_alias(alias, canonical, save)
+        self.invalidate_player_cache()
+
+    def _load_sources(self):
+        self.stats_source = None  # Stats file of the fallback chain that was loaded
         self.player_stats = {}
         self.player_rankings = {}
         self.player_countries = {}
@@ -24,6 +260,11 @@ class TennisStatsAnalyzer:
         self._load_elo_ratings()  # Load ELO ratings first
         self._load_player_data()
 
+    def reload(self):
+        """Re-read all data sources and bump data_version so dependent caches invalidate."""
+        self._load_all()
+        self.data_version += 1
+
     def _load_elo_ratings(self):
         """Load surface-specific ELO ratings from ATP and WTA CSV files."""
         data_dir = Path("data/elo")
@@ -222,13 +463,38 @@ class TennisStatsAnalyzer:
         # Try to load pre-calculated stats first
         if self._load_calculated_stats():
             print(f"✅ Loaded {len(self.calculated_stats)} players from saved statistics")
+        else:
+            # Fallback to calculating from raw data
+            print("⚠️  No saved statistics found, calculating from raw data...")
+            self._load_from_csv_data()
+            self._load_from_js_file()
+            self._create_default_players()
+
+        if self.time_weighted_stats:
+            self._load_time_weighted_stats()
+
+    def _load_time_weighted_stats(self):
+        """Overlay decayed serve/return rates from scripts/update_time_weighted_stats.py."""
+        if not TIME_WEIGHTED_STATS_PATH.exists():
+            print(f"Warning: Time-weighted stats requested but {TIME_WEIGHTED_STATS_PATH} does not exist; "
+                  f"run scripts/update_time_weighted_stats.py")
+            return
+        try:
+            with open(TIME_WEIGHTED_STATS_PATH, 'r', encoding='utf-8') as f:
+                time_weighted = json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not load time-weighted stats: {e}")
             return
 
-        # Fallback to calculating from raw data
-        print("⚠️  No saved statistics found, calculating from raw data...")
-        self._load_from_csv_data()
-        self._load_from_js_file()
-        self._create_default_players()
+        updated = 0
+        for player_name, weighted in time_weighted.items():
+            stats = self.calculated_stats.get(player_name)
+            if stats is None:
+                continue  # Rates alone are not a full player entry
+            stats.update({field: weighted[field] for field in TIME_WEIGHTED_FIELDS if field in weighted})
+            stats['time_weighted_as_of'] = weighted.get('last_match')
+            updated += 1
+        print(f"✅ Applied time-weighted serve/return rates to {updated} players")
 
     def _load_calculated_stats(self):
         """Load pre-calculated player statistics from JSON file."""
@@ -238,6 +504,7 @@ class TennisStatsAnalyzer:
             try:
                 with open(momentum_stats_file, 'r') as f:
                     self.calculated_stats = json.load(f)
+                self.stats_source = str(momentum_stats_file)
                 print(f"✅ Loaded {len(self.calculated_stats)} players with momentum and endurance")
 
                 # Also populate basic stats for compatibility
@@ -259,6 +526,7 @@ class TennisStatsAnalyzer:
             try:
                 with open(clutch_stats_file, 'r') as f:
                     self.calculated_stats = json.load(f)
+                self.stats_source = str(clutch_stats_file)
                 print(f"✅ Loaded {len(self.calculated_stats)} players with clutch factors")
 
                 # Also populate basic stats for compatibility
@@ -280,6 +548,7 @@ class TennisStatsAnalyzer:
             try:
                 with open(real_stats_file, 'r') as f:
                     self.calculated_stats = json.load(f)
+                self.stats_source = str(real_stats_file)
                 print(f"✅ Loaded {len(self.calculated_stats)} players with real serving data")
 
                 # Also populate basic stats for compatibility
@@ -306,6 +575,7 @@ class TennisStatsAnalyzer:
         try:
             with open(stats_file, 'r') as f:
                 self.calculated_stats = json.load(f)
+            self.stats_source = str(stats_file)
 
             # Also populate basic stats for compatibility
             for player_name, stats in self.calculated_stats.items():
@@ -392,66 +662,35 @@ class TennisStatsAnalyzer:
         """Load real player data from our tennis match files."""
         data_dir = Path("data")
 
-        # Load men's matches
-        men_matches_file = data_dir / "charting-m-matches(1).csv"
-        if men_matches_file.exists():
-            try:
-                with open(men_matches_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        player1 = row.get('Player 1', '').strip()
-                        player2 = row.get('Player 2', '').strip()
-
-                        if player1:
-                            if player1 not in self.player_stats:
-                                self.player_stats[player1] = {'matches': 0, 'gender': 'M'}
-                            self.player_stats[player1]['matches'] += 1
-
-                        if player2:
-                            if player2 not in self.player_stats:
-                                self.player_stats[player2] = {'matches': 0, 'gender': 'M'}
-                            self.player_stats[player2]['matches'] += 1
-
-                print(f"✅ Loaded {len([p for p in self.player_stats if self.player_stats[p]['gender'] == 'M'])} men's players")
-            except Exception as e:
-                print(f"Warning: Could not load men's match data: {e}")
-
-        # Load women's matches
-        women_matches_file = data_dir / "charting-w-matches.csv"
-        if women_matches_file.exists():
+        for filename, gender, label in (("charting-m-matches(1).csv", 'M', "men's"),
+                                        ("charting-w-matches.csv", 'W', "women's")):
+            matches_file = data_dir / filename
+            if not matches_file.exists():
+                continue
             try:
-                with open(women_matches_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        player1 = row.get('Player 1', '').strip()
-                        player2 = row.get('Player 2', '').strip()
+                for player, matches in count_charting_matches(matches_file).items():
+                    if player not in self.player_stats:
+                        self.player_stats[player] = {'matches': 0, 'gender': gender}
+                    self.player_stats[player]['matches'] += matches
 
-                        if player1:
-                            if player1 not in self.player_stats:
-                                self.player_stats[player1] = {'matches': 0, 'gender': 'W'}
-                            self.player_stats[player1]['matches'] += 1
-
-                        if player2:
-                            if player2 not in self.player_stats:
-                                self.player_stats[player2] = {'matches': 0, 'gender': 'W'}
-                            self.player_stats[player2]['matches'] += 1
-
-                print(f"✅ Loaded {len([p for p in self.player_stats if self.player_stats[p]['gender'] == 'W'])} women's players")
+                gender_count = sum(1 for stats in self.player_stats.values() if stats['gender'] == gender)
+                print(f"✅ Loaded {gender_count} {label} players")
             except Exception as e:
-                print(f"Warning: Could not load women's match data: {e}")
+                print(f"Warning: Could not load {label} match data: {e}")
 
         # Set rankings and countries for real players (simplified)
         for player_name, stats in self.player_stats.items():
             # Assign ranking based on match count (more matches = better ranking approximation)
             matches = stats.get('matches', 0)
+            player_hash = stable_player_hash(player_name)
             if matches >= 100:
-                rank = 1 + (hash(player_name) % 20)  # Top 20
+                rank = 1 + (player_hash % 20)  # Top 20
             elif matches >= 50:
-                rank = 21 + (hash(player_name) % 30)  # 21-50
+                rank = 21 + (player_hash % 30)  # 21-50
             elif matches >= 20:
-                rank = 51 + (hash(player_name) % 50)  # 51-100
+                rank = 51 + (player_hash % 50)  # 51-100
             else:
-                rank = 101 + (hash(player_name) % 200)  # 101-300
+                rank = 101 + (player_hash % 200)  # 101-300
 
             self.player_rankings[player_name] = rank
             self.player_countries[player_name] = 'N/A'  # We don't have country data in match files
@@ -474,7 +713,7 @@ class TennisStatsAnalyzer:
                 skill_tier = self._get_skill_tier_from_matches(matches)
 
             # Generate stats based on skill tier and add some variance
-            variance = (hash(player_name) % 100 - 50) / 100  # -0.5 to 0.5
+            variance = (stable_player_hash(player_name) % 100 - 50) / 100  # -0.5 to 0.5
 
             if gender == 'M':
                 # Men's tennis statistics (based on skill tier)
@@ -560,40 +799,25 @@ class TennisStatsAnalyzer:
             }
 
     def get_player_stats(self, player_name: str, surface: str = None) -> Dict[str, Any]:
-        """Get comprehensive statistics for a player, optionally surface-weighted."""
-        baseline_stats = self.calculated_stats.get(player_name, {})
+        """Get comprehensive statistics for a player, optionally surface-weighted (aliases resolved)."""
+        baseline_stats = self.calculated_stats.get(player_name)
+        if baseline_stats is None:
+            baseline_stats = self.calculated_stats.get(self.resolve_player_name(player_name, self.calculated_stats), {})
 
-        # If surface is specified, apply surface weighting
+        # If surface is specified, apply surface weighting (memoized; callers get their own copy)
         if surface and baseline_stats:
-            return self._apply_surface_weighting(baseline_stats, surface)
+            cached = self._surface_stats_cache.get((player_name, surface))
+            if cached is None or cached[0] is not baseline_stats:  # New or replaced stats dict
+                cached = (baseline_stats, copy.deepcopy(baseline_stats),
+                          self._apply_surface_weighting(baseline_stats, surface))
+                self._surface_stats_cache[(player_name, surface)] = cached
+            return dict(cached[2])
         else:
             return baseline_stats
 
     def _apply_surface_weighting(self, baseline_stats: Dict[str, Any], surface: str) -> Dict[str, Any]:
         """Apply surface-specific weighting to baseline stats."""
-        # Surface-specific adjustments based on tennis knowledge
-        surface_adjustments = {
-            'Clay': {
-                'ace_rate_multiplier': 0.85,      # Fewer aces on clay
-                'double_fault_multiplier': 1.1,   # Slightly more DFs on clay
-                'service_points_multiplier': 0.98, # Slightly lower service dominance
-                'return_points_multiplier': 1.02,  # Slightly better return opportunities
-            },
-            'Hard': {
-                'ace_rate_multiplier': 1.0,       # Baseline
-                'double_fault_multiplier': 1.0,   # Baseline
-                'service_points_multiplier': 1.0, # Baseline
-                'return_points_multiplier': 1.0,  # Baseline
-            },
-            'Grass': {
-                'ace_rate_multiplier': 1.15,      # More aces on grass
-                'double_fault_multiplier': 0.9,   # Fewer DFs on grass
-                'service_points_multiplier': 1.05, # Higher service dominance
-                'return_points_multiplier': 0.95,  # Harder to return
-            }
-        }
-
-        adjustments = surface_adjustments.get(surface, surface_adjustments['Hard'])
+        adjustments = SURFACE_STAT_ADJUSTMENTS.get(surface, SURFACE_STAT_ADJUSTMENTS['Hard'])
 
         # Determine surface weighting based on player's surface experience
         surface_prefs = baseline_stats.get('surface_preferences', {})
@@ -645,10 +869,27 @@ class TennisStatsAnalyzer:
         return weighted_stats
 
     def get_player_elo(self, player_name: str, surface: str = None) -> Optional[float]:
-        """Get ELO rating for a player, optionally surface-weighted."""
+        """Get ELO rating for a player, optionally surface-weighted (memoized per surface, aliases resolved)."""
+        if not surface:
+            return self.elo_ratings.get(self.resolve_player_name(player_name, self.elo_ratings), None)
+
+        # Entries: (stats spelling, baseline stats dict, the values of it the ELO depends on, weighted ELO)
+        cached = self._elo_cache.get((player_name, surface))
+        if cached is not None and cached[1] is self.calculated_stats.get(cached[0]):
+            return cached[3]
+        stats_name = self.resolve_player_name(player_name, self.calculated_stats)
+        baseline_stats = self.calculated_stats.get(stats_name)
+        weighted_elo = self._weighted_elo(self.resolve_player_name(player_name, self.elo_ratings), surface,
+                                          baseline_stats or {})
+        self._elo_cache[(player_name, surface)] = (stats_name, baseline_stats,
+                                                   _elo_inputs(baseline_stats or {}, surface),
+                                                   weighted_elo)
+        return weighted_elo
+
+    def _weighted_elo(self, player_name: str, surface: str, baseline_stats: Dict[str, Any]) -> Optional[float]:
         overall_elo = self.elo_ratings.get(player_name, None)
 
-        if not surface or not overall_elo:
+        if not overall_elo:
             return overall_elo
 
         # Get surface-specific ELO if available
@@ -660,7 +901,6 @@ class TennisStatsAnalyzer:
             return overall_elo
 
         # Apply the same surface weighting as used for stats
-        baseline_stats = self.calculated_stats.get(player_name, {})
         if not baseline_stats:
             return surface_elo  # Use surface ELO if no baseline stats
 
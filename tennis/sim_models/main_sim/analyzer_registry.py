@@ -0,0 +1,58 @@
+"""
+Shared Analyzer Registry
+One TennisStatsAnalyzer per data source per process
+
+FantasyTennisSimulator, EnhancedDataEngine and the data scripts all need the same
+player database. The registry loads it once per (working directory, data source)
+and hands the same instance to every caller. Shared analyzers are read-only by
+convention: code that edits player data (e.g. the ELO-based data filler) takes a
+private copy with TennisStatsAnalyzer.copy().
+
+Location: tennis/sim_models/main_sim/analyzer_registry.py
+"""
+
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .analyzer import TennisStatsAnalyzer
+
+
+_analyzers: Dict[Tuple[str, Optional[str]], TennisStatsAnalyzer] = {}
+_lock = threading.Lock()
+
+
+def _key(data_source: Optional[str]) -> Tuple[str, Optional[str]]:
+    # Data paths are relative to the working directory, so it is part of the key
+    return os.getcwd(), data_source
+
+
+def get_shared_analyzer(data_source: Optional[str] = None) -> TennisStatsAnalyzer:
+    """The process-wide analyzer for `data_source`, loaded on first use"""
+    key = _key(data_source)
+    with _lock:
+        analyzer = _analyzers.get(key)
+        if analyzer is None:
+            analyzer = TennisStatsAnalyzer(data_source)
+            _analyzers[key] = analyzer
+        return analyzer
+
+
+def reload_shared_analyzer(data_source: Optional[str] = None) -> TennisStatsAnalyzer:
+    """Re-read the data of a shared analyzer in place; every holder sees the new data_version"""
+    analyzer = get_shared_analyzer(data_source)
+    with _lock:
+        analyzer.reload()
+    return analyzer
+
+
+def clear_shared_analyzers():
+    """Forget all shared analyzers (the next request loads fresh instances)"""
+    with _lock:
+        _analyzers.clear()
+
+
+def shared_analyzer_sources() -> List[Tuple[str, Optional[str]]]:
+    """(working directory, data source) of every loaded shared analyzer"""
+    with _lock:
+        return list(_analyzers)
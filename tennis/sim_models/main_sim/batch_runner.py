@@ -0,0 +1,169 @@
+"""
+Multi-Slate Batch Runner
+Simulates every slate file in a directory, sharing work between slates
+
+Slate files are parsed concurrently, matches are deduplicated across slates (the
+same match appears in classic and showdown contests), each unique match is
+simulated once as an outcome block, and the blocks are fanned out to every slate
+that contains the match. Each slate gets its own result file and projections.
+
+Location: tennis/sim_models/main_sim/batch_runner.py
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .slate_simulator import TennisSlateSimulator, Match, MatchResult, assemble_slate_simulations
+from .slate_loader import load_slate_file, extract_matches, get_salary_map
+from .match_cache import block_seed
+from .deadline import init_worker, worker_batch
+
+
+@dataclass
+class SlateJob:
+    """One slate file of the batch"""
+    name: str
+    path: Path
+    matches: List[Match]
+    salaries: Dict[str, int]
+    outputs: Dict[str, str] = field(default_factory=dict)
+
+
+class SlateBatchRunner:
+    """
+    Runs a directory of slate files with one simulation per unique match
+
+    Usage:
+        runner = SlateBatchRunner(TennisSlateSimulator(seed=42))
+        jobs = runner.run('data/slates', num_simulations=1000, output_dir='outputs/slates')
+    """
+
+    def __init__(self, slate_simulator: Optional[TennisSlateSimulator] = None,
+                 parse_workers: int = 8, simulation_workers: int = 1):
+        """
+        Args:
+            slate_simulator: Simulator (and match block cache) to use
+            parse_workers: Threads parsing slate files
+            simulation_workers: Processes simulating unique matches (1 runs in-process);
+                blocks are seeded per match, so the results do not depend on this
+        """
+        self.slate_simulator = slate_simulator or TennisSlateSimulator()
+        self.parse_workers = parse_workers
+        self.simulation_workers = simulation_workers
+
+    def load_slates(self, directory: str, pattern: str = '*.json',
+                    default_surface: str = 'Clay') -> List[SlateJob]:
+        """Parse every slate file in a directory concurrently (files without players are skipped)"""
+        paths = sorted(Path(directory).glob(pattern))
+
+        def parse(path: Path) -> Optional[SlateJob]:
+            try:
+                data = load_slate_file(str(path))
+                return SlateJob(name=path.stem, path=path,
+                                matches=extract_matches(data, default_surface),
+                                salaries=get_salary_map(data))
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                print(f"Warning: Skipping {path.name}: not a slate file ({e})")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.parse_workers) as executor:
+            jobs = [job for job in executor.map(parse, paths) if job is not None]
+        return jobs
+
+    def unique_matches(self, jobs: List[SlateJob]) -> Dict[str, Match]:
+        """Matches across all slates, keyed by their outcome block key"""
+        unique = {}
+        for job in jobs:
+            for match in job.matches:
+                unique.setdefault(self.slate_simulator.get_match_block_key(match), match)
+        return unique
+
+    def simulate_unique_matches(self, unique: Dict[str, Match], num_simulations: int) -> Dict[str, List[MatchResult]]:
+        """One outcome block per unique match, identical to TennisSlateSimulator.simulate_match_block"""
+        self.slate_simulator.simulator.ensure_matchups(
+            [name for match in unique.values() for name in (match.player1, match.player2)])
+        cache = self.slate_simulator.match_cache
+        blocks = {}
+        missing = {}
+        for key, match in unique.items():
+            block = cache.get(key, num_simulations)
+            if block is None:
+                missing[key] = match
+            else:
+                blocks[key] = block
+
+        if self.simulation_workers > 1 and len(missing) > 1:
+            with ProcessPoolExecutor(max_workers=self.simulation_workers, initializer=init_worker,
+                                     initargs=(self.slate_simulator.data_source,)) as executor:
+                futures = {key: executor.submit(worker_batch, match, num_simulations, block_seed(key))
+                           for key, match in missing.items()}
+                for key, future in futures.items():
+                    blocks[key], _ = future.result()
+                    cache.put(key, blocks[key])
+        else:
+            for key, match in missing.items():
+                blocks[key] = self.slate_simulator.simulate_match_block(match, num_simulations)
+
+        return blocks
+
+    def run(self, directory: str, num_simulations: int = 1000, output_dir: str = 'outputs/slates',
+            pattern: str = '*.json', format: str = 'auto', verbose: bool = True) -> List[SlateJob]:
+        """
+        Simulate every slate in `directory` and write per-slate outputs
+
+        Each slate gets `<name>_results.<parquet|slr>` (one row per simulation and match,
+        via the streaming result writer) and `<name>_projections.json` (per-player mean
+        fantasy points, win rate and salary).
+        """
+        jobs = self.load_slates(directory, pattern)
+        unique = self.unique_matches(jobs)
+        total_matches = sum(len(job.matches) for job in jobs)
+
+        if verbose:
+            print(f"\n📦 {len(jobs)} slates, {total_matches} matches, {len(unique)} unique")
+
+        blocks = self.simulate_unique_matches(unique, num_simulations)
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        for job in jobs:
+            slate_blocks = [blocks[self.slate_simulator.get_match_block_key(m)] for m in job.matches]
+            simulations = assemble_slate_simulations(slate_blocks, num_simulations)
+
+            with self.slate_simulator.open_result_writer(
+                    str(output_path / f"{job.name}_results"), job.matches, num_simulations,
+                    format=format) as writer:
+                for sim in simulations:
+                    writer.write_rows(sim.to_rows())
+            job.outputs['results'] = str(writer.filepath)
+
+            projections_file = output_path / f"{job.name}_projections.json"
+            with open(projections_file, 'w') as f:
+                json.dump(self._projections(job, slate_blocks), f, indent=2)
+            job.outputs['projections'] = str(projections_file)
+
+            if verbose:
+                print(f"   ✅ {job.name}: {len(job.matches)} matches -> {output_path}")
+
+        return jobs
+
+    @staticmethod
+    def _projections(job: SlateJob, blocks: List[List[MatchResult]]) -> Dict[str, Any]:
+        players = []
+        for match, block in zip(job.matches, blocks):
+            n = len(block)
+            for side, name, opponent in ((0, match.player1, match.player2), (1, match.player2, match.player1)):
+                points = [r.player1_fantasy_points if side == 0 else r.player2_fantasy_points for r in block]
+                players.append({
+                    'name': name,
+                    'opponent': opponent,
+                    'salary': job.salaries.get(name),
+                    'avg_fantasy_points': sum(points) / n,
+                    'win_rate': sum(r.winner == side for r in block) / n
+                })
+        return {'slate': job.name, 'source': str(job.path), 'simulations': len(blocks[0]) if blocks else 0,
+                'players': players}
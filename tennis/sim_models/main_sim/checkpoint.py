@@ -0,0 +1,72 @@
+"""
+Slate Simulation Checkpoints
+Periodic snapshots of aggregate state and RNG state for long slate runs
+
+Checkpoints are pickled to a temporary file in the same directory and moved into
+place with os.replace, so a run killed mid-write always leaves the previous
+checkpoint intact. Resuming restores the RNG state and the simulation history,
+which makes the resumed run produce exactly the same aggregates, player statistics
+and exports as an uninterrupted run with the same seed.
+
+Location: tennis/sim_models/main_sim/checkpoint.py
+"""
+
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+CHECKPOINT_VERSION = 2
+
+
+@dataclass
+class SlateCheckpoint:
+    """Everything needed to continue a simulate_multiple_slates run"""
+    matches: List[Dict[str, Any]]
+    num_simulations: int
+    completed: int
+    rng_state: Any
+    seed: Optional[int] = None
+    covariance_state: Optional[Dict[str, Any]] = None
+    total_fantasy_points: float = 0.0
+    results_history: List[Any] = field(default_factory=list)  # SlateSimulations so far
+    version: int = CHECKPOINT_VERSION
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def validate(self, matches: List[Dict[str, Any]]):
+        """Raise if the checkpoint belongs to a different slate or format version"""
+        if self.version != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {self.version}")
+        if self.matches != matches:
+            raise ValueError("Checkpoint was written for a different slate")
+
+
+def save_checkpoint(filepath: str, checkpoint: SlateCheckpoint):
+    """Atomically write a checkpoint (temp file + fsync + rename)"""
+    path = Path(filepath)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(filepath: str) -> SlateCheckpoint:
+    """Load a checkpoint written by save_checkpoint"""
+    with open(filepath, 'rb') as f:
+        checkpoint = pickle.load(f)
+    if not isinstance(checkpoint, SlateCheckpoint):
+        raise ValueError(f"Not a slate checkpoint: {filepath}")
+    return checkpoint
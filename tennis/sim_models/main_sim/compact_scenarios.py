@@ -0,0 +1,162 @@
+"""
+Compact Scenario Storage
+Lossless packed form of a ScenarioMatrix for keeping large slates in memory or on disk
+
+Stats are whole numbers (sets, games, aces, double faults, breaks), so each stat is
+stored in the smallest unsigned integer type that holds its range. DraftKings points
+take only a few hundred distinct values per slate (they are sums of fixed scoring
+increments), so points are stored as small integer codes into a float64 value table.
+Unpacking returns bit-identical float64 arrays, so anything computed from the packed
+matrix (projections, lineup scores) matches the full-precision path exactly.
+
+A (100k sims x 64 players) matrix with 6 stats takes about 358 MB as float64 and
+about 51 MB packed (2-byte point codes, 1-byte stats), before the optional codec.
+
+File layout (save/load):
+    bytes 0-3     magic b'SCNZ'
+    bytes 4-7     format version (uint32)
+    bytes 8-11    JSON header length (uint32)
+    bytes 12-     JSON header: players, opponents, stats, codec, arrays (dtype, shape, bytes)
+    ...           array payloads in header order, each passed through the codec
+
+Location: tennis/sim_models/main_sim/compact_scenarios.py
+"""
+
+import bz2
+import json
+import lzma
+import struct
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .scenarios import ScenarioMatrix, SCENARIO_STATS
+
+
+COMPACT_MAGIC = b'SCNZ'
+COMPACT_VERSION = 1
+HEADER_PREFIX = struct.Struct('<4sII')
+
+# Lossless byte codecs (standard library only): name -> (compress, decompress)
+CODECS = {
+    'zlib': (lambda data: zlib.compress(data, 6), zlib.decompress),
+    'bz2': (lambda data: bz2.compress(data, 9), bz2.decompress),
+    'lzma': (lzma.compress, lzma.decompress),
+}
+
+_UNSIGNED_TYPES = (np.uint8, np.uint16, np.uint32, np.uint64)
+
+
+@dataclass
+class CompactScenarioMatrix:
+    """Packed ScenarioMatrix: point codes into a value table and small-integer stats"""
+    players: List[str]
+    point_values: np.ndarray             # sorted distinct float64 points
+    point_codes: np.ndarray              # (n_simulations, n_players) indices into point_values
+    opponents: Dict[str, str] = field(default_factory=dict)
+    stats: Optional[np.ndarray] = None   # (n_simulations, n_players, n_stats) small integers
+    stat_names: List[str] = field(default_factory=lambda: list(SCENARIO_STATS))
+
+    @classmethod
+    def from_matrix(cls, scenarios: ScenarioMatrix) -> 'CompactScenarioMatrix':
+        """Pack a scenario matrix (raises ValueError if the stats are not whole numbers)"""
+        values, codes = np.unique(np.asarray(scenarios.points, dtype=np.float64), return_inverse=True)
+        codes = codes.reshape(scenarios.points.shape).astype(_smallest_unsigned(len(values) - 1))
+
+        stats = None
+        if scenarios.stats is not None:
+            raw = np.asarray(scenarios.stats)
+            stats = raw.astype(_smallest_unsigned(raw.max() if raw.size else 0))
+            if raw.size and (raw.min() < 0 or not np.array_equal(stats, raw)):
+                raise ValueError("Scenario stats must be non-negative whole numbers to pack")
+
+        return cls(players=list(scenarios.players), point_values=values, point_codes=codes,
+                   opponents=dict(scenarios.opponents), stats=stats)
+
+    @property
+    def num_simulations(self) -> int:
+        return self.point_codes.shape[0]
+
+    @property
+    def num_players(self) -> int:
+        return self.point_codes.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        """In-memory size of the packed arrays"""
+        stats_bytes = self.stats.nbytes if self.stats is not None else 0
+        return self.point_values.nbytes + self.point_codes.nbytes + stats_bytes
+
+    @property
+    def points(self) -> np.ndarray:
+        """Full-precision (n_simulations, n_players) float64 points, decoded on demand"""
+        return self.point_values[self.point_codes]
+
+    def player_points(self, player_name: str) -> np.ndarray:
+        return self.point_values[self.point_codes[:, self.players.index(player_name)]]
+
+    def to_scenario_matrix(self) -> ScenarioMatrix:
+        """Unpack to the float64 ScenarioMatrix this was built from (bit-identical)"""
+        stats = self.stats.astype(np.float64) if self.stats is not None else None
+        return ScenarioMatrix(players=list(self.players), points=self.points,
+                              opponents=dict(self.opponents), stats=stats)
+
+    def save(self, filepath: str, codec: Optional[str] = 'zlib') -> Path:
+        """Write to disk, compressing each array with `codec` ('zlib', 'bz2', 'lzma' or None)"""
+        if codec is not None and codec not in CODECS:
+            raise ValueError(f"Unknown codec '{codec}', expected one of {sorted(CODECS)} or None")
+        compress = CODECS[codec][0] if codec else bytes
+
+        arrays = {'point_values': self.point_values, 'point_codes': self.point_codes}
+        if self.stats is not None:
+            arrays['stats'] = self.stats
+        payloads = [compress(np.ascontiguousarray(array).tobytes()) for array in arrays.values()]
+
+        header = json.dumps({
+            'players': self.players,
+            'opponents': self.opponents,
+            'stats': self.stat_names,
+            'codec': codec,
+            'arrays': [{'name': name, 'dtype': array.dtype.newbyteorder('<').str,
+                        'shape': list(array.shape), 'bytes': len(payload)}
+                       for (name, array), payload in zip(arrays.items(), payloads)]
+        }).encode('utf-8')
+
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'wb') as f:
+            f.write(HEADER_PREFIX.pack(COMPACT_MAGIC, COMPACT_VERSION, len(header)))
+            f.write(header)
+            for payload in payloads:
+                f.write(payload)
+        return filepath
+
+    @classmethod
+    def load(cls, filepath: str) -> 'CompactScenarioMatrix':
+        with open(filepath, 'rb') as f:
+            magic, version, header_len = HEADER_PREFIX.unpack(f.read(HEADER_PREFIX.size))
+            if magic != COMPACT_MAGIC:
+                raise ValueError(f"Not a compact scenario file: {filepath}")
+            if version != COMPACT_VERSION:
+                raise ValueError(f"Unsupported compact scenario version {version}")
+            header = json.loads(f.read(header_len).decode('utf-8'))
+            decompress = CODECS[header['codec']][1] if header['codec'] else bytes
+
+            arrays = {}
+            for spec in header['arrays']:
+                data = decompress(f.read(spec['bytes']))
+                arrays[spec['name']] = np.frombuffer(data, dtype=spec['dtype']).reshape(spec['shape'])
+
+        return cls(players=header['players'], point_values=arrays['point_values'],
+                   point_codes=arrays['point_codes'], opponents=header['opponents'],
+                   stats=arrays.get('stats'), stat_names=header['stats'])
+
+
+def _smallest_unsigned(max_value) -> np.dtype:
+    for dtype in _UNSIGNED_TYPES:
+        if max_value <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    raise ValueError(f"Value {max_value} does not fit in an unsigned integer type")
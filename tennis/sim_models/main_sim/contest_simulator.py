@@ -0,0 +1,335 @@
+"""
+GPP Contest Simulator
+Ranks our lineups against a synthetic large field in every simulated scenario
+
+The field is sampled from projected ownership, scored with the bulk lineup scoring
+engine, sorted once per scenario, and our lineups are placed with a single
+vectorized searchsorted over all scenarios in a block. Ties split the payouts of
+the tied ranks, as on DraftKings.
+
+Salary and opponent rules reject some sampled lineups, which moves realized
+ownership away from the sampling weights, so the weights are calibrated until
+the accepted lineups reproduce the projected ownership (as closely as the rules
+allow: a player and their opponent can never total more than 100%).
+
+Location: tennis/sim_models/main_sim/contest_simulator.py
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .scenarios import ScenarioMatrix
+from .lineup_optimizer import DK_SALARY_CAP, DK_ROSTER_SIZE
+from .lineup_scorer import LineupScoringEngine
+
+
+@dataclass
+class PayoutStructure:
+    """Contest entry fee, prize per finishing rank and total entries"""
+    entry_fee: float
+    payouts: np.ndarray                # payouts[r - 1] is the prize for rank r
+    num_entries: Optional[int] = None  # contest size, including our entries
+
+    @classmethod
+    def from_tiers(cls, entry_fee: float, tiers: Sequence[Tuple[int, float]],
+                   num_entries: Optional[int] = None) -> 'PayoutStructure':
+        """
+        Build from (last_rank, prize) tiers, e.g. [(1, 10000), (2, 5000), (10, 500), (2500, 10)]
+        """
+        tiers = sorted(tiers)
+        payouts = np.zeros(tiers[-1][0]) if tiers else np.zeros(0)
+        first = 1
+        for last_rank, prize in tiers:
+            payouts[first - 1:last_rank] = prize
+            first = last_rank + 1
+        return cls(entry_fee=entry_fee, payouts=payouts, num_entries=num_entries)
+
+    @classmethod
+    def power_curve(cls, entry_fee: float, num_entries: int, paid_fraction: float = 0.2,
+                    rake: float = 0.15, exponent: float = 1.1) -> 'PayoutStructure':
+        """Typical top-heavy GPP curve: prize proportional to rank^-exponent for the paid ranks"""
+        paid = max(1, int(num_entries * paid_fraction))
+        weights = np.arange(1, paid + 1, dtype=float) ** -exponent
+        pool = entry_fee * num_entries * (1.0 - rake)
+        return cls(entry_fee=entry_fee, payouts=pool * weights / weights.sum(), num_entries=num_entries)
+
+    def cumulative(self, num_ranks: int) -> np.ndarray:
+        """cum[r] = total prize paid to ranks 1..r, for r in 0..num_ranks"""
+        payouts = np.zeros(num_ranks)
+        paid = min(num_ranks, len(self.payouts))
+        payouts[:paid] = self.payouts[:paid]
+        return np.concatenate([[0.0], np.cumsum(payouts)])
+
+
+@dataclass
+class ContestResults:
+    """Per-lineup contest outcomes over all scenarios"""
+    expected_payout: np.ndarray
+    roi: np.ndarray            # (expected payout - entry fee) / entry fee
+    cash_rate: np.ndarray      # share of scenarios with a non-zero payout
+    win_rate: np.ndarray       # share of scenarios finishing first (ties counted fractionally)
+    mean_rank: np.ndarray
+    field_size: int
+    num_simulations: int
+
+
+class ContestSimulator:
+    """
+    Simulates a large-field GPP over the slate scenario matrix
+
+    Usage:
+        payouts = PayoutStructure.power_curve(entry_fee=20, num_entries=100000)
+        contest = ContestSimulator(scenarios, salaries, payouts, seed=42)
+        results = contest.simulate([lineup.players for lineup in lineups])  # field fills the contest
+    """
+
+    def __init__(self, scenarios: ScenarioMatrix, salaries: Dict[str, int], payouts: PayoutStructure,
+                 ownership: Optional[Dict[str, float]] = None, seed: Optional[int] = None,
+                 salary_cap: int = DK_SALARY_CAP, roster_size: int = DK_ROSTER_SIZE,
+                 min_salary: int = 0, exclude_opponents: bool = True):
+        """
+        Args:
+            scenarios: Simulated fantasy points for the slate
+            salaries: Player name -> DraftKings salary
+            payouts: Contest payout table
+            ownership: Projected ownership per player (share of lineups, e.g. 0.35);
+                estimated from projections when omitted
+            seed: Seed for field generation
+            salary_cap: Field lineups must fit under the cap
+            roster_size: Players per lineup
+            min_salary: Field lineups spending less than this are resampled
+            exclude_opponents: Field lineups never roster both players from one match
+        """
+        self.scenarios = scenarios
+        self.payouts = payouts
+        self.salary_cap = salary_cap
+        self.roster_size = roster_size
+        self.min_salary = min_salary
+        self.exclude_opponents = exclude_opponents
+        self.rng = np.random.default_rng(seed)
+        self.engine = LineupScoringEngine(scenarios)
+
+        self.salaries = np.array([salaries.get(name, 0) for name in scenarios.players], dtype=np.int64)
+        self.opponents = scenarios.opponent_indices()
+        self.ownership = (self._ownership_array(ownership) if ownership is not None
+                          else self.estimate_ownership())
+        self._log_weights = None  # Calibrated on first field generation
+
+    def estimate_ownership(self, temperature: float = 1.0) -> np.ndarray:
+        """
+        Projected ownership from mean points and points per $1k
+
+        Ownership is a softmax over standardized projection and value, scaled so the
+        shares sum to the roster size (every lineup rosters `roster_size` players).
+        """
+        means = self.scenarios.means()
+        has_salary = self.salaries > 0
+        value = np.where(has_salary, means / np.maximum(self.salaries, 1) * 1000.0, 0.0)
+
+        def standardize(x):
+            return (x - x[has_salary].mean()) / (x[has_salary].std() + 1e-9)
+
+        score = np.exp((standardize(means) + standardize(value)) / temperature)
+        score[~has_salary] = 0.0
+        ownership = score / score.sum() * self.roster_size
+        return np.clip(ownership, 0.0, 0.95)
+
+    def generate_field(self, field_size: int, batch_size: int = 50000) -> np.ndarray:
+        """
+        Sample field lineups whose player ownership matches the projected ownership
+
+        Players are drawn without replacement with the Gumbel top-k trick from the
+        calibrated weights (see calibrate_ownership), at most one per match when
+        opponents are excluded; lineups breaking the salary rules are resampled.
+
+        Returns:
+            (field_size, roster_size) scenario column indices
+        """
+        if self._log_weights is None:
+            self._log_weights = self.calibrate_ownership(batch_size=batch_size)
+        return self._sample_lineups(self._log_weights, field_size, batch_size)
+
+    def calibrate_ownership(self, iterations: int = 25, sample_size: int = 20000,
+                            tolerance: float = 0.01, min_acceptance: float = 0.01,
+                            batch_size: int = 50000) -> np.ndarray:
+        """
+        Sampling log-weights whose accepted lineups reproduce `self.ownership`
+
+        Each round samples a field, compares realized ownership with the target
+        (scaled to sum to the roster size) and moves every player's log-weight by the
+        log of the ratio, until all players are within `tolerance`. Targets the salary
+        cap cannot support drive the acceptance rate down; calibration then stops below
+        `min_acceptance` and keeps the closest weights seen.
+        """
+        target = self._target_ownership()
+        active = target > 0
+        log_weights = np.full(len(target), -np.inf)
+        log_weights[active] = np.log(target[active])
+
+        best_weights, best_error = log_weights.copy(), np.inf
+        for _ in range(iterations):
+            lineups, acceptance = self._draw_batch(log_weights, batch_size)
+            if acceptance < min_acceptance:
+                break
+            while len(lineups) < sample_size:
+                lineups = np.concatenate([lineups, self._draw_batch(log_weights, batch_size)[0]])
+            realized = np.bincount(lineups.ravel(), minlength=len(target)) / len(lineups)
+            error = float(np.abs(realized - target)[active].max())
+            if error < best_error:
+                best_weights, best_error = log_weights.copy(), error
+            if error <= tolerance:
+                break
+            # Multiplicative update (clipped so infeasible targets cannot run away)
+            step = np.log(target[active] / np.maximum(realized[active], 1e-4))
+            log_weights[active] += np.clip(step, -1.0, 1.0)
+            log_weights[active] -= log_weights[active].max()  # Keep the weights bounded
+
+        if best_error > tolerance:
+            print(f"Warning: Field ownership is within {best_error:.3f} of the projection "
+                  f"(salary and opponent rules prevent an exact match)")
+        return best_weights
+
+    def _target_ownership(self) -> np.ndarray:
+        """
+        Projected ownership scaled to sum to the roster size
+
+        A player and their opponent are never in the same lineup, so a match above 100%
+        is scaled down to exactly 100% and the remainder is spread over the other
+        players (repeated until no match is over).
+        """
+        target = self.ownership.astype(float).copy()
+        capped = np.zeros(len(target), dtype=bool)
+        paired = (self.opponents >= 0) if self.exclude_opponents else capped
+        for _ in range(len(target)):
+            free = target[~capped].sum()
+            target[~capped] *= (self.roster_size - target[capped].sum()) / max(free, 1e-12)
+            pair_total = np.where(paired, target + target[np.maximum(self.opponents, 0)], 0.0)
+            over = (pair_total > 1.0 + 1e-9) & ~capped
+            if not over.any():
+                break
+            target[over] /= pair_total[over]
+            capped |= over
+        return target
+
+    def _sample_lineups(self, log_weights: np.ndarray, field_size: int, batch_size: int) -> np.ndarray:
+        """Lineups from `log_weights` that satisfy the salary and opponent rules"""
+        field = []
+        accepted = 0
+        attempts = 0
+        while accepted < field_size:
+            lineups, _ = self._draw_batch(log_weights, batch_size)
+            field.append(lineups)
+            accepted += len(lineups)
+            attempts += 1
+            if attempts > 1000 and accepted == 0:
+                raise ValueError("Could not sample any valid field lineups; check salaries and ownership")
+
+        return np.concatenate(field)[:field_size]
+
+    def _draw_batch(self, log_weights: np.ndarray, batch_size: int) -> Tuple[np.ndarray, float]:
+        """One Gumbel top-k batch: the valid lineups and the share of the batch they make up"""
+        keys = log_weights + self.rng.gumbel(size=(batch_size, len(log_weights)))
+        if self.exclude_opponents:
+            # Only the larger key of each match survives, which picks one player per
+            # match in proportion to weight, so opponent pairs are never sampled
+            paired = np.flatnonzero(self.opponents >= 0)
+            loses = keys[:, paired] < keys[:, self.opponents[paired]]
+            keys[:, paired] = np.where(loses, -np.inf, keys[:, paired])
+        lineups = np.argpartition(-keys, self.roster_size - 1, axis=1)[:, :self.roster_size]
+
+        total_salary = self.salaries[lineups].sum(axis=1)
+        valid = (total_salary <= self.salary_cap) & (total_salary >= self.min_salary)
+        valid &= np.isfinite(np.take_along_axis(keys, lineups, axis=1)).all(axis=1)
+        return lineups[valid], float(valid.mean())
+
+    def simulate(self, lineups: Union[np.ndarray, Sequence[Sequence[str]]],
+                 field: Optional[np.ndarray] = None, field_size: Optional[int] = None,
+                 scenario_block: int = 64) -> ContestResults:
+        """
+        Rank our lineups against the field in every scenario and apply the payout table
+
+        Args:
+            lineups: Our lineups (column indices or player name lists)
+            field: Opponent lineups as column indices; generated when omitted
+            field_size: Opponent entries to generate (defaults to the contest's num_entries
+                minus our lineups; required when the payout table has no num_entries)
+            scenario_block: Scenarios sorted and searched per vectorized batch
+        """
+        ours = self.engine.to_indices(lineups)
+        if field is None:
+            field = self.generate_field(field_size or self._default_field_size(len(ours)))
+
+        our_membership = self.engine.decode(self.engine.encode(ours))
+        field_membership = self.engine.decode(self.engine.encode(field))
+
+        num_field = len(field)
+        num_ours = len(ours)
+        num_sims = self.scenarios.num_simulations
+        cumulative = self.payouts.cumulative(num_field + 1)
+
+        payout_sum = np.zeros(num_ours)
+        cash_count = np.zeros(num_ours)
+        win_sum = np.zeros(num_ours)
+        rank_sum = np.zeros(num_ours)
+
+        for start in range(0, num_sims, scenario_block):
+            points = self.engine.points_by_scenario[start:start + scenario_block]
+            field_scores = np.sort(points @ field_membership.T, axis=1)  # (block, field) ascending
+            our_scores = points @ our_membership.T                        # (block, ours)
+
+            below, not_above = self._searchsorted_rows(field_scores, our_scores)
+            greater = num_field - not_above
+            ties = not_above - below
+
+            # Tied entries split the prizes of ranks greater+1 .. greater+ties+1
+            payout = (cumulative[greater + ties + 1] - cumulative[greater]) / (ties + 1)
+
+            payout_sum += payout.sum(axis=0)
+            cash_count += (payout > 0).sum(axis=0)
+            win_sum += np.where(greater == 0, 1.0 / (ties + 1), 0.0).sum(axis=0)
+            rank_sum += (greater + 1 + ties / 2.0).sum(axis=0)
+
+        expected = payout_sum / num_sims
+        fee = self.payouts.entry_fee
+        return ContestResults(
+            expected_payout=expected,
+            roi=(expected - fee) / fee if fee else np.zeros(num_ours),
+            cash_rate=cash_count / num_sims,
+            win_rate=win_sum / num_sims,
+            mean_rank=rank_sum / num_sims,
+            field_size=num_field,
+            num_simulations=num_sims
+        )
+
+    @staticmethod
+    def _searchsorted_rows(sorted_rows: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Row-wise searchsorted (left and right) in one call
+
+        Each row is shifted by a multiple of the global value span so the flattened
+        matrix stays sorted, then all rows are searched at once.
+        """
+        low = min(sorted_rows.min(), values.min())
+        span = max(sorted_rows.max(), values.max()) - low + 1.0
+        offsets = np.arange(sorted_rows.shape[0])[:, None] * span
+        flat = (sorted_rows - low + offsets).ravel()
+        queries = values - low + offsets
+        base = np.arange(sorted_rows.shape[0])[:, None] * sorted_rows.shape[1]
+        left = np.searchsorted(flat, queries, side='left') - base
+        right = np.searchsorted(flat, queries, side='right') - base
+        return left, right
+
+    def _default_field_size(self, num_ours: int) -> int:
+        """Opponent entries that fill the contest alongside our lineups"""
+        if self.payouts.num_entries is None:
+            raise ValueError("field_size is required when the payout structure has no num_entries")
+        field_size = self.payouts.num_entries - num_ours
+        if field_size < 1:
+            raise ValueError(f"Contest of {self.payouts.num_entries} entries has no room for a field "
+                             f"besides our {num_ours} lineups")
+        return field_size
+
+    def _ownership_array(self, ownership: Dict[str, float]) -> np.ndarray:
+        return np.array([ownership.get(name, 0.0) for name in self.scenarios.players], dtype=float)
@@ -0,0 +1,140 @@
+"""
+Online Player Covariance
+Streaming player x player fantasy-point covariance and correlation for slate simulations
+
+Rows are buffered and folded in blocks with the pairwise (Chan et al.) update, so the
+full sample matrix is never stored. Accumulators from different processes can be
+merged, and the state is a plain dict of arrays for pickling or checkpointing.
+
+Location: tennis/sim_models/main_sim/covariance.py
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class OnlineCovariance:
+    """
+    Mergeable streaming covariance of per-player fantasy points
+
+    Usage:
+        acc = OnlineCovariance(players)
+        for row in rows:          # one fantasy-point value per player
+            acc.update(row)
+        corr = acc.correlation()
+        acc.merge(other_process_acc)
+    """
+
+    def __init__(self, players: Sequence[str], block_size: int = 256):
+        """
+        Args:
+            players: Player names, fixing the row/column order
+            block_size: Rows buffered before they are folded into the running moments
+        """
+        self.players = list(players)
+        self.player_index = {name: i for i, name in enumerate(self.players)}
+        self.block_size = block_size
+
+        size = len(self.players)
+        self.count = 0
+        self.mean = np.zeros(size)
+        self.comoment = np.zeros((size, size))  # sum of outer products of deviations
+        self._buffer: List[np.ndarray] = []
+
+    def update(self, row: Sequence[float]):
+        """Add one simulated slate (fantasy points in player order)"""
+        self._buffer.append(np.asarray(row, dtype=float))
+        if len(self._buffer) >= self.block_size:
+            self.flush()
+
+    def update_batch(self, rows: np.ndarray):
+        """Add many slates at once, shape (n_simulations, n_players)"""
+        self.flush()
+        self._fold(np.asarray(rows, dtype=float))
+
+    def flush(self):
+        """Fold buffered rows into the running moments"""
+        if self._buffer:
+            rows = np.vstack(self._buffer)
+            self._buffer = []
+            self._fold(rows)
+
+    def _fold(self, rows: np.ndarray):
+        """Chan et al. pairwise update with a block of rows"""
+        n_b = rows.shape[0]
+        if n_b == 0:
+            return
+        mean_b = rows.mean(axis=0)
+        centered = rows - mean_b
+        comoment_b = centered.T @ centered
+        self._combine(n_b, mean_b, comoment_b)
+
+    def _combine(self, n_b: int, mean_b: np.ndarray, comoment_b: np.ndarray):
+        n_a = self.count
+        total = n_a + n_b
+        delta = mean_b - self.mean
+        self.comoment += comoment_b + np.outer(delta, delta) * (n_a * n_b / total)
+        self.mean += delta * (n_b / total)
+        self.count = total
+
+    def merge(self, other: 'OnlineCovariance') -> 'OnlineCovariance':
+        """Fold another accumulator (e.g. from a worker process) into this one"""
+        if other.players != self.players:
+            raise ValueError("Cannot merge covariance accumulators over different players")
+        self.flush()
+        other.flush()
+        if other.count:
+            self._combine(other.count, other.mean, other.comoment)
+        return self
+
+    def covariance(self, ddof: int = 1) -> np.ndarray:
+        """Player x player covariance matrix"""
+        self.flush()
+        if self.count - ddof <= 0:
+            return np.full_like(self.comoment, np.nan)
+        return self.comoment / (self.count - ddof)
+
+    def correlation(self) -> np.ndarray:
+        """Player x player correlation matrix (NaN where a player has zero variance)"""
+        cov = self.covariance()
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return cov / np.outer(std, std)
+
+    def pair_correlation(self, player1: str, player2: str) -> float:
+        """Correlation between two players' fantasy points"""
+        i, j = self.player_index[player1], self.player_index[player2]
+        return float(self.correlation()[i, j])
+
+    def get_state(self) -> Dict[str, Any]:
+        """Picklable state, including unflushed rows so resumed runs fold identically"""
+        return {
+            'players': list(self.players),
+            'block_size': self.block_size,
+            'count': self.count,
+            'mean': self.mean.copy(),
+            'comoment': self.comoment.copy(),
+            'buffer': [row.copy() for row in self._buffer],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'OnlineCovariance':
+        acc = cls(state['players'], block_size=state['block_size'])
+        acc.count = state['count']
+        acc.mean = np.array(state['mean'], dtype=float)
+        acc.comoment = np.array(state['comoment'], dtype=float)
+        acc._buffer = [np.asarray(row, dtype=float) for row in state['buffer']]
+        return acc
+
+    def save(self, filepath: str):
+        """Export means, covariance and correlation (.npz) for the optimizer and notebooks"""
+        np.savez(filepath, players=np.array(self.players), count=self.count, mean=self.mean,
+                 covariance=self.covariance(), correlation=self.correlation())
+
+    def reindex(self, players: Sequence[str], ddof: int = 1) -> Optional[np.ndarray]:
+        """Covariance restricted/reordered to `players` (None if any player is unknown)"""
+        if any(name not in self.player_index for name in players):
+            return None
+        idx = np.array([self.player_index[name] for name in players], dtype=np.intp)
+        return self.covariance(ddof)[np.ix_(idx, idx)]
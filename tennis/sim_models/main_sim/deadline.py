@@ -0,0 +1,246 @@
+"""
+Deadline-Bounded Slate Simulation
+"Simulate until lock": spend a wall-clock budget across all cores
+
+Matches are simulated in small batches on a process pool. Matches on a slate are
+independent, so every new batch goes to the match whose player projections are
+least converged (largest standard error of mean fantasy points). At the deadline
+the estimates are returned with the precision reached.
+
+Location: tennis/sim_models/main_sim/deadline.py
+"""
+
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .match_cache import batch_seed, seeded_random
+from .progress import ProgressTracker
+from .scenarios import ScenarioMatrix
+
+
+@dataclass
+class PlayerEstimate:
+    """Projection for one player with its precision"""
+    player: str
+    mean_fantasy_points: float
+    std_fantasy_points: float
+    std_error: float
+    win_probability: float
+    simulations: int
+
+
+@dataclass
+class DeadlineResult:
+    """Estimates reached by the deadline"""
+    estimates: Dict[str, PlayerEstimate]
+    match_simulations: Dict[str, int]    # match_id -> outcomes simulated
+    outcomes: Dict[str, List[Any]]       # match_id -> MatchResult list
+    elapsed_seconds: float
+    workers: int
+    max_std_error: float
+    target_std_error: Optional[float] = None
+
+    @property
+    def total_match_simulations(self) -> int:
+        return sum(self.match_simulations.values())
+
+    @property
+    def converged(self) -> bool:
+        return self.target_std_error is not None and self.max_std_error <= self.target_std_error
+
+    def to_scenario_matrix(self, match_ids: List[str]) -> ScenarioMatrix:
+        """
+        Slate scenarios from the first n outcomes of every match, where n is the
+        smallest per-match count (matches are independent, so any alignment is valid)
+        """
+        n = min(self.match_simulations[mid] for mid in match_ids)
+        players: List[str] = []
+        opponents: Dict[str, str] = {}
+        columns = []
+        for mid in match_ids:
+            outcomes = self.outcomes[mid][:n]
+            p1, p2 = outcomes[0].player1, outcomes[0].player2
+            players.extend([p1, p2])
+            opponents[p1], opponents[p2] = p2, p1
+            columns.append([r.player1_fantasy_points for r in outcomes])
+            columns.append([r.player2_fantasy_points for r in outcomes])
+        return ScenarioMatrix(players=players, points=np.array(columns, dtype=float).T, opponents=opponents)
+
+
+# Worker process state: one slate simulator per process, created by init_worker
+_worker_simulator = None
+
+
+def init_worker(data_source: Optional[str]):
+    global _worker_simulator
+    from .slate_simulator import TennisSlateSimulator
+    with contextlib.redirect_stdout(io.StringIO()):
+        _worker_simulator = TennisSlateSimulator(data_source)
+
+
+def simulate_batch(simulator, match, batch_size: int, seed: int) -> Tuple[List[Any], float]:
+    """Simulate `batch_size` outcomes of a match from `seed`; returns (outcomes, seconds)"""
+    started = time.perf_counter()
+    with seeded_random(seed):
+        outcomes = [simulator.simulate_match(match) for _ in range(batch_size)]
+    return outcomes, time.perf_counter() - started
+
+
+def worker_batch(match, batch_size: int, seed: int) -> Tuple[List[Any], float]:
+    """simulate_batch on the worker process's simulator (pool initializer: init_worker)"""
+    return simulate_batch(_worker_simulator, match, batch_size, seed)
+
+
+def seconds_until(deadline: Union[datetime, float, int]) -> float:
+    """Budget in seconds from a datetime deadline or a number of seconds"""
+    if isinstance(deadline, datetime):
+        now = datetime.now(deadline.tzinfo) if deadline.tzinfo else datetime.now()
+        return (deadline - now).total_seconds()
+    return float(deadline)
+
+
+def match_std_error(moments: np.ndarray, pending: int = 0) -> float:
+    """
+    Largest standard error of the two players' mean fantasy points
+
+    Args:
+        moments: [count, sum, sum of squares] per player, shape (2, 3)
+        pending: Outcomes already requested but not returned yet
+    """
+    n = moments[0, 0]
+    if n < 2:
+        # Unsimulated matches first, spreading the initial batches across them
+        return float('inf') if pending == 0 else 1e12 / pending
+    variance = (moments[:, 2] - moments[:, 1] ** 2 / n) / (n - 1)
+    return float(np.sqrt(max(variance.max(), 0.0) / (n + pending)))
+
+
+def player_estimates(outcomes: Dict[str, List[Any]]) -> Dict[str, PlayerEstimate]:
+    estimates = {}
+    for results in outcomes.values():
+        if not results:
+            continue
+        n = len(results)
+        for side, player in ((0, results[0].player1), (1, results[0].player2)):
+            points = np.array([r.player1_fantasy_points if side == 0 else r.player2_fantasy_points
+                               for r in results])
+            std = float(points.std(ddof=1)) if n > 1 else float('nan')
+            estimates[player] = PlayerEstimate(
+                player=player,
+                mean_fantasy_points=float(points.mean()),
+                std_fantasy_points=std,
+                std_error=float(std / np.sqrt(n)) if n > 1 else float('inf'),
+                win_probability=sum(r.winner == side for r in results) / n,
+                simulations=n
+            )
+    return estimates
+
+
+def run_until_deadline(slate_simulator, matches: List, deadline: Union[datetime, float, int],
+                       batch_size: int = 25, max_workers: Optional[int] = None,
+                       target_std_error: Optional[float] = None, progress_callback=None,
+                       verbose: bool = True) -> DeadlineResult:
+    """Implementation of TennisSlateSimulator.simulate_until (see there)"""
+    started = time.perf_counter()
+    budget = seconds_until(deadline)
+    stop_at = started + budget
+    workers = max_workers or os.cpu_count() or 1
+
+    match_ids = [m.match_id for m in matches]
+    by_id = {m.match_id: m for m in matches}
+    keys = {m.match_id: slate_simulator.get_match_block_key(m) for m in matches}
+    outcomes: Dict[str, List[Any]] = {mid: [] for mid in match_ids}
+    moments: Dict[str, np.ndarray] = {mid: np.zeros((2, 3)) for mid in match_ids}
+    pending: Dict[str, int] = {mid: 0 for mid in match_ids}
+    batches_issued: Dict[str, int] = {mid: 0 for mid in match_ids}
+    batch_seconds = []
+
+    tracker = ProgressTracker(None, progress_callback, every=batch_size * len(matches),
+                              workers=workers, label='deadline')
+
+    if verbose:
+        print(f"\n⏱️ Simulating {len(matches)}-match slate for {budget:.1f}s on {workers} worker(s)")
+
+    def next_match() -> Optional[str]:
+        errors = {mid: match_std_error(moments[mid], pending[mid]) for mid in match_ids}
+        mid = max(match_ids, key=lambda m: errors[m])
+        if target_std_error is not None and errors[mid] <= target_std_error:
+            return None
+        return mid
+
+    def time_for_batch() -> bool:
+        expected = np.median(batch_seconds) if batch_seconds else 0.0
+        return time.perf_counter() + expected < stop_at
+
+    def issue(mid: str) -> Tuple[Any, int, int]:
+        index = batches_issued[mid]
+        batches_issued[mid] += 1
+        pending[mid] += batch_size
+        return by_id[mid], batch_size, batch_seed(keys[mid], index)
+
+    def collect(mid: str, batch: List[Any], seconds: float) -> bool:
+        outcomes[mid].extend(batch)
+        pending[mid] -= batch_size
+        points = np.array([[r.player1_fantasy_points, r.player2_fantasy_points] for r in batch])
+        moments[mid] += np.column_stack([np.full(2, len(batch)), points.sum(axis=0), (points ** 2).sum(axis=0)])
+        batch_seconds.append(seconds)
+        return tracker.step(count=len(batch), matches=len(batch), busy_seconds=seconds)
+
+    keep_going = True
+    if workers == 1:
+        # In-process: no pool start-up cost, useful on small machines and short budgets
+        while keep_going and time_for_batch():
+            mid = next_match()
+            if mid is None:
+                break
+            batch, seconds = simulate_batch(slate_simulator, *issue(mid))
+            keep_going = collect(mid, batch, seconds)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                       initargs=(slate_simulator.data_source,))
+        running = {}
+        try:
+            while keep_going:
+                while len(running) < 2 * workers and time_for_batch():
+                    mid = next_match()
+                    if mid is None:
+                        break
+                    running[executor.submit(worker_batch, *issue(mid))] = mid
+                if not running:
+                    break
+                done, _ = wait(running, timeout=max(0.0, stop_at - time.perf_counter()),
+                               return_when=FIRST_COMPLETED)
+                if not done:
+                    break  # deadline reached with batches still running
+                for future in done:
+                    batch, seconds = future.result()
+                    keep_going = collect(running.pop(future), batch, seconds) and keep_going
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    tracker.finish()
+    estimates = player_estimates(outcomes)
+    errors = [e.std_error for e in estimates.values()]
+    result = DeadlineResult(
+        estimates=estimates,
+        match_simulations={mid: len(outcomes[mid]) for mid in match_ids},
+        outcomes=outcomes,
+        elapsed_seconds=time.perf_counter() - started,
+        workers=workers,
+        max_std_error=max(errors) if len(estimates) == 2 * len(matches) else float('inf'),
+        target_std_error=target_std_error
+    )
+
+    if verbose:
+        print(f"✅ {result.total_match_simulations} match simulations in {result.elapsed_seconds:.1f}s, "
+              f"max std error {result.max_std_error:.2f} fantasy points")
+
+    return result
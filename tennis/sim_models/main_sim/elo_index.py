@@ -0,0 +1,150 @@
+"""
+Sorted ELO Index
+Players of one surface (and optionally one tour) sorted by surface-weighted ELO
+
+Approximating stats for a player without data means finding players with a
+similar ELO. Scanning every player per lookup costs O(n) ELO lookups; the index
+sorts once and answers range and k-nearest queries with bisect. Prefix sums over
+each stat column give the plain mean of any ELO window in O(log n); weighted
+means (e.g. by ELO proximity) are one vectorized pass over the window.
+
+The index is a snapshot of the analyzer data it was built from.
+
+Location: tennis/sim_models/main_sim/elo_index.py
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Stat columns and the defaults used when a player has no value (as in the ELO approximation scripts)
+INDEX_STATS = {
+    'service_points_won': 60.0,
+    'return_points_won': 40.0,
+    'ace_rate': 6.0,
+    'double_fault_rate': 4.0,
+    'first_serve_percentage': 62.0,
+    'matches': 0,
+    'surface_matches': 0,
+}
+
+# Tour names -> the 'gender' value in calculated_stats
+TOURS = {'ATP': 'M', 'WTA': 'W', 'M': 'M', 'W': 'W'}
+
+
+class EloIndex:
+    """
+    Bisect range and nearest-neighbour queries over players sorted by ELO
+
+    Usage:
+        index = analyzer.elo_index('Clay', tour='ATP')
+        positions = index.within(1650, 100)          # players within +-100 ELO
+        names = [index.names[i] for i in positions]
+        count, means = index.aggregate(1650, 100)    # O(log n) window means
+    """
+
+    def __init__(self, names: List[str], elos: List[float], columns: Dict[str, np.ndarray],
+                 order: Optional[List[int]] = None):
+        self.names = names
+        self.elos = elos                      # ascending
+        self._elo_array = np.asarray(elos, dtype=np.float64)
+        self.columns = columns                # stat -> values aligned with names
+        self.order = order if order is not None else list(range(len(names)))  # position in the source data
+        self._prefix = {name: np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+                        for name, values in columns.items()}
+
+    @classmethod
+    def build(cls, analyzer, surface: str, tour: Optional[str] = None,
+              stats: Optional[Dict[str, Dict]] = None,
+              counts: Optional[Dict[str, Dict]] = None) -> 'EloIndex':
+        """
+        Index the players of `stats` (default: analyzer.calculated_stats) that have a
+        surface-weighted ELO, optionally restricted to one tour ('ATP'/'WTA'). The
+        match count columns come from `counts` when given (players missing from it
+        have no matches), otherwise from `stats`.
+        """
+        stats = analyzer.calculated_stats if stats is None else stats
+        gender = TOURS[tour.upper()] if tour else None
+        surface_key = f'{surface.lower()}_matches'
+
+        rows = []
+        for position, (player_name, player_data) in enumerate(stats.items()):
+            if not isinstance(player_data, dict):
+                continue
+            if gender and player_data.get('gender') != gender:
+                continue
+            elo = analyzer.get_player_elo(player_name, surface)
+            if elo:
+                rows.append((elo, position, player_name, player_data))
+        rows.sort(key=lambda row: (row[0], row[1]))
+
+        columns = {}
+        for column, default in INDEX_STATS.items():
+            key = surface_key if column == 'surface_matches' else column
+            if counts is not None and column in ('matches', 'surface_matches'):
+                values = [counts.get(row[2], {}).get(key, default) for row in rows]
+            else:
+                values = [row[3].get(key, default) for row in rows]
+            columns[column] = np.array(values, dtype=np.float64)
+        return cls(names=[row[2] for row in rows], elos=[row[0] for row in rows],
+                   columns=columns, order=[row[1] for row in rows])
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def span(self, low: float, high: float) -> Tuple[int, int]:
+        """(start, stop) positions of players with low <= ELO <= high"""
+        return bisect_left(self.elos, low), bisect_right(self.elos, high)
+
+    def within(self, target_elo: float, radius: float) -> range:
+        """Positions of players within +-radius of target_elo"""
+        return range(*self.span(target_elo - radius, target_elo + radius))
+
+    def nearest(self, target_elo: float, k: int) -> List[int]:
+        """Positions of the k players closest in ELO to target_elo, closest first"""
+        right = bisect_left(self.elos, target_elo)
+        left = right - 1
+        positions = []
+        while len(positions) < k and (left >= 0 or right < len(self.elos)):
+            if right >= len(self.elos) or (left >= 0 and target_elo - self.elos[left] <= self.elos[right] - target_elo):
+                positions.append(left)
+                left -= 1
+            else:
+                positions.append(right)
+                right += 1
+        return positions
+
+    def window_means(self, start: int, stop: int) -> Dict[str, float]:
+        """Mean of every stat column over positions [start, stop) from the prefix sums"""
+        count = stop - start
+        if count <= 0:
+            return {}
+        return {name: float(prefix[stop] - prefix[start]) / count for name, prefix in self._prefix.items()}
+
+    def aggregate(self, target_elo: float, radius: float,
+                  weight: Optional[Callable[[np.ndarray, Dict[str, np.ndarray]], np.ndarray]] = None
+                  ) -> Tuple[int, Dict[str, float]]:
+        """
+        (player count, stat means) of the +-radius window around target_elo
+
+        Plain means come from the prefix sums in O(log n). With `weight`, called with
+        the window's absolute ELO differences and stat column slices, the means are
+        weighted per player and the count is the players with a positive weight.
+        """
+        start, stop = self.span(target_elo - radius, target_elo + radius)
+        if weight is None:
+            return stop - start, self.window_means(start, stop)
+
+        window = {name: values[start:stop] for name, values in self.columns.items()}
+        weights = np.asarray(weight(np.abs(self._elo_array[start:stop] - target_elo), window), dtype=np.float64)
+        count = int(np.count_nonzero(weights > 0))
+        total = weights.sum()
+        if total <= 0:
+            return count, {}
+        return count, {name: float(weights @ values / total) for name, values in window.items()}
+
+    def player(self, position: int) -> Dict[str, float]:
+        """Stat values of the player at `position`"""
+        return {name: float(values[position]) for name, values in self.columns.items()}
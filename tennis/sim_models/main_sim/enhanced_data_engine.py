@@ -10,6 +10,7 @@ from pathlib import Path
 import json
 
 from .analyzer import TennisStatsAnalyzer
+from .analyzer_registry import get_shared_analyzer
 from .enhanced_profiles import (
     EnhancedPlayerProfile, PlayerArchetype, 
     StatisticalProfile, ShotPatterns
@@ -22,12 +23,12 @@ class EnhancedDataEngine:
     with the_oracle's advanced profiling capabilities
     """
     
-    def __init__(self, data_source: str = None):
-        """Initialize enhanced data engine"""
+    def __init__(self, data_source: str = None, analyzer: Optional[TennisStatsAnalyzer] = None):
+        """Initialize enhanced data engine (on the shared analyzer unless one is given)"""
         print("🔄 Initializing Enhanced Data Engine...")
         
         # Use main_sim's existing analyzer as the foundation
-        self.base_analyzer = TennisStatsAnalyzer(data_source)
+        self.base_analyzer = analyzer or get_shared_analyzer(data_source)
         
         # Enhanced capabilities
         self.all_players: Set[str] = set()
@@ -0,0 +1,272 @@
+"""
+Incremental Time-Weighted Player Stats
+Exponentially decayed serve/return sufficient statistics updated one match at a time
+
+The archive stats builders recompute every player from the complete charting
+history. Rates such as ace rate are ratios of sums (aces / serve points), so it is
+enough to keep the decayed sums per player and surface and fold in each new match
+row once. The state remembers which (match, player) rows it has seen and, per
+file, its size, modification time and newest match date. A daily update skips
+unchanged files and reads the newest-first charting files in chunks from the
+top, stopping once a chunk is older than the newest folded match minus a
+lookback window (matches charted later than that need --rebuild).
+
+The derived JSON is overlaid onto the analyzer's measured serve/return rates
+(TennisStatsAnalyzer loads it after its stats file, and the player database
+snapshot is invalidated when it changes).
+
+Decay: a match d days older than a player's newest match counts 2 ** (-d / half_life).
+Sums are kept relative to each player's newest match and rescaled when a newer
+match arrives, so folding in a row is O(1) and ratios are unaffected by the scale.
+
+Location: tennis/sim_models/main_sim/incremental_stats.py
+"""
+
+import json
+import os
+import pickle
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .player_snapshot import write_atomic
+
+STATE_VERSION = 2
+DEFAULT_STATE_PATH = Path("data/cache/time_weighted_stats.pkl")
+DEFAULT_OUTPUT_PATH = Path("data/processed/time_weighted_player_stats.json")
+
+# exp(-0.5 per year) as in scripts/archive/calculate_time_weighted_stats.py
+DEFAULT_HALF_LIFE_DAYS = 506.0
+
+# Matches this much older than a file's newest folded match are still re-read for late charting
+DEFAULT_LOOKBACK_DAYS = 180
+CHUNK_ROWS = 2000
+
+# (gender, matches file, Overview stats file) per tour
+CHARTING_SOURCES = (
+    ('M', "data/charting-m-matches(1).csv", "data/charting-m-stats-Overview.csv"),
+    ('W', "data/charting-w-matches.csv", "data/charting-w-stats-Overview.csv"),
+)
+
+SURFACES = ('Hard', 'Clay', 'Grass')
+
+# Overview columns summed per player and surface (plus a match count)
+SUM_FIELDS = ('serve_pts', 'aces', 'dfs', 'first_in', 'first_won', 'second_won',
+              'return_pts', 'return_pts_won')
+_MATCHES = len(SUM_FIELDS)
+
+
+class PlayerAccumulator:
+    """Decayed sums for one player: (surface, field) matrix relative to `as_of`"""
+
+    def __init__(self, gender: str, as_of: int):
+        self.gender = gender
+        self.as_of = as_of                                        # date ordinal of the newest match
+        self.sums = np.zeros((len(SURFACES), len(SUM_FIELDS) + 1))  # + decayed match count
+        self.matches = 0
+        self.serve_points = 0
+
+    def add(self, day: int, surface: int, values: np.ndarray, half_life: float):
+        if day > self.as_of:
+            self.sums *= 2.0 ** (-(day - self.as_of) / half_life)
+            self.as_of = day
+        weight = 2.0 ** (-(self.as_of - day) / half_life)
+        self.sums[surface, :_MATCHES] += weight * values
+        self.sums[surface, _MATCHES] += weight
+        self.matches += 1
+        self.serve_points += int(values[0])
+
+
+class TimeWeightedStatsBuilder:
+    """
+    Incrementally maintained time-weighted player stats
+
+    Usage:
+        builder = TimeWeightedStatsBuilder.load()    # empty on first run
+        new_rows = builder.update()                  # folds in newly charted rows
+        builder.save()                               # state + stats JSON, both atomic
+    """
+
+    def __init__(self, half_life_days: float = DEFAULT_HALF_LIFE_DAYS):
+        self.half_life_days = half_life_days
+        self.players: Dict[str, PlayerAccumulator] = {}
+        self.seen = set()      # (match_id, player) rows already folded in
+        self.as_of = 0         # date ordinal of the newest match overall
+        self.watermarks = {}   # Overview path -> (size, mtime_ns, newest match day folded from it)
+
+    @classmethod
+    def load(cls, path: Optional[str] = None, half_life_days: float = DEFAULT_HALF_LIFE_DAYS) -> 'TimeWeightedStatsBuilder':
+        """Saved state, or an empty builder when there is none (or it used another half-life)"""
+        path = Path(path or DEFAULT_STATE_PATH)
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            return cls(half_life_days)
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable time-weighted stats state {path}: {e}")
+            return cls(half_life_days)
+
+        if payload.get('version') != STATE_VERSION or payload.get('half_life_days') != half_life_days:
+            return cls(half_life_days)
+        builder = cls(half_life_days)
+        builder.seen = payload['seen']
+        builder.as_of = payload['as_of']
+        builder.watermarks = payload['watermarks']
+        for player, (gender, as_of, sums, matches, serve_points) in payload['players'].items():
+            accumulator = builder.players[player] = PlayerAccumulator(gender, as_of)
+            accumulator.sums, accumulator.matches, accumulator.serve_points = sums, matches, serve_points
+        return builder
+
+    def fold(self, match_id: str, player: str, gender: str, day: int, surface: str, values: Iterable[float]) -> bool:
+        """Add one player's Overview 'Total' row; False if the row was already folded in"""
+        key = (match_id, player)
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+
+        accumulator = self.players.get(player)
+        if accumulator is None:
+            accumulator = self.players[player] = PlayerAccumulator(gender, day)
+        surface_index = SURFACES.index(surface) if surface in SURFACES else 0  # Unknown -> Hard
+        accumulator.add(day, surface_index, np.asarray(values, dtype=np.float64), self.half_life_days)
+        self.as_of = max(self.as_of, day)
+        return True
+
+    def update(self, sources=CHARTING_SOURCES, lookback_days: int = DEFAULT_LOOKBACK_DAYS) -> int:
+        """Fold in the newly charted rows of the charting Overview files; returns rows added"""
+        added = 0
+        for gender, matches_path, overview_path in sources:
+            try:
+                stat = os.stat(overview_path)
+            except OSError:
+                continue
+            size, mtime_ns, newest = self.watermarks.get(overview_path, (None, None, 0))
+            if (size, mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                continue  # Unchanged since the last update
+
+            rows = self._new_rows(overview_path, newest - lookback_days if newest else None)
+            surfaces = _match_surfaces(matches_path, {match_id for match_id, _, _, _ in rows})
+            for match_id, player, day, values in rows:
+                added += self.fold(match_id, player, gender, day, surfaces.get(match_id, 'Hard'), values)
+                newest = max(newest, day)
+            self.watermarks[overview_path] = (stat.st_size, stat.st_mtime_ns, newest)
+        return added
+
+    def _new_rows(self, overview_path: str, cutoff: Optional[int]) -> List[Tuple[str, str, int, np.ndarray]]:
+        """
+        Unseen 'Total' rows as (match_id, player, day, values), read in chunks from the
+        top of a newest-first file until a whole chunk is older than `cutoff`
+        (None: read the whole file)
+        """
+        import pandas as pd
+
+        rows = []
+        reader = pd.read_csv(overview_path, usecols=['match_id', 'player', 'set'] + list(SUM_FIELDS),
+                             chunksize=CHUNK_ROWS)
+        for chunk in reader:
+            days = [_match_day(match_id) for match_id in chunk['match_id']]
+            chunk_days = [day for day in days if day is not None]
+            totals = (chunk['set'] == 'Total').to_numpy()
+            values = chunk[list(SUM_FIELDS)].to_numpy(dtype=np.float64)
+            for row, (match_id, player) in enumerate(zip(chunk['match_id'], chunk['player'])):
+                day = days[row]
+                if (not totals[row] or day is None or not isinstance(player, str)
+                        or (match_id, player) in self.seen):
+                    continue
+                rows.append((match_id, player, day, values[row]))
+
+            # Files list the newest matches first; stop once past the lookback window
+            if cutoff is not None and chunk_days and chunk_days[0] >= chunk_days[-1] and max(chunk_days) < cutoff:
+                break
+        reader.close()
+        return rows
+
+    def player_stats(self, min_serve_points: float = 50.0) -> Dict[str, Dict]:
+        """Per-player stats in the analyzer's calculated_stats layout (decayed rates)"""
+        stats = {}
+        for player, accumulator in self.players.items():
+            # Sums are relative to the player's newest match; scale them to the newest match overall
+            scale = 2.0 ** (-(self.as_of - accumulator.as_of) / self.half_life_days)
+            totals = accumulator.sums.sum(axis=0)
+            if totals[0] * scale < min_serve_points:
+                continue  # Too few recent serve points
+
+            entry = _rates(totals)
+            entry.update({
+                'matches': accumulator.matches,
+                'weighted_matches': round(float(totals[_MATCHES] * scale), 3),
+                'gender': accumulator.gender,
+                'surface_preferences': {
+                    surface: round(float(accumulator.sums[i, _MATCHES] / totals[_MATCHES]), 4)
+                    for i, surface in enumerate(SURFACES)
+                },
+                'surface_stats': {surface: _rates(accumulator.sums[i])
+                                  for i, surface in enumerate(SURFACES)
+                                  if accumulator.sums[i, 0] * scale >= min_serve_points},
+                'last_match': date.fromordinal(accumulator.as_of).isoformat(),
+                'data_source': 'time_weighted_measured',
+                'serve_points_analyzed': accumulator.serve_points
+            })
+            stats[player] = entry
+        return stats
+
+    def save(self, path: Optional[str] = None, output_path: Optional[str] = None) -> Tuple[Path, Path]:
+        """Atomically rewrite the builder state and (when it changed) the derived stats JSON"""
+        state = {
+            'version': STATE_VERSION,
+            'half_life_days': self.half_life_days,
+            'as_of': self.as_of,
+            'seen': self.seen,
+            'watermarks': self.watermarks,
+            'players': {player: (a.gender, a.as_of, a.sums, a.matches, a.serve_points)
+                        for player, a in self.players.items()}
+        }
+        state_path = write_atomic(path or DEFAULT_STATE_PATH, pickle.dumps(state, protocol=5))
+        stats_json = json.dumps(self.player_stats(), indent=2, ensure_ascii=False).encode('utf-8')
+        output_path = Path(output_path or DEFAULT_OUTPUT_PATH)
+        # Unchanged stats keep their mtime, so the analyzer's player database snapshot stays current
+        if not (output_path.exists() and output_path.read_bytes() == stats_json):
+            write_atomic(output_path, stats_json)
+        return state_path, output_path
+
+
+def _rates(sums: np.ndarray) -> Dict[str, float]:
+    serve_pts, aces, dfs, first_in, first_won, second_won, return_pts, return_pts_won = sums[:_MATCHES]
+    service_won = 100.0 * (first_won + second_won) / serve_pts if serve_pts else 60.0
+    return {
+        'ace_rate': round(100.0 * aces / serve_pts, 2) if serve_pts else 6.0,
+        'double_fault_rate': round(100.0 * dfs / serve_pts, 2) if serve_pts else 4.0,
+        'first_serve_percentage': round(100.0 * first_in / serve_pts, 1) if serve_pts else 62.0,
+        'service_points_won': round(service_won, 1),
+        'return_points_won': round(100.0 * return_pts_won / return_pts, 1) if return_pts else 40.0,
+    }
+
+
+def _match_day(match_id: str) -> Optional[int]:
+    """Date ordinal from the YYYYMMDD prefix of a charting match id"""
+    try:
+        return date(int(match_id[:4]), int(match_id[4:6]), int(match_id[6:8])).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def _match_surfaces(matches_path: str, match_ids: Set[str]) -> Dict[str, str]:
+    """match_id -> surface for `match_ids` from a charting matches file (stops reading once all are found)"""
+    import pandas as pd
+
+    surfaces = {}
+    if not match_ids or not Path(matches_path).exists():
+        return surfaces
+    reader = pd.read_csv(matches_path, usecols=['match_id', 'Surface'], dtype=str, keep_default_na=False,
+                         chunksize=CHUNK_ROWS)
+    for chunk in reader:
+        for match_id, surface in zip(chunk['match_id'], chunk['Surface']):
+            if match_id in match_ids:
+                surfaces[match_id] = surface.strip()
+        if len(surfaces) == len(match_ids):
+            break
+    reader.close()
+    return surfaces
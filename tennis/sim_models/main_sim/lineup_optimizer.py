@@ -0,0 +1,303 @@
+"""
+DFS Lineup Optimizer
+Builds DraftKings tennis lineups (6 players, $50k cap) from the slate scenario matrix
+
+Candidate lineups are generated from a pruned player pool, screened with a normal
+approximation built from the player covariance, and the survivors are scored against
+every simulated scenario with the bulk LineupScoringEngine.
+
+Location: tennis/sim_models/main_sim/lineup_optimizer.py
+"""
+
+from dataclasses import dataclass
+from itertools import combinations, islice
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .scenarios import ScenarioMatrix
+from .lineup_scorer import LineupScoringEngine
+from .covariance import OnlineCovariance
+
+
+DK_SALARY_CAP = 50000
+DK_ROSTER_SIZE = 6
+
+OBJECTIVES = ('mean', 'percentile', 'win_probability')
+
+
+@dataclass
+class Lineup:
+    """One optimized lineup"""
+    players: List[str]
+    salary: int
+    mean_points: float
+    std_points: float
+    objective: float
+
+
+class LineupOptimizer:
+    """
+    Searches for optimal DraftKings tennis lineups over simulated scenarios
+
+    Usage:
+        scenarios = slate_simulator.get_scenario_matrix()
+        optimizer = LineupOptimizer(scenarios, get_salary_map(slate_data))
+        lineups = optimizer.optimize(num_lineups=20, objective='percentile', percentile=90)
+    """
+
+    def __init__(self, scenarios: ScenarioMatrix, salaries: Dict[str, int],
+                 salary_cap: int = DK_SALARY_CAP, roster_size: int = DK_ROSTER_SIZE,
+                 max_pool_size: int = 26, chunk_size: int = 20000, screen_size: int = 5000,
+                 covariance: Optional[OnlineCovariance] = None):
+        """
+        Args:
+            scenarios: Simulated fantasy points for the slate
+            salaries: Player name -> DraftKings salary (players without a salary are ignored)
+            salary_cap: Lineup salary cap
+            roster_size: Players per lineup
+            max_pool_size: Players kept after dominance pruning (bounds the search)
+            chunk_size: Candidate lineups scored per vectorized batch
+            screen_size: Lineups kept by the normal-approximation screen for exact scoring
+            covariance: Streamed player covariance (e.g. TennisSlateSimulator.covariance)
+                used for screening instead of recomputing it from the scenarios
+        """
+        self.scenarios = scenarios
+        self.salary_cap = salary_cap
+        self.roster_size = roster_size
+        self.max_pool_size = max(roster_size, max_pool_size)
+        self.chunk_size = chunk_size
+        self.screen_size = screen_size
+
+        self.pool = [name for name in scenarios.players if name in salaries]
+        missing = [name for name in scenarios.players if name not in salaries]
+        if missing:
+            print(f"Warning: {len(missing)} simulated players have no salary and are excluded")
+
+        self.columns = scenarios.indices(self.pool)
+        self.salaries = np.array([salaries[name] for name in self.pool], dtype=np.int64)
+
+        # Pool moments used to screen lineups before exact scenario scoring
+        pool_points = scenarios.points[:, self.columns]
+        self.means = pool_points.mean(axis=0)
+        streamed = covariance.reindex(self.pool) if covariance is not None else None
+        self.covariance = streamed if streamed is not None else np.atleast_2d(np.cov(pool_points, rowvar=False))
+        self.engine = LineupScoringEngine(scenarios, block_size=chunk_size)
+
+        # Opponent of each pool player as a pool position (-1 if not in pool)
+        pool_position = {name: i for i, name in enumerate(self.pool)}
+        self.opponents = np.array([pool_position.get(scenarios.opponents.get(name, ''), -1)
+                                   for name in self.pool], dtype=np.intp)
+
+    def optimize(self, num_lineups: int = 1, objective: str = 'mean', percentile: float = 90.0,
+                 target: Optional[Union[float, np.ndarray]] = None,
+                 max_exposure: Union[float, Dict[str, float]] = 1.0,
+                 exclude_opponents: bool = True,
+                 locked: Optional[Sequence[str]] = None,
+                 excluded: Optional[Sequence[str]] = None) -> List[Lineup]:
+        """
+        Find the best lineups under the salary cap
+
+        Args:
+            num_lineups: Number of distinct lineups to return
+            objective: 'mean', 'percentile' (uses `percentile`) or 'win_probability'
+                (share of scenarios where the lineup reaches `target`)
+            percentile: Percentile maximized by the 'percentile' objective
+            target: Score to beat for 'win_probability'; scalar or one value per scenario.
+                Defaults to the 99th percentile of the best mean lineup.
+            max_exposure: Maximum share of lineups containing a player (global or per player;
+                0 keeps a player out, any positive share allows at least one lineup)
+            exclude_opponents: Never roster both players from the same match
+            locked: Players every lineup must contain
+            excluded: Players no lineup may contain
+
+        Returns:
+            Lineups sorted by objective (best first)
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective '{objective}', expected one of {OBJECTIVES}")
+
+        locked = [self.pool.index(name) for name in (locked or [])]
+        excluded = set(excluded or [])
+        candidates = [i for i, name in enumerate(self.pool) if name not in excluded]
+
+        if objective == 'win_probability' and target is None:
+            best = self.optimize(1, 'mean', exclude_opponents=exclude_opponents,
+                                 locked=[self.pool[i] for i in locked], excluded=excluded)
+            if not best:
+                return []
+            target = float(np.percentile(self._lineup_totals(np.array([self._pool_positions(best[0])]))[0], 99))
+
+        limits = self._exposure_limits(num_lineups, max_exposure)
+        counts = np.zeros(len(self.pool), dtype=np.int64)
+        selected: List[Lineup] = []
+        seen = set()
+
+        # Each pass searches the players still under their exposure cap
+        while len(selected) < num_lineups:
+            available = [i for i in candidates if counts[i] < limits[i]]
+            if any(counts[i] >= limits[i] for i in locked) or len(available) < self.roster_size:
+                break
+
+            lineups, scores = self._search(available, locked, objective, percentile, target,
+                                           exclude_opponents, num_lineups - len(selected))
+            added = 0
+            for lineup, score in zip(lineups, scores):
+                key = tuple(sorted(lineup))
+                if key in seen or (counts[lineup] >= limits[lineup]).any():
+                    continue
+                seen.add(key)
+                counts[lineup] += 1
+                selected.append(self._to_lineup(lineup, score))
+                added += 1
+                if len(selected) >= num_lineups:
+                    break
+            if added == 0:
+                break
+
+        if len(selected) < num_lineups:
+            print(f"Warning: only {len(selected)} of {num_lineups} lineups satisfy the constraints")
+        return sorted(selected, key=lambda lineup: -lineup.objective)
+
+    def _search(self, candidates: List[int], locked: List[int], objective: str, percentile: float,
+                target: Optional[Union[float, np.ndarray]], exclude_opponents: bool,
+                num_lineups: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Best feasible lineups from the candidates, sorted by exact objective"""
+        pool = self._prune_pool(candidates, locked, objective, percentile, exclude_opponents)
+        keep = max(num_lineups * 250, self.screen_size)
+
+        # Screen every feasible lineup cheaply, then score the survivors exactly
+        best_screen = np.empty(0)
+        best_lineups = np.empty((0, self.roster_size), dtype=np.intp)
+
+        for combos in self._feasible_lineups(pool, locked, exclude_opponents):
+            best_screen = np.concatenate([best_screen, self._screen(combos, objective, percentile, target)])
+            best_lineups = np.concatenate([best_lineups, combos])
+            if len(best_screen) > keep:
+                top = np.argpartition(-best_screen, keep)[:keep]
+                best_screen, best_lineups = best_screen[top], best_lineups[top]
+
+        scores = np.concatenate([self._score(best_lineups[start:start + self.chunk_size], objective,
+                                             percentile, target)
+                                 for start in range(0, len(best_lineups), self.chunk_size)] or [np.empty(0)])
+
+        order = np.argsort(-scores, kind='stable')
+        return best_lineups[order], scores[order]
+
+    def _prune_pool(self, candidates: List[int], locked: List[int], objective: str,
+                    percentile: float, exclude_opponents: bool = True) -> np.ndarray:
+        """Drop dominated players, then keep the strongest `max_pool_size`"""
+        points = self.scenarios.points[:, self.columns[candidates]]
+        means = points.mean(axis=0)
+        upside = np.percentile(points, percentile if objective == 'percentile' else 90.0, axis=0)
+        salaries = self.salaries[candidates]
+
+        # A player is dominated when enough others are no more expensive and at least as
+        # good on both mean and upside (and strictly better somewhere) that one of them can
+        # always replace it: the other roster_size - 1 lineup members rule out at most
+        # themselves and, with the opponent rule, their opponents too. The player's own
+        # opponent never counts as a replacement under that rule.
+        no_worse = ((salaries[None, :] <= salaries[:, None]) & (means[None, :] >= means[:, None])
+                    & (upside[None, :] >= upside[:, None]))
+        strictly = ((salaries[None, :] < salaries[:, None]) | (means[None, :] > means[:, None])
+                    | (upside[None, :] > upside[:, None]))
+        dominators = no_worse & strictly
+        if exclude_opponents:
+            opponents = self.opponents[candidates]
+            dominators &= np.asarray(candidates)[None, :] != opponents[:, None]
+            dominated = dominators.sum(axis=1) >= 2 * (self.roster_size - 1) + 1
+        else:
+            dominated = dominators.sum(axis=1) >= self.roster_size
+
+        candidates = np.asarray(candidates, dtype=np.intp)
+        keep = candidates[~dominated]
+        if len(keep) > self.max_pool_size:
+            # Split the budget between raw upside and upside per $1k so value plays survive
+            metric = upside[~dominated]
+            value = metric / (salaries[~dominated] / 1000.0)
+            half = self.max_pool_size // 2
+            chosen = list(np.argsort(-metric, kind='stable')[:half])
+            for i in np.argsort(-value, kind='stable'):
+                if len(chosen) >= self.max_pool_size:
+                    break
+                if i not in chosen:
+                    chosen.append(i)
+            keep = keep[np.sort(chosen)]
+
+        return np.union1d(keep, np.asarray(locked, dtype=np.intp))
+
+    def _feasible_lineups(self, pool: np.ndarray, locked: List[int], exclude_opponents: bool):
+        """Yield chunks of salary-feasible lineups (as pool positions)"""
+        free = [i for i in pool if i not in locked]
+        slots = self.roster_size - len(locked)
+        if slots < 0:
+            raise ValueError("More locked players than roster spots")
+
+        locked_array = np.asarray(locked, dtype=np.intp)
+        combo_iter = combinations(free, slots)
+
+        while True:
+            chunk = np.array(list(islice(combo_iter, self.chunk_size)), dtype=np.intp).reshape(-1, slots)
+            if len(chunk) == 0:
+                return
+            if len(locked_array):
+                chunk = np.hstack([np.broadcast_to(locked_array, (len(chunk), len(locked_array))), chunk])
+
+            feasible = self.salaries[chunk].sum(axis=1) <= self.salary_cap
+            if exclude_opponents:
+                opponents = self.opponents[chunk]
+                feasible &= ~(chunk[:, :, None] == opponents[:, None, :]).any(axis=(1, 2))
+
+            if feasible.any():
+                yield chunk[feasible]
+
+    def _screen(self, lineups: np.ndarray, objective: str, percentile: float,
+                target: Optional[Union[float, np.ndarray]]) -> np.ndarray:
+        """Cheap objective estimate from pool means and covariance (normal approximation)"""
+        means = self.means[lineups].sum(axis=1)
+        if objective == 'mean':
+            return means
+
+        variance = self.covariance[lineups[:, :, None], lineups[:, None, :]].sum(axis=(1, 2))
+        std = np.sqrt(np.maximum(variance, 1e-12))
+        if objective == 'percentile':
+            return means + NormalDist().inv_cdf(percentile / 100.0) * std
+        return (means - float(np.mean(target))) / std
+
+    def _lineup_totals(self, lineups: np.ndarray) -> np.ndarray:
+        """Total points per scenario for each lineup, shape (n_lineups, n_simulations)"""
+        return self.engine.lineup_totals(self.columns[lineups])
+
+    def _score(self, lineups: np.ndarray, objective: str, percentile: float,
+               target: Optional[Union[float, np.ndarray]]) -> np.ndarray:
+        """Objective value of each lineup, vectorized over scenarios"""
+        if objective == 'mean':
+            return self.means[lineups].sum(axis=1)
+
+        totals = self._lineup_totals(lineups)
+        if objective == 'percentile':
+            return np.percentile(totals, percentile, axis=1)
+        return (totals >= np.asarray(target, dtype=float)).mean(axis=1)
+
+    def _exposure_limits(self, num_lineups: int, max_exposure: Union[float, Dict[str, float]]) -> np.ndarray:
+        """Maximum number of lineups each pool player may appear in"""
+        limits = np.empty(len(self.pool), dtype=np.int64)
+        for i, name in enumerate(self.pool):
+            share = max_exposure.get(name, 1.0) if isinstance(max_exposure, dict) else max_exposure
+            limits[i] = max(1, int(np.floor(share * num_lineups + 1e-9))) if share > 0 else 0
+        return limits
+
+    def _to_lineup(self, lineup: np.ndarray, score: float) -> Lineup:
+        totals = self._lineup_totals(lineup[None, :])[0]
+        order = np.argsort(-self.salaries[lineup], kind='stable')
+        return Lineup(
+            players=[self.pool[i] for i in lineup[order]],
+            salary=int(self.salaries[lineup].sum()),
+            mean_points=float(totals.mean()),
+            std_points=float(totals.std()),
+            objective=float(score)
+        )
+
+    def _pool_positions(self, lineup: Lineup) -> List[int]:
+        return [self.pool.index(name) for name in lineup.players]
@@ -0,0 +1,221 @@
+"""
+Bulk Lineup Scoring Engine
+Scores large sets of lineups against the slate scenario matrix
+
+Lineups are stored as a bit-packed (lineups x players) membership matrix (one bit
+per player, 8 bytes per lineup for a 64-player slate). Scoring unpacks one block
+of lineups at a time and multiplies it with the (players x simulations) points
+matrix, so memory is bounded by a per-block byte budget rather than the number of
+lineups: the block holds as many lineups as fit max_block_bytes at the slate's
+number of simulations.
+Showdown lineups add a captain column per lineup, whose weight becomes the
+captain multiplier in the unpacked block.
+
+Location: tennis/sim_models/main_sim/lineup_scorer.py
+"""
+
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .scenarios import ScenarioMatrix
+
+
+DEFAULT_PERCENTILES = (10.0, 25.0, 50.0, 75.0, 90.0, 99.0)
+
+# Memory for one block of lineup totals (and the working copies made from it)
+DEFAULT_MAX_BLOCK_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class LineupScores:
+    """Distribution summary for each scored lineup"""
+    mean: np.ndarray                 # (n_lineups,)
+    std: np.ndarray                  # (n_lineups,)
+    percentiles: np.ndarray          # (n_lineups, len(percentile_levels))
+    percentile_levels: Tuple[float, ...]
+    top_frequency: np.ndarray        # (n_lineups,) share of scenarios in the top `top_fraction`
+    top_fraction: float
+
+    def percentile(self, level: float) -> np.ndarray:
+        """Scores at one of the computed percentile levels"""
+        return self.percentiles[:, self.percentile_levels.index(level)]
+
+
+class LineupScoringEngine:
+    """
+    Scores millions of lineups as blocked matrix products
+
+    Usage:
+        engine = LineupScoringEngine(slate_simulator.get_scenario_matrix())
+        packed = engine.encode(lineups)           # names or column indices
+        scores = engine.score(packed)
+        best = np.argsort(-scores.mean)[:20]
+    """
+
+    def __init__(self, scenarios: ScenarioMatrix, block_size: Optional[int] = None, dtype=np.float64,
+                 max_block_bytes: int = DEFAULT_MAX_BLOCK_BYTES):
+        """
+        Args:
+            scenarios: Simulated fantasy points for the slate
+            block_size: Max lineups unpacked and scored per matrix product (default:
+                as many as fit max_block_bytes)
+            dtype: Floating type for the product (float32 halves memory and time)
+            max_block_bytes: Memory budget for one block of lineup totals
+        """
+        self.scenarios = scenarios
+        self.dtype = dtype
+        # Per lineup: its totals row plus the float64 working copy np.percentile sorts
+        # (or the partitioned copy in _top_thresholds), over every simulation
+        bytes_per_lineup = max(1, scenarios.num_simulations) * (np.dtype(dtype).itemsize + 8)
+        budget_size = max(1, max_block_bytes // bytes_per_lineup)
+        self.block_size = min(block_size, budget_size) if block_size else budget_size
+        self.num_players = scenarios.num_players
+
+        # (players x simulations) so each block is a single (block x players) @ (players x sims) product
+        self.points_by_player = np.ascontiguousarray(scenarios.points.T, dtype=dtype)
+        # (simulations x players) for the scenario-major threshold pass
+        self.points_by_scenario = np.ascontiguousarray(scenarios.points, dtype=dtype)
+
+        # Lineup mean and variance are linear/quadratic in membership: M @ mu and diag(M S M^T)
+        self.player_means = scenarios.points.mean(axis=0)
+        self.player_covariance = np.atleast_2d(np.cov(scenarios.points, rowvar=False, bias=True))
+
+    def encode(self, lineups: Union[np.ndarray, Sequence[Sequence[str]]]) -> np.ndarray:
+        """
+        Bit-pack lineups into a membership matrix
+
+        Args:
+            lineups: (n_lineups, roster_size) integer column indices (not uint8, which is
+                read as packed membership) or lists of player names
+
+        Returns:
+            uint8 array of shape (n_lineups, ceil(n_players / 8))
+        """
+        indices = self.to_indices(lineups)
+        membership = np.zeros((len(indices), self.num_players), dtype=bool)
+        membership[np.arange(len(indices))[:, None], indices] = True
+        return np.packbits(membership, axis=1)
+
+    def decode(self, packed: np.ndarray) -> np.ndarray:
+        """Unpack a membership block to a dense (n_lineups, n_players) 0/1 matrix"""
+        return np.unpackbits(packed, axis=1, count=self.num_players).astype(self.dtype)
+
+    def lineup_totals(self, lineups: Union[np.ndarray, Sequence[Sequence[str]]],
+                      captains: Optional[np.ndarray] = None, captain_multiplier: float = 1.0) -> np.ndarray:
+        """Total points per scenario, shape (n_lineups, n_simulations); use for small sets only"""
+        packed = lineups if self._is_packed(lineups) else self.encode(lineups)
+        return np.vstack([totals for _, totals in self._iter_blocks(packed, captains, captain_multiplier)] or
+                         [np.empty((0, self.scenarios.num_simulations))])
+
+    def score(self, lineups: Union[np.ndarray, Sequence[Sequence[str]]],
+              percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+              top_fraction: float = 0.01, threshold_sample: int = 200000,
+              captains: Optional[np.ndarray] = None, captain_multiplier: float = 1.0) -> LineupScores:
+        """
+        Score every lineup over every scenario
+
+        Args:
+            lineups: Packed membership matrix (from encode), column indices or name lists
+            percentiles: Percentile levels to report per lineup
+            top_fraction: A lineup is "top" in a scenario when it scores within the best
+                `top_fraction` of all scored lineups in that scenario
+            threshold_sample: Max lineups used to set the per-scenario top thresholds.
+                Exact when there are fewer lineups; otherwise an evenly spaced sample is used
+                so the running top-k stays bounded.
+            captains: Showdown captain column per lineup (the captain must also be in
+                the lineup); the captain's points count `captain_multiplier` times
+            captain_multiplier: Captain weight, e.g. 1.5 on DraftKings showdown
+        """
+        packed = lineups if self._is_packed(lineups) else self.encode(lineups)
+        num_lineups = len(packed)
+        levels = tuple(float(q) for q in percentiles)
+        if captains is not None:
+            captains = np.asarray(captains, dtype=np.intp)
+
+        # Thresholds and totals come from differently shaped products, whose last-bit rounding
+        # depends on the block size; the tolerance keeps lineups tied at the threshold counted
+        thresholds = self._top_thresholds(packed, top_fraction, threshold_sample, captains, captain_multiplier)
+        thresholds = thresholds - 1e-9 * np.abs(thresholds)
+
+        mean = np.empty(num_lineups)
+        std = np.empty(num_lineups)
+        pct = np.empty((num_lineups, len(levels)))
+        top = np.empty(num_lineups)
+
+        for start, totals in self._iter_blocks(packed, captains, captain_multiplier):
+            stop = start + len(totals)
+            membership = self._weights(packed, start, stop, captains, captain_multiplier).astype(np.float64)
+            mean[start:stop] = membership @ self.player_means
+            variance = ((membership @ self.player_covariance) * membership).sum(axis=1)
+            std[start:stop] = np.sqrt(np.maximum(variance, 0.0))
+            if levels:
+                pct[start:stop] = np.percentile(totals, levels, axis=1).T
+            top[start:stop] = (totals >= thresholds).mean(axis=1)
+
+        return LineupScores(mean=mean, std=std, percentiles=pct, percentile_levels=levels,
+                            top_frequency=top, top_fraction=top_fraction)
+
+    def _top_thresholds(self, packed: np.ndarray, top_fraction: float, threshold_sample: int,
+                        captains: Optional[np.ndarray] = None, captain_multiplier: float = 1.0) -> np.ndarray:
+        """Per-scenario score needed to be in the top `top_fraction` of lineups"""
+        if len(packed) > threshold_sample:
+            sample = np.linspace(0, len(packed) - 1, threshold_sample).astype(np.intp)
+            packed = packed[sample]
+            captains = captains[sample] if captains is not None else None
+
+        k = max(1, int(np.ceil(top_fraction * len(packed))))
+        best = None  # running (n_simulations, k) top scores, scenario-major so partitions run on rows
+        for start in range(0, len(packed), self.block_size):
+            membership = self._weights(packed, start, start + self.block_size, captains, captain_multiplier)
+            totals = self.points_by_scenario @ membership.T
+            if totals.shape[1] > k:
+                totals = np.partition(totals, totals.shape[1] - k, axis=1)[:, -k:]
+            stacked = totals if best is None else np.hstack([best, totals])
+            if stacked.shape[1] > k:
+                stacked = np.partition(stacked, stacked.shape[1] - k, axis=1)[:, -k:]
+            best = stacked
+        if best is None:
+            return np.full(self.scenarios.num_simulations, np.inf)
+        return best.min(axis=1)
+
+    def captain_totals(self, rosters: Union[np.ndarray, Sequence[Sequence[str]]],
+                       captain_multiplier: float = 1.5) -> np.ndarray:
+        """
+        Totals for every captain choice of every roster, shape (n_rosters, roster_size, n_simulations)
+
+        Entry [i, c] is roster i with its c-th player as captain: the roster total plus
+        (multiplier - 1) times the captain's points, for all scenarios at once.
+        """
+        indices = self.to_indices(rosters)
+        base = self.lineup_totals(self.encode(indices))
+        return base[:, None, :] + (captain_multiplier - 1.0) * self.points_by_player[indices]
+
+    def _weights(self, packed: np.ndarray, start: int, stop: int,
+                 captains: Optional[np.ndarray], captain_multiplier: float) -> np.ndarray:
+        """Dense lineup weights for a block: 1 per rostered player, the multiplier for captains"""
+        membership = self.decode(packed[start:stop])
+        if captains is not None:
+            block_captains = captains[start:stop]
+            membership[np.arange(len(block_captains)), block_captains] = captain_multiplier
+        return membership
+
+    def _iter_blocks(self, packed: np.ndarray, captains: Optional[np.ndarray] = None,
+                     captain_multiplier: float = 1.0) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield (offset, totals) with totals of shape (block, n_simulations)"""
+        if captains is not None:
+            captains = np.asarray(captains, dtype=np.intp)
+        for start in range(0, len(packed), self.block_size):
+            membership = self._weights(packed, start, start + self.block_size, captains, captain_multiplier)
+            yield start, membership @ self.points_by_player
+
+    def to_indices(self, lineups) -> np.ndarray:
+        """Lineups as an integer (n_lineups, roster_size) array of scenario columns"""
+        if isinstance(lineups, np.ndarray) and lineups.dtype.kind in 'iu':
+            return lineups
+        return np.array([self.scenarios.indices(names) for names in lineups], dtype=np.intp)
+
+    def _is_packed(self, lineups) -> bool:
+        return (isinstance(lineups, np.ndarray) and lineups.dtype == np.uint8
+                and lineups.ndim == 2 and lineups.shape[1] == (self.num_players + 7) // 8)
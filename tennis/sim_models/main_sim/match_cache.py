@@ -0,0 +1,124 @@
+"""
+Match Outcome Block Cache
+Per-match simulation blocks for incremental slate re-simulation
+
+Each block holds N simulated outcomes of one match and is keyed by a hash of
+(players, surface, format, simulator config, seed). Blocks are generated from
+their own derived seed, so a block does not depend on the other matches on the
+slate: after a withdrawal or a surface fix only the changed match is simulated
+again and the slate scenarios are rebuilt from cached blocks.
+
+Location: tennis/sim_models/main_sim/match_cache.py
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import random
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def match_block_key(player1: str, player2: str, surface: str, best_of_5: bool,
+                    config: Dict[str, Any], seed: int) -> str:
+    """Stable hash identifying one match's outcome block"""
+    payload = json.dumps({
+        'players': [player1, player2],
+        'surface': surface,
+        'best_of_5': bool(best_of_5),
+        'config': config,
+        'seed': seed
+    }, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def block_seed(key: str) -> int:
+    """Seed for generating a block, derived from its key"""
+    return int(key[:16], 16)
+
+
+def batch_seed(key: str, batch_index: int) -> int:
+    """Seed for the `batch_index`-th batch of a match, for runs that grow blocks in batches"""
+    digest = hashlib.blake2b(f"{key}:{batch_index}".encode('utf-8'), digest_size=8).hexdigest()
+    return int(digest, 16)
+
+
+@contextmanager
+def seeded_random(seed: int):
+    """Run with the global `random` module seeded, restoring the caller's state afterwards"""
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+class MatchBlockCache:
+    """
+    LRU cache of per-match outcome blocks, optionally persisted to a directory
+
+    A block of N outcomes also serves any request for n <= N outcomes (its prefix),
+    since outcomes are generated sequentially from the block seed.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_blocks: int = 256):
+        """
+        Args:
+            cache_dir: Directory for persisted blocks (memory only when None)
+            max_blocks: Blocks kept in memory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_blocks = max_blocks
+        self._blocks: 'OrderedDict[str, List[Any]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str, num_simulations: int) -> Optional[List[Any]]:
+        """First `num_simulations` outcomes of a cached block, or None"""
+        block = self._blocks.get(key)
+        if block is None and self.cache_dir:
+            path = self._path(key)
+            if path.exists():
+                with open(path, 'rb') as f:
+                    block = pickle.load(f)
+                self._remember(key, block)
+
+        if block is None or len(block) < num_simulations:
+            self.misses += 1
+            return None
+
+        self._blocks.move_to_end(key)
+        self.hits += 1
+        return block[:num_simulations]
+
+    def put(self, key: str, block: List[Any]):
+        """Store a block (replacing a shorter one for the same key)"""
+        self._remember(key, block)
+        if self.cache_dir:
+            fd, tmp_path = tempfile.mkstemp(prefix=f".{key}.", dir=str(self.cache_dir))
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+
+    def clear(self):
+        self._blocks.clear()
+
+    def _remember(self, key: str, block: List[Any]):
+        self._blocks[key] = block
+        self._blocks.move_to_end(key)
+        while len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def __len__(self) -> int:
+        return len(self._blocks)
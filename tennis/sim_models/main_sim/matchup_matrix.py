@@ -0,0 +1,141 @@
+"""
+Player Pool Matchup Matrix
+Pairwise ELO win probabilities and surface-weighted stat blends for a player pool
+
+The simulator looks up ELO ratings and point-level blend weights on every point.
+This precomputes, for every surface, each player's surface-weighted ELO and serve/
+return probabilities once, then every pair's ELO win probability and point blend
+in one vectorized pass, so the hot loop does array lookups instead of analyzer calls.
+
+The matrix is a snapshot: rebuild it after changing analyzer data.
+
+Location: tennis/sim_models/main_sim/matchup_matrix.py
+"""
+
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import math
+
+import numpy as np
+
+from .player_table import PlayerTable
+
+
+SURFACES = ('Hard', 'Clay', 'Grass')
+PROBABILITY_KEYS = ('ace_rate', 'double_fault_rate', 'first_serve_percentage',
+                    'service_points_won', 'return_points_won')
+
+# calculate_elo_win_probability: dampened ELO formula, clipped to [20%, 80%]
+ELO_K_FACTOR = 1000.0
+ELO_WIN_PROB_RANGE = (0.20, 0.80)
+
+# simulate_point ELO blend by absolute ELO gap: (min gap, elo weight, stats weight, random weight)
+POINT_BLEND_TIERS = (
+    (400, 0.20, 0.65, 0.15),
+    (300, 0.15, 0.50, 0.35),
+    (200, 0.35, 0.55, 0.10),
+    (100, 0.30, 0.60, 0.10),
+    (0, 0.35, 0.55, 0.10),
+)
+
+_math_pow = np.frompyfunc(math.pow, 2, 1)
+
+
+class MatchupMatrix:
+    """
+    Dense per-surface matchup data for a fixed player pool
+
+    Usage:
+        matrix = MatchupMatrix.build(simulator, players)
+        matrix.win_probability('Carlos Alcaraz', 'Damir Dzumhur', 'Clay')
+        probs = matrix.win_probability_matrix('Clay')   # (players x players)
+    """
+
+    def __init__(self, players: Sequence[str], elo: np.ndarray, probabilities: np.ndarray):
+        """
+        Args:
+            players: Player names, fixing the row/column order
+            elo: (surfaces, players) surface-weighted ELO, NaN when the player has no rating
+            probabilities: (surfaces, players, len(PROBABILITY_KEYS)) serve/return probabilities
+        """
+        self.players = list(players)
+        self.player_index = {name: i for i, name in enumerate(self.players)}
+        self.surface_index = {surface: i for i, surface in enumerate(SURFACES)}
+        self.elo = elo
+        self.probabilities = probabilities
+
+        # Pairwise pass over all surfaces at once: (surfaces, players, players)
+        row = elo[:, :, None]
+        col = elo[:, None, :]
+        self.has_elo = ~np.isnan(row) & ~np.isnan(col)
+        diff = col - row
+        # math.pow keeps results bit-identical to calculate_elo_win_probability
+        # (np.power differs in the last bit for a few percent of inputs)
+        power = _math_pow(10.0, diff / ELO_K_FACTOR).astype(float)
+        with np.errstate(invalid='ignore'):
+            win_prob = np.clip(1.0 / (1.0 + power), *ELO_WIN_PROB_RANGE)
+        self.win_probabilities = np.where(self.has_elo, win_prob, 0.5)
+
+        # simulate_point blend: elo_weight * elo_prob + stats_weight * stats_prob + random_weight * 0.5
+        gap = np.abs(np.where(self.has_elo, diff, 0.0))
+        conditions = [gap >= tier[0] for tier in POINT_BLEND_TIERS]
+        elo_weight = np.select(conditions, [tier[1] for tier in POINT_BLEND_TIERS])
+        stats_weight = np.select(conditions, [tier[2] for tier in POINT_BLEND_TIERS])
+        random_weight = np.select(conditions, [tier[3] for tier in POINT_BLEND_TIERS])
+        self.point_elo_term = elo_weight * self.win_probabilities
+        self.point_stats_weight = stats_weight
+        self.point_random_term = random_weight * 0.5
+
+    @classmethod
+    def build(cls, simulator, players: Iterable[str]) -> 'MatchupMatrix':
+        """Precompute from a FantasyTennisSimulator's analyzer data (ELO gathered from a PlayerTable)"""
+        players = list(dict.fromkeys(players))
+        # Fresh table of just this pool, so edits to the analyzer's dicts are picked up
+        table = PlayerTable.build(simulator.analyzer, players)
+        elo = np.stack([table.weighted_elo(surface) for surface in SURFACES])
+        probabilities = np.zeros((len(SURFACES), len(players), len(PROBABILITY_KEYS)))
+
+        for s, surface in enumerate(SURFACES):
+            for p, player in enumerate(players):
+                probs = simulator.compute_player_probabilities(player, surface)
+                probabilities[s, p] = [probs[key] for key in PROBABILITY_KEYS]
+
+        return cls(players, elo, probabilities)
+
+    def covers(self, surface: str, *players: str) -> bool:
+        """True when the surface and all players are in the matrix"""
+        return surface in self.surface_index and all(name in self.player_index for name in players)
+
+    def win_probability(self, player1: str, player2: str, surface: str = 'Hard') -> float:
+        """ELO win probability of player1 (as calculate_elo_win_probability)"""
+        s = self._surface(surface)
+        return float(self.win_probabilities[s, self.player_index[player1], self.player_index[player2]])
+
+    def win_probability_matrix(self, surface: str = 'Hard') -> np.ndarray:
+        """(players x players) matrix; entry [i, j] is P(player i beats player j)"""
+        return self.win_probabilities[self._surface(surface)]
+
+    def player_elo(self, player_name: str, surface: str = 'Hard') -> Optional[float]:
+        value = self.elo[self._surface(surface), self.player_index[player_name]]
+        return None if np.isnan(value) else float(value)
+
+    def player_probabilities(self, player_name: str, surface: str = 'Hard') -> Dict[str, float]:
+        """Fresh dict of surface-weighted serve/return probabilities (safe to modify)"""
+        values = self.probabilities[self._surface(surface), self.player_index[player_name]]
+        return {key: float(value) for key, value in zip(PROBABILITY_KEYS, values)}
+
+    def point_blend(self, server: str, returner: str, surface: str = 'Hard') -> Optional[Tuple[float, float, float]]:
+        """
+        (elo_term, stats_weight, random_term) with P(server wins point) =
+        elo_term + stats_weight * stats_prob + random_term, or None when either
+        player lacks an ELO rating
+        """
+        s = self._surface(surface)
+        i, j = self.player_index[server], self.player_index[returner]
+        if not self.has_elo[s, i, j]:
+            return None
+        return (float(self.point_elo_term[s, i, j]), float(self.point_stats_weight[s, i, j]),
+                float(self.point_random_term[s, i, j]))
+
+    def _surface(self, surface: str) -> int:
+        return self.surface_index[surface]
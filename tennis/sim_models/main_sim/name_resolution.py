@@ -0,0 +1,186 @@
+"""
+Player Name Resolution
+Maps DraftKings, Tennis Abstract, ELO and charting spellings of a name to one player
+
+Three layers, cheapest first:
+    1. Normalization: accents, case, punctuation and spacing are ignored
+       ("Félix Auger-Aliassime" == "felix auger aliassime")
+    2. Alias table: persistent JSON map of known alternative names
+       (data/player_aliases.json, e.g. "Alex de Minaur" -> "Alex De Minaur")
+    3. Fuzzy search: a trigram inverted index proposes the few candidates sharing
+       the most trigrams, which are then scored with difflib's ratio, so a lookup
+       never compares against every known name
+
+Location: tennis/sim_models/main_sim/name_resolution.py
+"""
+
+import json
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Container, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_ALIAS_PATH = Path("data/player_aliases.json")
+
+_PUNCTUATION = re.compile(r"[^\w\s]|_")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_name(name: str) -> str:
+    """Accent-, case- and punctuation-insensitive form of a player name"""
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return _SPACES.sub(' ', _PUNCTUATION.sub(' ', stripped.casefold())).strip()
+
+
+def name_trigrams(normalized: str) -> set:
+    """Character trigrams of a normalized name, padded so word boundaries count"""
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    Trigram inverted index over a fixed list of names
+
+    Usage:
+        index = NameIndex(all_names)
+        index.match('Mateo Gigante')           # 'Matteo Gigante'
+        index.search('gigante', limit=5)       # [(name, score), ...]
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = list(dict.fromkeys(names))
+        self.normalized = [normalize_name(name) for name in self.names]
+        self.by_normalized: Dict[str, List[str]] = defaultdict(list)
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        self.trigram_counts: List[int] = []
+
+        for i, key in enumerate(self.normalized):
+            self.by_normalized[key].append(self.names[i])
+            grams = name_trigrams(key)
+            self.trigram_counts.append(len(grams))
+            for gram in grams:
+                self.postings[gram].append(i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def exact(self, name: str) -> List[str]:
+        """Names equal to `name` after normalization"""
+        return self.by_normalized.get(normalize_name(name), [])
+
+    def candidates(self, name: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """(name position, Dice trigram overlap) of the `limit` best candidates"""
+        grams = name_trigrams(normalize_name(name))
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for i in self.postings.get(gram, ()):
+                shared[i] += 1
+        scored = [(i, 2.0 * count / (len(grams) + self.trigram_counts[i])) for i, count in shared.items()]
+        scored.sort(key=lambda item: -item[1])
+        return scored[:limit]
+
+    def search(self, name: str, limit: int = 10, min_score: float = 0.0,
+               candidates: int = 25) -> List[Tuple[str, float]]:
+        """Best matches with difflib similarity of the normalized names (1.0 = identical)"""
+        key = normalize_name(name)
+        matcher = SequenceMatcher(None, b=key)  # Caches its analysis of `key` across candidates
+        results = []
+        bound = min_score
+        for i, _ in self.candidates(name, max(limit, candidates)):
+            matcher.set_seq1(self.normalized[i])
+            if matcher.quick_ratio() < bound:
+                continue  # Cheap upper bound on ratio(): cannot make the top `limit`
+            score = matcher.ratio()
+            if score >= min_score:
+                results.append((self.names[i], score))
+                if len(results) >= limit:
+                    results.sort(key=lambda item: -item[1])
+                    bound = max(min_score, results[limit - 1][1])
+        results.sort(key=lambda item: -item[1])
+        return results[:limit]
+
+    def match(self, name: str, threshold: float = 0.7) -> Optional[str]:
+        """Best match scoring at least `threshold`, or None"""
+        exact = self.exact(name)
+        if exact:
+            return exact[0]
+        best = self.search(name, limit=1, min_score=threshold)
+        return best[0][0] if best else None
+
+
+class AliasTable:
+    """Persistent alias -> canonical name map (keys compared after normalization)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or DEFAULT_ALIAS_PATH)
+        self.aliases: Dict[str, str] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for alias, canonical in json.load(f).items():
+                        self.aliases[alias] = canonical
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"Warning: Could not load player aliases from {self.path}: {e}")
+        self._normalized = {normalize_name(alias): canonical for alias, canonical in self.aliases.items()}
+
+    def __len__(self) -> int:
+        return len(self.aliases)
+
+    def get(self, name: str) -> Optional[str]:
+        return self._normalized.get(normalize_name(name))
+
+    def add(self, alias: str, canonical: str, save: bool = True):
+        self.aliases[alias] = canonical
+        self._normalized[normalize_name(alias)] = canonical
+        if save:
+            self.save()
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(self.aliases.items())), f, indent=2, ensure_ascii=False)
+
+
+class NameResolver:
+    """
+    Resolves names against the analyzer's data dicts
+
+    A normalized name can have several spellings in the data (the ELO files and
+    the stats files do not always agree), so resolution picks the spelling that
+    is present in the dict being read.
+    """
+
+    def __init__(self, names: Iterable[str], aliases: Optional[AliasTable] = None):
+        self.index = NameIndex(names)
+        self.aliases = aliases if aliases is not None else AliasTable()
+        self._spellings: Dict[str, List[str]] = {}
+
+    def spellings(self, name: str) -> List[str]:
+        """Known spellings of `name`: normalized matches, then the alias target's"""
+        cached = self._spellings.get(name)
+        if cached is None:
+            cached = list(self.index.exact(name))
+            canonical = self.aliases.get(name)
+            if canonical:
+                cached += [s for s in [canonical] + self.index.exact(canonical) if s not in cached]
+            self._spellings[name] = cached
+        return cached
+
+    def resolve(self, name: str, within: Optional[Container[str]] = None) -> Optional[str]:
+        """Spelling of `name` present in `within` (any known spelling when None), or None"""
+        for spelling in self.spellings(name):
+            if within is None or spelling in within:
+                return spelling
+        return None
+
+    def match(self, name: str, threshold: float = 0.7) -> Optional[str]:
+        """Exact, alias or fuzzy match"""
+        return self.resolve(name) or self.index.match(name, threshold)
+
+    def add_alias(self, alias: str, canonical: str, save: bool = True):
+        self.aliases.add(alias, canonical, save)
+        self._spellings.clear()
@@ -0,0 +1,113 @@
+"""
+Player Database Snapshot
+Single binary file holding everything TennisStatsAnalyzer loads at startup
+
+Parsing the ELO TSVs, factor JSONs and the fallback chain of stats JSONs takes
+seconds; unpickling the resulting dicts takes milliseconds. The snapshot records
+the size and modification time of every source file the analyzer may read (or
+that the file is missing, since the stats fallback depends on which files exist),
+and is ignored as soon as any of them changes. Analyzers with the time-weighted
+overlay enabled keep their own snapshot, since their stats differ.
+
+Location: tennis/sim_models/main_sim/player_snapshot.py
+"""
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SNAPSHOT_VERSION = 5  # 5: time-weighted overlay is opt-in and recorded in the snapshot
+DEFAULT_SNAPSHOT_PATH = Path("data/cache/player_database.pkl")
+TIME_WEIGHTED_SNAPSHOT_PATH = Path("data/cache/player_database_time_weighted.pkl")
+
+# Every file TennisStatsAnalyzer._load_all() may read, relative to the working directory
+SNAPSHOT_SOURCES = (
+    "data/elo/atp.csv",
+    "data/elo/wta.csv",
+    "data/exploratory/clutch_factor_analysis.json",
+    "data/exploratory/player_variance_profiles.json",
+    "data/exploratory/momentum_endurance_analysis.json",
+    "data/player_stats_with_momentum_endurance.json",
+    "data/player_stats_with_clutch_factors.json",
+    "data/processed/player_stats.json",
+    "data/processed/time_weighted_player_stats.json",
+    "data/exploratory/calculated_player_stats.json",
+    "data/calculated_player_stats.json",
+    "data/wta.csv",
+    "data/atp.csv",
+    "data/charting-m-matches(1).csv",
+    "data/charting-w-matches.csv",
+)
+
+# Analyzer attributes restored from the snapshot
+SNAPSHOT_ATTRIBUTES = (
+    'player_stats', 'player_rankings', 'player_countries', 'calculated_stats',
+    'elo_ratings', 'surface_elo_ratings', 'clutch_factors', 'variance_factors',
+    'endurance_factors', 'rally_factors', 'surface_variance', 'stats_source',
+)
+
+
+def source_fingerprint(data_source: Optional[str] = None) -> List[List[Any]]:
+    """[path, size, mtime_ns] per source file (size and mtime None when missing)"""
+    paths = list(SNAPSHOT_SOURCES) + ([data_source] if data_source else [])
+    fingerprint = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            fingerprint.append([path, stat.st_size, stat.st_mtime_ns])
+        except OSError:
+            fingerprint.append([path, None, None])
+    return fingerprint
+
+
+def save_snapshot(state: Dict[str, Any], data_source: Optional[str] = None,
+                  path: Optional[str] = None, time_weighted_stats: bool = False) -> Path:
+    """Write analyzer state atomically (temp file + rename), so concurrent readers never see a partial file"""
+    path = Path(path or DEFAULT_SNAPSHOT_PATH)
+    payload = {
+        'version': SNAPSHOT_VERSION,
+        'fingerprint': source_fingerprint(data_source),
+        'time_weighted_stats': time_weighted_stats,
+        'state': {name: state[name] for name in SNAPSHOT_ATTRIBUTES}
+    }
+    return write_atomic(path, pickle.dumps(payload, protocol=5))
+
+
+def write_atomic(path, data: bytes) -> Path:
+    """Replace `path` with `data` via a temp file + rename in the same directory"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def load_snapshot(data_source: Optional[str] = None, path: Optional[str] = None,
+                  time_weighted_stats: bool = False) -> Optional[Dict[str, Any]]:
+    """Analyzer state from the snapshot, or None when it is missing, unreadable, stale or built
+    with the other time-weighted setting"""
+    path = Path(path or DEFAULT_SNAPSHOT_PATH)
+    try:
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable player database snapshot {path}: {e}")
+        return None
+
+    if payload.get('version') != SNAPSHOT_VERSION:
+        return None
+    if payload.get('fingerprint') != source_fingerprint(data_source):
+        return None
+    if payload.get('time_weighted_stats') != time_weighted_stats:
+        return None
+    return payload['state']
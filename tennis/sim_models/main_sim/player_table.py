@@ -0,0 +1,149 @@
+"""
+Columnar Player Table
+Analyzer player data as NumPy columns indexed by interned integer player ids
+
+Per-player dicts cost several hash lookups and `.get` defaults per access. The
+table stores each stat as one float64 column (NaN where the player has no value)
+so a batch engine can gather any set of players and stats with one fancy-indexing
+operation, e.g. table.gather(ids, ['ace_rate', 'elo_clay']).
+
+The table is a snapshot of the analyzer data it was built from.
+
+Location: tennis/sim_models/main_sim/player_table.py
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+SURFACES = ('Hard', 'Clay', 'Grass')
+
+# Baseline serve/return stats from calculated_stats
+STAT_COLUMNS = ('ace_rate', 'double_fault_rate', 'first_serve_percentage',
+                'service_points_won', 'return_points_won', 'matches')
+
+# Factor columns: (column, analyzer dict, value key, default as in the analyzer getters)
+FACTOR_COLUMNS = (
+    ('clutch_factor', 'clutch_factors', 'multiplier', 1.0),
+    ('variance_factor', 'variance_factors', 'multiplier', 0.15),
+    ('rally_factor', 'rally_factors', 'multiplier', 1.0),
+    ('endurance_factor', 'endurance_factors', 'factor', 1.0),
+)
+
+
+class PlayerTable:
+    """
+    Column-per-stat player data with name <-> id interning
+
+    Usage:
+        table = analyzer.player_table
+        ids = table.ids(['Carlos Alcaraz', 'Ben Shelton'])
+        serve = table.gather(ids, ['service_points_won', 'ace_rate'])   # (2, 2)
+        elo = table.weighted_elo('Clay', ids)
+    """
+
+    def __init__(self, names: Sequence[str], columns: Dict[str, np.ndarray]):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.columns = columns
+
+    @classmethod
+    def build(cls, analyzer, players: Optional[Iterable[str]] = None) -> 'PlayerTable':
+        """Table of `players` (default: every player known to the analyzer)"""
+        if players is None:
+            names = dict.fromkeys(analyzer.calculated_stats)
+            names.update(dict.fromkeys(analyzer.elo_ratings))
+            for _, source, _, _ in FACTOR_COLUMNS:
+                names.update(dict.fromkeys(getattr(analyzer, source, {})))
+            players = names
+        names = list(dict.fromkeys(players))
+        n = len(names)
+
+        columns = {name: np.full(n, np.nan) for name in STAT_COLUMNS}
+        columns['elo'] = np.full(n, np.nan)
+        for surface in SURFACES:
+            columns[f'elo_{surface.lower()}'] = np.full(n, np.nan)
+            columns[f'surface_weight_{surface.lower()}'] = np.full(n, np.nan)
+        for column, _, _, default in FACTOR_COLUMNS:
+            columns[column] = np.full(n, default)
+
+        surface_elo = getattr(analyzer, 'surface_elo_ratings', {})
+        for i, name in enumerate(names):
+            # Each source may spell the name differently (see TennisStatsAnalyzer.resolve_player_name)
+            stats = analyzer.calculated_stats.get(analyzer.resolve_player_name(name, analyzer.calculated_stats))
+            elo_name = analyzer.resolve_player_name(name, analyzer.elo_ratings)
+            if stats:
+                for column in STAT_COLUMNS:
+                    value = stats.get(column)
+                    if isinstance(value, (int, float)):
+                        columns[column][i] = value
+                for surface in SURFACES:
+                    columns[f'surface_weight_{surface.lower()}'][i] = _surface_weight(stats, surface)
+
+            # Zero ratings count as missing, as in TennisStatsAnalyzer.get_player_elo
+            overall = analyzer.elo_ratings.get(elo_name)
+            if overall:
+                columns['elo'][i] = overall
+            for surface in SURFACES:
+                rating = surface_elo.get(surface, {}).get(elo_name)
+                if rating:
+                    columns[f'elo_{surface.lower()}'][i] = rating
+
+            for column, source, key, _ in FACTOR_COLUMNS:
+                entry = getattr(analyzer, source, {}).get(name)
+                if entry is not None:
+                    columns[column][i] = entry[key]
+
+        return cls(names, columns)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, player_name: str) -> bool:
+        return player_name in self.index
+
+    def id(self, player_name: str) -> int:
+        """Interned id of a player (KeyError when unknown)"""
+        return self.index[player_name]
+
+    def ids(self, player_names: Iterable[str], missing: Optional[int] = None) -> np.ndarray:
+        """Ids for a list of names; unknown names raise KeyError unless `missing` (e.g. -1) is given"""
+        if missing is None:
+            return np.array([self.index[name] for name in player_names], dtype=np.intp)
+        return np.array([self.index.get(name, missing) for name in player_names], dtype=np.intp)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def gather(self, ids: np.ndarray, columns: Sequence[str]) -> np.ndarray:
+        """(len(ids), len(columns)) values for the given player ids"""
+        return np.column_stack([self.columns[name][ids] for name in columns])
+
+    def weighted_elo(self, surface: str, ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Surface-weighted ELO as TennisStatsAnalyzer.get_player_elo(name, surface), NaN
+        where that returns None; vectorized over players
+        """
+        ids = slice(None) if ids is None else ids
+        overall = self.columns['elo'][ids]
+        key = surface.lower()
+        if f'elo_{key}' not in self.columns:
+            return overall.copy()
+        surface_elo = self.columns[f'elo_{key}'][ids]
+        weight = self.columns[f'surface_weight_{key}'][ids]
+
+        weighted = (weight * surface_elo) + ((1 - weight) * overall)
+        weighted = np.where(np.isnan(weight), surface_elo, weighted)
+        return np.where(np.isnan(surface_elo), overall, weighted)
+
+
+def _surface_weight(stats: Dict, surface: str) -> float:
+    """Experience-based surface weight used by the analyzer's surface weighting"""
+    surface_pct = stats.get('surface_preferences', {}).get(surface, 0.33)
+    surface_matches = int(stats.get('matches', 0) * surface_pct)
+    if surface_matches < 5:
+        return 0.3
+    elif surface_matches < 10:
+        return 0.5
+    return 0.7
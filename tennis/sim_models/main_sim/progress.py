@@ -0,0 +1,123 @@
+"""
+Simulation Progress Events
+Structured progress and throughput reporting for long simulation loops
+
+Loops report completed work to a ProgressTracker, which emits a ProgressEvent to
+a callback every `every` simulations (and once at the end). Callbacks can drive
+dashboards or schedulers; returning False from a callback stops the run.
+
+Location: tennis/sim_models/main_sim/progress.py
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+@dataclass
+class ProgressEvent:
+    """Snapshot of a running simulation loop"""
+    completed: int
+    total: Optional[int]
+    elapsed_seconds: float
+    sims_per_second: float
+    mean_match_latency_ms: float    # mean wall time per simulated match
+    eta_seconds: Optional[float]
+    worker_utilization: float       # time spent simulating / (elapsed * workers)
+    workers: int = 1
+    label: str = ""
+    done: bool = False
+
+    @property
+    def fraction(self) -> Optional[float]:
+        return self.completed / self.total if self.total else None
+
+
+ProgressCallback = Callable[[ProgressEvent], Any]
+
+
+def print_progress(event: ProgressEvent):
+    """Default callback used by verbose runs"""
+    if not event.done:
+        print(f"   Completed {event.completed}/{event.total} simulations... "
+              f"({event.sims_per_second:.1f} sims/sec)")
+
+
+class ProgressTracker:
+    """
+    Accumulates timings and emits ProgressEvents on a fixed cadence
+
+    Usage:
+        tracker = ProgressTracker(total=1000, callback=on_progress, every=10)
+        for i in range(1000):
+            started = time.perf_counter()
+            run_one_slate()
+            if not tracker.step(matches=8, busy_seconds=time.perf_counter() - started):
+                break
+        tracker.finish()
+    """
+
+    def __init__(self, total: Optional[int], callback: Optional[ProgressCallback] = None,
+                 every: int = 10, workers: int = 1, label: str = "", start_at: int = 0):
+        """
+        Args:
+            total: Simulations expected (None when unbounded, e.g. deadline runs)
+            callback: Receives each ProgressEvent; returning False requests a stop
+            every: Simulations between events
+            workers: Workers sharing the load, for utilization
+            label: Name of the run, copied into every event
+            start_at: Simulations already completed (resumed runs)
+        """
+        self.total = total
+        self.callback = callback
+        self.every = max(1, every)
+        self.workers = workers
+        self.label = label
+        self.start_at = start_at
+
+        self.completed = start_at
+        self.matches = 0
+        self.busy_seconds = 0.0
+        self.started = time.perf_counter()
+
+    def step(self, count: int = 1, matches: int = 0, busy_seconds: float = 0.0) -> bool:
+        """
+        Record finished simulations; returns False if the callback asked to stop
+        """
+        before = self.completed
+        self.completed += count
+        self.matches += matches
+        self.busy_seconds += busy_seconds
+
+        if self.callback is None or self.completed // self.every == before // self.every:
+            return True
+        return self.callback(self.event()) is not False
+
+    def finish(self) -> ProgressEvent:
+        """Emit the final event"""
+        event = self.event(done=True)
+        if self.callback is not None:
+            self.callback(event)
+        return event
+
+    def event(self, done: bool = False) -> ProgressEvent:
+        elapsed = time.perf_counter() - self.started
+        run = self.completed - self.start_at
+        rate = run / elapsed if elapsed > 0 else 0.0
+
+        eta = None
+        if self.total is not None and rate > 0:
+            eta = max(0, self.total - self.completed) / rate
+
+        return ProgressEvent(
+            completed=self.completed,
+            total=self.total,
+            elapsed_seconds=elapsed,
+            sims_per_second=rate,
+            mean_match_latency_ms=1000.0 * self.busy_seconds / self.matches if self.matches else 0.0,
+            eta_seconds=eta,
+            worker_utilization=min(1.0, self.busy_seconds / (elapsed * self.workers)) if elapsed > 0 else 0.0,
+            workers=self.workers,
+            label=self.label,
+            done=done
+        )
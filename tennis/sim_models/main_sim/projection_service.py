@@ -0,0 +1,189 @@
+"""
+Slate Projection Service
+Salary-aware player projections for lineup tools, with an LRU result cache
+
+Requests for the same slate (matches, surface, salaries) and configuration return
+the cached projections immediately. Keys include the analyzer's data_version and
+cache_version (after checking for stats edited in place), so entries computed
+before a player database reload or a player edit are never served.
+
+Location: tennis/sim_models/main_sim/projection_service.py
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .slate_simulator import TennisSlateSimulator, Match
+from .slate_loader import extract_matches, get_salary_map
+from .scenarios import ScenarioMatrix, SCENARIO_STATS
+
+
+DEFAULT_PROJECTION_PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+
+@dataclass
+class PlayerProjection:
+    """Simulated projection for one player"""
+    name: str
+    opponent: str
+    salary: Optional[int]
+    mean_fantasy_points: float
+    std_fantasy_points: float
+    percentiles: Dict[int, float]
+    value: Optional[float]       # mean fantasy points per $1k of salary
+    win_probability: float
+
+
+@dataclass
+class SlateProjections:
+    """Projections and correlations for a slate (shared between callers; treat as read-only)"""
+    players: Dict[str, PlayerProjection]
+    player_order: List[str]
+    correlations: np.ndarray     # (players x players), order of player_order
+    scenarios: ScenarioMatrix
+    num_simulations: int
+    data_version: int
+    cache_version: int
+    cache_key: str
+
+    def correlation(self, player1: str, player2: str) -> float:
+        index = self.scenarios.player_index
+        return float(self.correlations[index[player1], index[player2]])
+
+    def by_value(self) -> List[PlayerProjection]:
+        """Players sorted by points per $1k, best first"""
+        return sorted(self.players.values(), key=lambda p: p.value or 0.0, reverse=True)
+
+
+class ProjectionService:
+    """
+    Projection requests from lineup tools, cached by slate content and config
+
+    Usage:
+        service = ProjectionService(TennisSlateSimulator(seed=42))
+        projections = service.project_slate(load_slate_file('data/processed/player_pool.json'))
+        projections.players['Carlos Alcaraz'].value
+    """
+
+    def __init__(self, slate_simulator: Optional[TennisSlateSimulator] = None, num_simulations: int = 1000,
+                 percentiles: Sequence[int] = DEFAULT_PROJECTION_PERCENTILES, max_entries: int = 32):
+        """
+        Args:
+            slate_simulator: Simulator used for cache misses (its match block cache is reused,
+                so a slate differing by one match only simulates that match)
+            num_simulations: Default simulations per slate
+            percentiles: Percentiles reported per player
+            max_entries: Slates kept in the LRU cache
+        """
+        self.slate_simulator = slate_simulator or TennisSlateSimulator()
+        self.num_simulations = num_simulations
+        self.percentiles = tuple(int(q) for q in percentiles)
+        self.max_entries = max_entries
+        self._cache: 'OrderedDict[str, SlateProjections]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def data_version(self) -> int:
+        return self.slate_simulator.simulator.data_version
+
+    @property
+    def cache_version(self) -> int:
+        return self.slate_simulator.simulator.cache_version
+
+    def project_slate(self, slate_data: Dict[str, Any], num_simulations: Optional[int] = None) -> SlateProjections:
+        """Projections for a slate file dict ({"surface", "players": [{name, opponent, salary}]})"""
+        return self.project(extract_matches(slate_data), get_salary_map(slate_data), num_simulations)
+
+    def project(self, matches: List[Match], salaries: Dict[str, int],
+                num_simulations: Optional[int] = None) -> SlateProjections:
+        """Projections, percentiles, value and correlations for a slate"""
+        num_simulations = num_simulations or self.num_simulations
+        self.slate_simulator.simulator.analyzer.check_player_edits()  # In-place edits bump cache_version
+        self._evict_stale()
+        key = self.cache_key(matches, salaries, num_simulations)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        projections = self._compute(matches, salaries, num_simulations, key)
+        self._cache[key] = projections
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return projections
+
+    def cache_key(self, matches: List[Match], salaries: Dict[str, int], num_simulations: int) -> str:
+        """Hash of slate content (matches, surfaces, salaries) and simulation config"""
+        simulator = self.slate_simulator
+        payload = json.dumps({
+            'matches': sorted(json.dumps(asdict(m), sort_keys=True) for m in matches),
+            'salaries': salaries,
+            'num_simulations': num_simulations,
+            'percentiles': self.percentiles,
+            'seed': simulator.seed,
+            'data_source': simulator.data_source,
+            'data_version': self.data_version,
+            'cache_version': self.cache_version,
+            'surface_adjustments': simulator.simulator.surface_adjustments
+        }, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def invalidate(self):
+        """Drop every cached slate"""
+        self._cache.clear()
+
+    def reload_data(self):
+        """Reload the player database; cached projections are invalidated"""
+        self.slate_simulator.simulator.reload_data()
+        self._evict_stale()
+
+    def _evict_stale(self):
+        version = (self.data_version, self.cache_version)
+        for key in [k for k, entry in self._cache.items()
+                    if (entry.data_version, entry.cache_version) != version]:
+            del self._cache[key]
+
+    def _compute(self, matches: List[Match], salaries: Dict[str, int], num_simulations: int,
+                 key: str) -> SlateProjections:
+        simulations = self.slate_simulator.resimulate_slate(matches, num_simulations, verbose=False)
+        scenarios = ScenarioMatrix.from_simulations(simulations)
+
+        points = scenarios.points
+        means = points.mean(axis=0)
+        stds = points.std(axis=0, ddof=1) if num_simulations > 1 else np.zeros(len(means))
+        pct = np.percentile(points, self.percentiles, axis=0)
+        wins = scenarios.stats[:, :, SCENARIO_STATS.index('won')].mean(axis=0)
+
+        players = {}
+        for i, name in enumerate(scenarios.players):
+            salary = salaries.get(name)
+            players[name] = PlayerProjection(
+                name=name,
+                opponent=scenarios.opponents.get(name, ''),
+                salary=salary,
+                mean_fantasy_points=float(means[i]),
+                std_fantasy_points=float(stds[i]),
+                percentiles={q: float(pct[j, i]) for j, q in enumerate(self.percentiles)},
+                value=float(means[i] / salary * 1000.0) if salary else None,
+                win_probability=float(wins[i])
+            )
+
+        return SlateProjections(
+            players=players,
+            player_order=list(scenarios.players),
+            correlations=self.slate_simulator.covariance.correlation(),
+            scenarios=scenarios,
+            num_simulations=num_simulations,
+            data_version=self.data_version,
+            cache_version=self.cache_version,
+            cache_key=key
+        )
@@ -0,0 +1,243 @@
+"""
+Streaming Slate Result Writer
+Writes slate simulation results to columnar files while the simulation runs
+
+Parquet (via pyarrow) is used when available. Otherwise results are written to a
+compact binary format (.slr) made of length-prefixed row groups, which can be read
+back with column projection without parsing the whole file.
+
+Location: tennis/sim_models/main_sim/result_writer.py
+"""
+
+import importlib.util
+import json
+import struct
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# pyarrow is imported on first parquet use; it is slow to import and most runs never need it
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+
+FORMAT_VERSION = 1
+BINARY_MAGIC = b"SLRS"
+BINARY_EXTENSION = ".slr"
+PARQUET_EXTENSION = ".parquet"
+
+# Column kinds -> array typecodes for the binary fallback
+_ARRAY_TYPECODES = {int: 'q', float: 'd', bool: 'b'}
+
+
+class ColumnarResultWriter:
+    """
+    Buffers result rows column by column and flushes them as row groups.
+
+    Usage:
+        with ColumnarResultWriter("sims", columns, metadata={'seed': 42}) as writer:
+            writer.write_row({...})
+    """
+
+    def __init__(self, filename: str, columns: Sequence[Tuple[str, type]],
+                 metadata: Optional[Dict[str, Any]] = None, format: str = 'auto',
+                 row_group_size: int = 10000):
+        """
+        Args:
+            filename: Output path (extension is added if missing)
+            columns: Ordered (name, type) pairs, type is one of str, int, float, bool
+            metadata: JSON-serializable run metadata (config, seed, ...)
+            format: 'parquet', 'binary' or 'auto' (parquet when pyarrow is installed)
+            row_group_size: Rows buffered before a row group is flushed to disk
+        """
+        if format == 'auto':
+            format = 'parquet' if PYARROW_AVAILABLE else 'binary'
+        if format == 'parquet' and not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for parquet output (use format='binary')")
+        if format not in ('parquet', 'binary'):
+            raise ValueError(f"Unknown result format: {format}")
+
+        self.format = format
+        self.columns = list(columns)
+        self.row_group_size = max(1, row_group_size)
+        self.rows_written = 0
+        self.row_groups_written = 0
+        self.metadata = {
+            'format_version': FORMAT_VERSION,
+            'created': datetime.now().isoformat(),
+            'columns': [[name, kind.__name__] for name, kind in self.columns],
+            **(metadata or {})
+        }
+
+        extension = PARQUET_EXTENSION if format == 'parquet' else BINARY_EXTENSION
+        path = Path(filename)
+        self.filepath = str(path if path.suffix == extension else path.with_name(path.name + extension))
+
+        self._buffer: Dict[str, list] = {name: [] for name, _ in self.columns}
+        self._buffered_rows = 0
+        self._closed = False
+
+        if format == 'parquet':
+            pa, pq = _pyarrow()
+            arrow_types = {str: pa.string(), int: pa.int64(), float: pa.float64(), bool: pa.bool_()}
+            schema = pa.schema([(name, arrow_types[kind]) for name, kind in self.columns])
+            self._schema = schema.with_metadata({b'slate_metadata': json.dumps(self.metadata).encode()})
+            self._parquet_writer = pq.ParquetWriter(self.filepath, self._schema)
+        else:
+            self._file = open(self.filepath, 'wb')
+            header = json.dumps(self.metadata).encode()
+            self._file.write(BINARY_MAGIC)
+            self._file.write(struct.pack('<I', len(header)))
+            self._file.write(header)
+
+    def write_row(self, row: Dict[str, Any]):
+        """Buffer one row, flushing a row group when the buffer is full."""
+        for name, _ in self.columns:
+            self._buffer[name].append(row[name])
+        self._buffered_rows += 1
+
+        if self._buffered_rows >= self.row_group_size:
+            self.flush()
+
+    def write_rows(self, rows: List[Dict[str, Any]]):
+        """Buffer several rows."""
+        for row in rows:
+            self.write_row(row)
+
+    def flush(self):
+        """Write buffered rows to disk as one row group."""
+        if self._buffered_rows == 0:
+            return
+
+        if self.format == 'parquet':
+            table = _pyarrow()[0].Table.from_pydict(self._buffer, schema=self._schema)
+            self._parquet_writer.write_table(table)
+        else:
+            self._write_binary_row_group()
+
+        self.rows_written += self._buffered_rows
+        self.row_groups_written += 1
+        self._buffer = {name: [] for name, _ in self.columns}
+        self._buffered_rows = 0
+
+    def _write_binary_row_group(self):
+        """Encode the buffer as one length-prefixed binary row group."""
+        column_headers = []
+        payloads = []
+
+        for name, kind in self.columns:
+            values = self._buffer[name]
+            if kind is str:
+                # Dictionary-encode strings: unique values in the header, int32 codes in the body
+                dictionary: Dict[str, int] = {}
+                codes = array('i', (dictionary.setdefault(v, len(dictionary)) for v in values))
+                column_headers.append({'name': name, 'dtype': 'i4', 'dictionary': list(dictionary),
+                                       'nbytes': len(codes) * codes.itemsize})
+                payloads.append(codes.tobytes())
+            else:
+                typecode = _ARRAY_TYPECODES[kind]
+                data = array(typecode, values)
+                column_headers.append({'name': name, 'dtype': f"{'f' if kind is float else 'i'}{data.itemsize}",
+                                       'nbytes': len(data) * data.itemsize})
+                payloads.append(data.tobytes())
+
+        group_header = json.dumps({'num_rows': self._buffered_rows, 'columns': column_headers}).encode()
+        self._file.write(struct.pack('<I', len(group_header)))
+        self._file.write(group_header)
+        for payload in payloads:
+            self._file.write(payload)
+        self._file.flush()
+
+    def close(self) -> str:
+        """Flush remaining rows and close the file."""
+        if self._closed:
+            return self.filepath
+
+        self.flush()
+        if self.format == 'parquet':
+            self._parquet_writer.close()
+        else:
+            self._file.close()
+        self._closed = True
+        return self.filepath
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _pyarrow():
+    """(pyarrow, pyarrow.parquet), imported on first use"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    return pa, pq
+
+
+def read_result_metadata(filepath: str) -> Dict[str, Any]:
+    """Read the run metadata (config, seed, columns) stored with a results file."""
+    if filepath.endswith(PARQUET_EXTENSION):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required to read parquet results")
+        schema = _pyarrow()[1].read_schema(filepath)
+        return json.loads(schema.metadata[b'slate_metadata'])
+
+    with open(filepath, 'rb') as f:
+        if f.read(4) != BINARY_MAGIC:
+            raise ValueError(f"Not a slate results file: {filepath}")
+        (header_len,) = struct.unpack('<I', f.read(4))
+        return json.loads(f.read(header_len))
+
+
+def read_results(filepath: str, columns: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Load a results file as a dict of NumPy arrays.
+
+    Args:
+        filepath: Path to a .parquet or .slr file written by ColumnarResultWriter
+        columns: Optional subset of columns to load (others are skipped on disk)
+
+    Returns:
+        Dict mapping column name to a NumPy array
+    """
+    import numpy as np
+
+    if filepath.endswith(PARQUET_EXTENSION):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required to read parquet results")
+        table = _pyarrow()[1].read_table(filepath, columns=columns)
+        return {name: table.column(name).to_numpy(zero_copy_only=False) for name in table.column_names}
+
+    metadata = read_result_metadata(filepath)
+    wanted = [name for name, _ in metadata['columns'] if columns is None or name in columns]
+    chunks: Dict[str, list] = {name: [] for name in wanted}
+
+    with open(filepath, 'rb') as f:
+        f.seek(8 + struct.unpack('<I', _read_at(f, 4, 4))[0])
+        while True:
+            size_bytes = f.read(4)
+            if len(size_bytes) < 4:
+                break
+            (group_header_len,) = struct.unpack('<I', size_bytes)
+            group = json.loads(f.read(group_header_len))
+
+            for column in group['columns']:
+                if column['name'] not in chunks:
+                    f.seek(column['nbytes'], 1)
+                    continue
+                values = np.frombuffer(f.read(column['nbytes']), dtype='<' + column['dtype'])
+                if 'dictionary' in column:
+                    values = np.asarray(column['dictionary'], dtype=object)[values]
+                chunks[column['name']].append(values)
+
+    return {name: (np.concatenate(parts) if parts else np.array([])) for name, parts in chunks.items()}
+
+
+def _read_at(f, offset: int, size: int) -> bytes:
+    """Read `size` bytes at `offset` without disturbing the caller's position."""
+    position = f.tell()
+    f.seek(offset)
+    data = f.read(size)
+    f.seek(position)
+    return data
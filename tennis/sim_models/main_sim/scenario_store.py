@@ -0,0 +1,191 @@
+"""
+Memory-Mapped Scenario Store
+Shared on-disk scenario matrix for the optimizer, contest simulator and notebooks
+
+The simulator appends one row per simulated slate; consumers open the same file
+read-only and see every row appended so far, without copying or re-parsing.
+
+File layout:
+    bytes 0-3     magic b'SCNS'
+    bytes 4-7     format version (uint32)
+    bytes 8-15    completed simulation count (uint64, updated after each row)
+    bytes 16-19   JSON header length (uint32)
+    bytes 20-     JSON header: players, opponents, stats, capacity, metadata
+    DATA_ALIGN    points  float64 (capacity, n_players)
+    ...           stats   float64 (capacity, n_players, n_stats), when stats are stored
+
+Location: tennis/sim_models/main_sim/scenario_store.py
+"""
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .scenarios import ScenarioMatrix, SCENARIO_STATS, fill_scenario_row
+
+
+STORE_MAGIC = b'SCNS'
+STORE_VERSION = 1
+COUNT_OFFSET = 8
+HEADER_PREFIX = struct.Struct('<4sIQI')
+DATA_ALIGN = 4096
+
+
+class ScenarioStore:
+    """
+    Fixed-capacity, append-only scenario matrix backed by np.memmap
+
+    Usage:
+        store = ScenarioStore.create('scenarios.scn', players, capacity=10000, opponents=opponents)
+        simulator.simulate_multiple_slates(matches, 10000, scenario_store=store)
+
+        # in another process, while the run is going
+        scenarios = ScenarioStore.open('scenarios.scn').to_scenario_matrix()
+    """
+
+    def __init__(self, filepath: str, mode: str = 'r'):
+        """Open an existing store ('r' read-only, 'r+' to append); see create() for new files"""
+        self.filepath = Path(filepath)
+        self.mode = mode
+
+        with open(self.filepath, 'rb') as f:
+            magic, version, _, header_len = HEADER_PREFIX.unpack(f.read(HEADER_PREFIX.size))
+            if magic != STORE_MAGIC:
+                raise ValueError(f"Not a scenario store: {filepath}")
+            if version != STORE_VERSION:
+                raise ValueError(f"Unsupported scenario store version {version}")
+            header = json.loads(f.read(header_len).decode('utf-8'))
+
+        self.players: List[str] = header['players']
+        self.opponents: Dict[str, str] = header['opponents']
+        self.stat_names: List[str] = header['stats']
+        self.capacity: int = header['capacity']
+        self.metadata: Dict[str, Any] = header['metadata']
+        self.player_index = {name: i for i, name in enumerate(self.players)}
+
+        num_players = len(self.players)
+        data_offset = _data_offset(HEADER_PREFIX.size + header_len)
+        self._count = np.memmap(self.filepath, dtype='<u8', mode=mode, offset=COUNT_OFFSET, shape=(1,))
+        self._points = np.memmap(self.filepath, dtype='<f8', mode=mode, offset=data_offset,
+                                 shape=(self.capacity, num_players))
+        self._stats = None
+        if self.stat_names:
+            stats_offset = data_offset + self._points.nbytes
+            self._stats = np.memmap(self.filepath, dtype='<f8', mode=mode, offset=stats_offset,
+                                    shape=(self.capacity, num_players, len(self.stat_names)))
+
+    @classmethod
+    def create(cls, filepath: str, players: Sequence[str], capacity: int,
+               opponents: Optional[Dict[str, str]] = None, include_stats: bool = True,
+               metadata: Optional[Dict[str, Any]] = None) -> 'ScenarioStore':
+        """Create (or overwrite) a store sized for `capacity` simulations, opened for appending"""
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        header = json.dumps({
+            'players': list(players),
+            'opponents': dict(opponents or {}),
+            'stats': list(SCENARIO_STATS) if include_stats else [],
+            'capacity': int(capacity),
+            'metadata': metadata or {}
+        }, default=str).encode('utf-8')
+
+        data_offset = _data_offset(HEADER_PREFIX.size + len(header))
+        row_width = len(players) * (1 + (len(SCENARIO_STATS) if include_stats else 0))
+        total_size = data_offset + capacity * row_width * 8
+
+        with open(filepath, 'wb') as f:
+            f.write(HEADER_PREFIX.pack(STORE_MAGIC, STORE_VERSION, 0, len(header)))
+            f.write(header)
+            f.truncate(total_size)
+
+        return cls(filepath, mode='r+')
+
+    @classmethod
+    def open(cls, filepath: str) -> 'ScenarioStore':
+        """Open read-only; rows appended by the writer become visible via `count`"""
+        return cls(filepath, mode='r')
+
+    @property
+    def count(self) -> int:
+        """Simulations completed so far (re-read from the shared header on every access)"""
+        return int(self._count[0])
+
+    @property
+    def num_players(self) -> int:
+        return len(self.players)
+
+    @property
+    def points(self) -> np.ndarray:
+        """Zero-copy (count, n_players) view of the completed rows"""
+        return self._points[:self.count]
+
+    @property
+    def stats(self) -> Optional[np.ndarray]:
+        return self._stats[:self.count] if self._stats is not None else None
+
+    def append(self, points: Sequence[float], stats: Optional[np.ndarray] = None):
+        """Append one scenario row (points in player order)"""
+        row = self._next_row()
+        self._points[row] = points
+        if self._stats is not None and stats is not None:
+            self._stats[row] = stats
+        self._count[0] = row + 1  # publish only after the row is written
+
+    def append_simulation(self, simulation):
+        """Append a SlateSimulation"""
+        row = self._next_row()
+        stats = self._stats[row] if self._stats is not None else None
+        fill_scenario_row(simulation, self.player_index, self._points[row], stats)
+        self._count[0] = row + 1
+
+    def truncate(self, count: int):
+        """Drop rows past `count` (used when a checkpointed run resumes)"""
+        self._require_writable()
+        self._count[0] = min(count, self.count)
+
+    def flush(self):
+        """Push written rows and the count to disk"""
+        if self.mode != 'r':
+            self._points.flush()
+            if self._stats is not None:
+                self._stats.flush()
+            self._count.flush()
+
+    def to_scenario_matrix(self, copy: bool = False) -> ScenarioMatrix:
+        """Scenario matrix over the rows completed so far (memmap views unless copy=True)"""
+        points = self.points
+        stats = self.stats
+        if copy:
+            points = np.array(points)
+            stats = np.array(stats) if stats is not None else None
+        return ScenarioMatrix(players=list(self.players), points=points,
+                              opponents=dict(self.opponents), stats=stats)
+
+    def close(self):
+        self.flush()
+        self._points = self._stats = self._count = None
+
+    def _next_row(self) -> int:
+        self._require_writable()
+        row = self.count
+        if row >= self.capacity:
+            raise ValueError(f"Scenario store is full ({self.capacity} simulations)")
+        return row
+
+    def _require_writable(self):
+        if self.mode == 'r':
+            raise ValueError("Scenario store is open read-only")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _data_offset(header_end: int) -> int:
+    return (header_end + DATA_ALIGN - 1) // DATA_ALIGN * DATA_ALIGN
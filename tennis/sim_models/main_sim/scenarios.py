@@ -0,0 +1,110 @@
+"""
+Slate Scenario Matrix
+Dense (simulations x players) view of slate simulation results for lineup tools
+
+Location: tennis/sim_models/main_sim/scenarios.py
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Per-player stats kept alongside fantasy points (last axis of ScenarioMatrix.stats)
+SCENARIO_STATS = ['won', 'sets_won', 'games_won', 'aces', 'double_faults', 'breaks']
+
+
+@dataclass
+class ScenarioMatrix:
+    """Fantasy points (and optional stats) for every player in every simulated scenario"""
+    players: List[str]
+    points: np.ndarray  # (n_simulations, n_players) DraftKings points
+    opponents: Dict[str, str] = field(default_factory=dict)
+    stats: Optional[np.ndarray] = None  # (n_simulations, n_players, len(SCENARIO_STATS))
+
+    def __post_init__(self):
+        self.player_index = {name: i for i, name in enumerate(self.players)}
+
+    @property
+    def num_simulations(self) -> int:
+        return self.points.shape[0]
+
+    @property
+    def num_players(self) -> int:
+        return self.points.shape[1]
+
+    def indices(self, player_names: Sequence[str]) -> np.ndarray:
+        """Column indices for a list of player names"""
+        return np.array([self.player_index[name] for name in player_names], dtype=np.intp)
+
+    def opponent_indices(self) -> np.ndarray:
+        """Column index of each player's opponent (-1 when unknown)"""
+        return np.array([self.player_index.get(self.opponents.get(name, ''), -1) for name in self.players],
+                        dtype=np.intp)
+
+    def player_points(self, player_name: str) -> np.ndarray:
+        """All simulated fantasy points for one player"""
+        return self.points[:, self.player_index[player_name]]
+
+    def means(self) -> np.ndarray:
+        return self.points.mean(axis=0)
+
+    def percentiles(self, q) -> np.ndarray:
+        return np.percentile(self.points, q, axis=0)
+
+    def head(self, num_simulations: int) -> 'ScenarioMatrix':
+        """Matrix restricted to the first `num_simulations` scenarios"""
+        return ScenarioMatrix(
+            players=list(self.players),
+            points=self.points[:num_simulations],
+            opponents=dict(self.opponents),
+            stats=self.stats[:num_simulations] if self.stats is not None else None
+        )
+
+    @classmethod
+    def from_simulations(cls, simulations: List, include_stats: bool = True) -> 'ScenarioMatrix':
+        """
+        Build the matrix from SlateSimulation results
+
+        Player order follows the matches of the first simulation (player1, player2, ...).
+        """
+        if not simulations:
+            raise ValueError("No simulations to build a scenario matrix from")
+
+        players, opponents = slate_players_and_opponents(simulations[0])
+        index = {name: i for i, name in enumerate(players)}
+
+        points = np.zeros((len(simulations), len(players)))
+        stats = np.zeros((len(simulations), len(players), len(SCENARIO_STATS))) if include_stats else None
+
+        for row, sim in enumerate(simulations):
+            fill_scenario_row(sim, index, points[row], stats[row] if include_stats else None)
+
+        return cls(players=players, points=points, opponents=opponents, stats=stats)
+
+
+def slate_players_and_opponents(simulation) -> Tuple[List[str], Dict[str, str]]:
+    """Player order (player1, player2 per match) and opponent map of a SlateSimulation"""
+    players = []
+    opponents = {}
+    for match in simulation.matches:
+        players.extend([match.player1, match.player2])
+        opponents[match.player1] = match.player2
+        opponents[match.player2] = match.player1
+    return players, opponents
+
+
+def fill_scenario_row(simulation, index: Dict[str, int], points: np.ndarray,
+                      stats: Optional[np.ndarray] = None):
+    """Write one SlateSimulation into a points row (and optional players x stats row)"""
+    for match in simulation.matches:
+        i1 = index[match.player1]
+        i2 = index[match.player2]
+        points[i1] = match.player1_fantasy_points
+        points[i2] = match.player2_fantasy_points
+        if stats is not None:
+            stats[i1] = (match.winner == 0, match.player1_sets_won, match.player1_games_won,
+                         match.player1_aces, match.player1_double_faults, match.player1_breaks)
+            stats[i2] = (match.winner == 1, match.player2_sets_won, match.player2_games_won,
+                         match.player2_aces, match.player2_double_faults, match.player2_breaks)
@@ -0,0 +1,162 @@
+"""
+DFS Showdown Scoring
+Captain-mode lineups scored from the same slate scenario matrix as classic lineups
+
+A showdown roster has one captain, whose fantasy points (and salary) count 1.5x,
+and flex players at face value. Captain points are a re-weighting of simulated
+player points, so no re-simulation is needed: for a roster, every captain choice
+is the roster total plus (multiplier - 1) times that player's points, evaluated
+for all rosters, captain choices and scenarios as one array expression.
+
+Location: tennis/sim_models/main_sim/showdown.py
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .scenarios import ScenarioMatrix
+from .lineup_scorer import LineupScoringEngine, LineupScores, DEFAULT_PERCENTILES
+
+
+SHOWDOWN_OBJECTIVES = ('mean', 'percentile', 'win_probability')
+
+
+@dataclass
+class ShowdownRules:
+    """DraftKings showdown roster rules"""
+    captain_multiplier: float = 1.5          # captain fantasy points
+    captain_salary_multiplier: float = 1.5   # captain salary
+    roster_size: int = 6                     # captain + flex players
+    salary_cap: int = 50000
+
+
+@dataclass
+class ShowdownLineup:
+    """One showdown lineup"""
+    captain: str
+    flex: List[str]
+    salary: int
+    mean_points: float
+    std_points: float
+    objective: float
+
+
+class ShowdownScorer:
+    """
+    Scores showdown rosters for every captain choice at once
+
+    Usage:
+        scorer = ShowdownScorer(slate_simulator.get_scenario_matrix(), get_salary_map(slate_data))
+        scores = scorer.captain_scores(rosters, objective='percentile', percentile=90)
+        captains, best = scorer.best_captains(rosters)
+    """
+
+    def __init__(self, scenarios: ScenarioMatrix, salaries: Dict[str, int],
+                 rules: Optional[ShowdownRules] = None, chunk_size: int = 2000,
+                 engine: Optional[LineupScoringEngine] = None):
+        """
+        Args:
+            scenarios: Simulated fantasy points for the slate
+            salaries: Player name -> flex salary (rosters with unsalaried players are infeasible)
+            rules: Showdown roster rules (DraftKings defaults)
+            chunk_size: Rosters expanded per (rosters x roster_size x simulations) block
+            engine: Existing scoring engine over the same scenarios, to share its matrices
+        """
+        self.scenarios = scenarios
+        self.rules = rules or ShowdownRules()
+        self.chunk_size = chunk_size
+        self.engine = engine or LineupScoringEngine(scenarios)
+        # Per scenario column; -1 marks players without a salary
+        self.salaries = np.array([salaries.get(name, -1) for name in scenarios.players], dtype=np.int64)
+
+    def roster_salaries(self, rosters) -> np.ndarray:
+        """Salary of every captain choice, shape (n_rosters, roster_size); -1 when unsalaried"""
+        indices = self.engine.to_indices(rosters)
+        flex = self.salaries[indices]
+        captain_extra = np.round((self.rules.captain_salary_multiplier - 1.0) * flex).astype(np.int64)
+        totals = flex.sum(axis=1, keepdims=True) + captain_extra
+        return np.where((flex < 0).any(axis=1, keepdims=True), -1, totals)
+
+    def captain_scores(self, rosters, objective: str = 'mean', percentile: float = 90.0,
+                       target: Optional[Union[float, np.ndarray]] = None) -> np.ndarray:
+        """
+        Objective for every captain choice of every roster
+
+        Args:
+            rosters: (n_rosters, roster_size) scenario columns or player names
+            objective: 'mean', 'percentile' (uses `percentile`) or 'win_probability'
+                (share of scenarios reaching `target`, scalar or one value per scenario)
+
+        Returns:
+            (n_rosters, roster_size) scores; entry [i, c] has roster i's c-th player as
+            captain, -inf where that choice is over the salary cap
+        """
+        if objective not in SHOWDOWN_OBJECTIVES:
+            raise ValueError(f"Unknown objective '{objective}', expected one of {SHOWDOWN_OBJECTIVES}")
+        if objective == 'win_probability' and target is None:
+            raise ValueError("The 'win_probability' objective needs a target score")
+
+        indices = self.engine.to_indices(rosters)
+        multiplier = self.rules.captain_multiplier
+
+        if objective == 'mean':
+            means = self.engine.player_means[indices]
+            scores = means.sum(axis=1, keepdims=True) + (multiplier - 1.0) * means
+        else:
+            blocks = []
+            for start in range(0, len(indices), self.chunk_size):
+                totals = self.engine.captain_totals(indices[start:start + self.chunk_size], multiplier)
+                if objective == 'percentile':
+                    blocks.append(np.percentile(totals, percentile, axis=2))
+                else:
+                    blocks.append((totals >= np.asarray(target, dtype=float)).mean(axis=2))
+            scores = np.concatenate(blocks) if blocks else np.empty(indices.shape)
+
+        salaries = self.roster_salaries(indices)
+        feasible = (salaries >= 0) & (salaries <= self.rules.salary_cap)
+        return np.where(feasible, scores, -np.inf)
+
+    def best_captains(self, rosters, objective: str = 'mean', percentile: float = 90.0,
+                      target: Optional[Union[float, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Best captain position per roster and its score (-inf when no choice fits the cap)"""
+        scores = self.captain_scores(rosters, objective, percentile, target)
+        captains = scores.argmax(axis=1)
+        return captains, scores[np.arange(len(scores)), captains]
+
+    def score(self, rosters, captains: np.ndarray,
+              percentiles: Sequence[float] = DEFAULT_PERCENTILES, top_fraction: float = 0.01) -> LineupScores:
+        """Full distribution summary for rosters with a chosen captain position each"""
+        indices = self.engine.to_indices(rosters)
+        captain_columns = indices[np.arange(len(indices)), np.asarray(captains, dtype=np.intp)]
+        return self.engine.score(self.engine.encode(indices), percentiles, top_fraction,
+                                 captains=captain_columns, captain_multiplier=self.rules.captain_multiplier)
+
+    def lineups(self, rosters, objective: str = 'mean', percentile: float = 90.0,
+                target: Optional[Union[float, np.ndarray]] = None) -> List[ShowdownLineup]:
+        """Rosters with their best captain, sorted by objective (infeasible rosters dropped)"""
+        indices = self.engine.to_indices(rosters)
+        captains, best = self.best_captains(indices, objective, percentile, target)
+        keep = np.flatnonzero(np.isfinite(best))
+        if len(keep) == 0:
+            return []
+
+        rows = np.arange(len(indices))[keep]
+        totals = self.engine.lineup_totals(indices[rows], captains=indices[rows, captains[keep]],
+                                           captain_multiplier=self.rules.captain_multiplier)
+        salaries = self.roster_salaries(indices[rows])
+        players = self.scenarios.players
+
+        lineups = []
+        for k, i in enumerate(rows):
+            captain = captains[i]
+            lineups.append(ShowdownLineup(
+                captain=players[indices[i, captain]],
+                flex=[players[c] for j, c in enumerate(indices[i]) if j != captain],
+                salary=int(salaries[k, captain]),
+                mean_points=float(totals[k].mean()),
+                std_points=float(totals[k].std()),
+                objective=float(best[i])
+            ))
+        return sorted(lineups, key=lambda lineup: -lineup.objective)
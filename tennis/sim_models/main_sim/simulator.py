@@ -6,24 +6,24 @@ Enhanced with ML insights and advanced analytics
 
 import random
 import math
-from typing import Dict, Any, Tuple, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, Tuple, List, Optional
 from .stats import FantasyStats, SetResult, GameResult
 from .analyzer import TennisStatsAnalyzer
-from .enhanced_data_engine import EnhancedDataEngine
-from .enhanced_profiles import EnhancedPlayerProfile
-from .enhanced_analytics import (
-    EnhancedMatchResult, EnhancedAnalyticsEngine,
-    MLInsights, TacticalAnalysis, BettingAnalysis
-)
+from .analyzer_registry import get_shared_analyzer
+from .matchup_matrix import MatchupMatrix
+
+if TYPE_CHECKING:  # The enhanced analytics stack is imported by simulate_match_enhanced
+    from .enhanced_analytics import EnhancedMatchResult
 
 
 class FantasyTennisSimulator:
     """Main tennis match simulator with fantasy scoring."""
 
-    def __init__(self, data_source: Optional[str] = None):
-        self.analyzer = TennisStatsAnalyzer(data_source)
-        self.player_stats = self.analyzer.player_stats
-        self.calculated_stats = self.analyzer.calculated_stats
+    def __init__(self, data_source: Optional[str] = None, analyzer: Optional[TennisStatsAnalyzer] = None):
+        # Shared per-process analyzer unless a private one (e.g. an edited copy) is given
+        self.analyzer = analyzer or get_shared_analyzer(data_source)
+        self.matchups: Optional[MatchupMatrix] = None  # see build_matchup_matrix
+        self._matchups_version = None
 
         # Surface adjustments based on our data analysis
         self.surface_adjustments = {
@@ -47,8 +47,51 @@ class FantasyTennisSimulator:
             }
         }
 
+    @property
+    def player_stats(self) -> Dict[str, Any]:
+        return self.analyzer.player_stats
+
+    @property
+    def calculated_stats(self) -> Dict[str, Any]:
+        return self.analyzer.calculated_stats
+
+    def reload_data(self):
+        """Reload the player database (shared with every simulator using the same analyzer)."""
+        self.analyzer.reload()
+        self.clear_matchups()
+
+    @property
+    def data_version(self) -> int:
+        return self.analyzer.data_version
+
+    @property
+    def cache_version(self) -> int:
+        return self.analyzer.cache_version
+
+    def build_matchup_matrix(self, players) -> MatchupMatrix:
+        """Precompute matchup data for a player pool; the simulator reads from it from now on."""
+        self.matchups = MatchupMatrix.build(self, players)
+        self._matchups_version = (self.data_version, self.cache_version)
+        return self.matchups
+
+    def ensure_matchups(self, players):
+        """Build (or extend) the matchup matrix so it covers `players`."""
+        self.analyzer.check_player_edits()  # Stats dicts edited in place bump cache_version
+        if self.matchups is None or self._matchups_version != (self.data_version, self.cache_version):
+            # Also rebuilds after another holder of a shared analyzer reloaded it or invalidated players
+            self.build_matchup_matrix(players)
+        elif not all(name in self.matchups.player_index for name in players):
+            self.build_matchup_matrix(list(self.matchups.players) + list(players))
+
+    def clear_matchups(self):
+        """Drop the matchup matrix (call after changing analyzer data)."""
+        self.matchups = None
+
     def calculate_elo_win_probability(self, player1: str, player2: str, surface: str = 'Hard') -> float:
         """Calculate win probability for player1 based on surface-specific ELO ratings."""
+        if self.matchups is not None and self.matchups.covers(surface, player1, player2):
+            return self.matchups.win_probability(player1, player2, surface)
+
         elo1 = self.analyzer.get_player_elo(player1, surface)
         elo2 = self.analyzer.get_player_elo(player2, surface)
 
@@ -78,6 +121,12 @@ class FantasyTennisSimulator:
 
     def get_player_probabilities(self, player_name: str, surface: str = 'Hard') -> Dict[str, float]:
         """Get surface-weighted probabilities for a player."""
+        if self.matchups is not None and self.matchups.covers(surface, player_name):
+            return self.matchups.player_probabilities(player_name, surface)
+        return self.compute_player_probabilities(player_name, surface)
+
+    def compute_player_probabilities(self, player_name: str, surface: str = 'Hard') -> Dict[str, float]:
+        """Surface-weighted probabilities straight from the analyzer (bypasses the matchup matrix)."""
         # Use surface-weighted stats from analyzer
         surface_weighted_stats = self.analyzer.get_player_stats(player_name, surface)
 
@@ -357,50 +406,22 @@ class FantasyTennisSimulator:
 
             # Apply ELO-based skill adjustment (get surface from rally context)
             surface = rally_context.get('surface', 'Hard')
-            elo_win_prob = self.calculate_elo_win_probability(server_name, returner_name, surface)
 
             # Normalize stats-based probability
             total_strength = server_strength + returner_strength
             stats_server_prob = server_strength / total_strength if total_strength > 0 else 0.5
 
-            # Only apply ELO blending if we have valid ELO data for both players
-            server_elo = self.analyzer.get_player_elo(server_name, surface)
-            returner_elo = self.analyzer.get_player_elo(returner_name, surface)
-
-            if server_elo and returner_elo:
-                # Calculate ELO difference to determine appropriate weighting
-                elo_diff = abs(server_elo - returner_elo)
-
-                # Account for ELO overvaluation at the top end
-                # Studies show ELO ratings overestimate elite player dominance
-                # Use calibrated ELO weights based on testing with real betting lines
-
-                if elo_diff >= 400:  # Massive skill gap (like Carlos vs low-ranked)
-                    elo_weight = 0.20  # Reduced - ELO overvalues extreme dominance
-                    stats_weight = 0.65
-                    random_weight = 0.15
-                elif elo_diff >= 300:  # Large skill gap (like Shelton vs Gigante)
-                    elo_weight = 0.15  # Much lower - tennis simulation heavily amplifies advantages
-                    stats_weight = 0.50
-                    random_weight = 0.35  # Much higher randomness to prevent extreme dominance
-                elif elo_diff >= 200:  # Moderate-large skill gap
-                    elo_weight = 0.35  # Moderate ELO influence
-                    stats_weight = 0.55
-                    random_weight = 0.10
-                elif elo_diff >= 100:  # Moderate skill gap
-                    elo_weight = 0.30  # Keep moderate influence for mid-tier gaps
-                    stats_weight = 0.60
-                    random_weight = 0.10
-                else:  # Small skill gap
-                    elo_weight = 0.35  # Higher weight for close matches where ELO is more accurate
-                    stats_weight = 0.55
-                    random_weight = 0.10
-
-                # Combine ELO, stats, and randomness with corrected weighting
-                server_win_prob = (elo_weight * elo_win_prob) + (stats_weight * stats_server_prob) + (random_weight * 0.5)
+            if self.matchups is not None and self.matchups.covers(surface, server_name, returner_name):
+                # Precomputed pair blend (same weights as below)
+                blend = self.matchups.point_blend(server_name, returner_name, surface)
+                if blend:
+                    elo_term, stats_weight, random_term = blend
+                    server_win_prob = elo_term + (stats_weight * stats_server_prob) + random_term
+                else:
+                    server_win_prob = stats_server_prob
             else:
-                # Fall back to pure stats if ELO data missing
-                server_win_prob = stats_server_prob
+                server_win_prob = self._blend_point_probability(server_name, returner_name, surface,
+                                                                stats_server_prob)
         else:
             # Fallback to stats-only if no rally context
             total_strength = server_strength + returner_strength
@@ -413,6 +434,52 @@ class FantasyTennisSimulator:
 
         return result
 
+    def _blend_point_probability(self, server_name: str, returner_name: str, surface: str,
+                                 stats_server_prob: float) -> float:
+        """Blend ELO, stats and randomness into the server's point win probability."""
+        elo_win_prob = self.calculate_elo_win_probability(server_name, returner_name, surface)
+
+        # Only apply ELO blending if we have valid ELO data for both players
+        server_elo = self.analyzer.get_player_elo(server_name, surface)
+        returner_elo = self.analyzer.get_player_elo(returner_name, surface)
+
+        if server_elo and returner_elo:
+            # Calculate ELO difference to determine appropriate weighting
+            elo_diff = abs(server_elo - returner_elo)
+
+            # Account for ELO overvaluation at the top end
+            # Studies show ELO ratings overestimate elite player dominance
+            # Use calibrated ELO weights based on testing with real betting lines
+
+            if elo_diff >= 400:  # Massive skill gap (like Carlos vs low-ranked)
+                elo_weight = 0.20  # Reduced - ELO overvalues extreme dominance
+                stats_weight = 0.65
+                random_weight = 0.15
+            elif elo_diff >= 300:  # Large skill gap (like Shelton vs Gigante)
+                elo_weight = 0.15  # Much lower - tennis simulation heavily amplifies advantages
+                stats_weight = 0.50
+                random_weight = 0.35  # Much higher randomness to prevent extreme dominance
+            elif elo_diff >= 200:  # Moderate-large skill gap
+                elo_weight = 0.35  # Moderate ELO influence
+                stats_weight = 0.55
+                random_weight = 0.10
+            elif elo_diff >= 100:  # Moderate skill gap
+                elo_weight = 0.30  # Keep moderate influence for mid-tier gaps
+                stats_weight = 0.60
+                random_weight = 0.10
+            else:  # Small skill gap
+                elo_weight = 0.35  # Higher weight for close matches where ELO is more accurate
+                stats_weight = 0.55
+                random_weight = 0.10
+
+            # Combine ELO, stats, and randomness with corrected weighting
+            server_win_prob = (elo_weight * elo_win_prob) + (stats_weight * stats_server_prob) + (random_weight * 0.5)
+        else:
+            # Fall back to pure stats if ELO data missing
+            server_win_prob = stats_server_prob
+
+        return server_win_prob
+
     def simulate_game(self, server_probs: Dict[str, float], returner_probs: Dict[str, float],
                      server_name: str, returner_name: str, game_situation: Optional[Dict] = None) -> GameResult:
         """Simulate a tennis game with pressure situation awareness."""
@@ -644,7 +711,7 @@ class FantasyTennisSimulator:
 
     def simulate_match_enhanced(self, player1: str, player2: str, surface: str = 'Hard',
                               best_of_5: bool = False, use_variance: bool = True,
-                              analysis_depth: str = "standard", verbose: bool = False) -> EnhancedMatchResult:
+                              analysis_depth: str = "standard", verbose: bool = False) -> 'EnhancedMatchResult':
         """
         Enhanced match simulation with ML insights and comprehensive analytics
 
@@ -660,9 +727,12 @@ class FantasyTennisSimulator:
         Returns:
             EnhancedMatchResult with comprehensive analytics
         """
+        from .enhanced_data_engine import EnhancedDataEngine
+        from .enhanced_analytics import EnhancedMatchResult, EnhancedAnalyticsEngine
+
         # Initialize enhanced data engine if not already done
         if not hasattr(self, 'enhanced_engine'):
-            self.enhanced_engine = EnhancedDataEngine()
+            self.enhanced_engine = EnhancedDataEngine(analyzer=self.analyzer)
             self.analytics_engine = EnhancedAnalyticsEngine()
 
         if verbose:
@@ -0,0 +1,39 @@
+"""
+DraftKings Slate Loader
+Parses player pool / slate JSON files into matches and salaries
+
+Slate files look like data/processed/player_pool.json:
+    {"surface": "Clay", "players": [{"name": ..., "opponent": ..., "salary": ...}, ...]}
+
+Location: tennis/sim_models/main_sim/slate_loader.py
+"""
+
+import json
+from typing import Any, Dict, List
+
+from .slate_simulator import Match
+
+
+def load_slate_file(file_path: str) -> Dict[str, Any]:
+    """Load a slate JSON file"""
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def extract_matches(slate_data: Dict[str, Any], default_surface: str = 'Clay') -> List[Match]:
+    """Extract unique matches from slate player data (players in alphabetical order)"""
+    surface = slate_data.get('surface', default_surface)
+    unique_matches = {}
+
+    for player in slate_data['players']:
+        match_key = tuple(sorted([player['name'], player['opponent']]))
+        if match_key not in unique_matches:
+            player1, player2 = match_key
+            unique_matches[match_key] = Match(player1=player1, player2=player2, surface=surface)
+
+    return list(unique_matches.values())
+
+
+def get_salary_map(slate_data: Dict[str, Any]) -> Dict[str, int]:
+    """Map player names to DraftKings salaries"""
+    return {player['name']: player['salary'] for player in slate_data['players']}
@@ -6,14 +6,25 @@ Location: tennis/sim_models/main_sim/slate_simulator.py
 """
 
 import json
-import pandas as pd
+import random
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Tuple, Optional, Union
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
 
 from .simulator import FantasyTennisSimulator
 from .stats import FantasyStats
+from .result_writer import ColumnarResultWriter
+from .scenarios import ScenarioMatrix
+from .showdown import ShowdownRules, ShowdownScorer
+from .covariance import OnlineCovariance
+from .scenario_store import ScenarioStore
+from .compact_scenarios import CompactScenarioMatrix
+from .checkpoint import SlateCheckpoint, save_checkpoint, load_checkpoint
+from .progress import ProgressCallback, ProgressTracker, print_progress
+from .deadline import DeadlineResult, run_until_deadline
+from .match_cache import MatchBlockCache, match_block_key, block_seed, seeded_random
 
 
 @dataclass
@@ -23,6 +34,7 @@ class Match:
     player2: str
     surface: str
     match_id: str = ""
+    best_of_5: bool = False
     
     def __post_init__(self):
         if not self.match_id:
@@ -58,6 +70,33 @@ class MatchResult:
     player2_breaks: int
 
 
+def get_slate_players(matches: List[Match]) -> List[str]:
+    """Players of a slate in match order (player1, player2, ...)"""
+    players = []
+    for match in matches:
+        players.extend([match.player1, match.player2])
+    return players
+
+
+def assemble_slate_simulations(blocks: List[List[MatchResult]], num_simulations: int) -> List['SlateSimulation']:
+    """Combine per-match outcome blocks into slate simulations (i-th outcome of every match)"""
+    simulations = []
+    for i in range(num_simulations):
+        match_results = [block[i] for block in blocks]
+        simulations.append(SlateSimulation(
+            simulation_id=i + 1,
+            timestamp=datetime.now().isoformat(),
+            matches=match_results,
+            total_fantasy_points=sum(r.player1_fantasy_points + r.player2_fantasy_points
+                                     for r in match_results)
+        ))
+    return simulations
+
+
+# Column layout used by the streaming result writer: one row per (simulation, match)
+RESULT_COLUMNS = [('simulation_id', int)] + [(f.name, f.type) for f in fields(MatchResult)]
+
+
 @dataclass
 class SlateSimulation:
     """Results of one complete slate simulation"""
@@ -101,27 +140,102 @@ class SlateSimulation:
         
         return player_results
 
+    def fantasy_points_row(self) -> List[float]:
+        """Fantasy points in slate player order (player1, player2 of each match)"""
+        row = []
+        for match in self.matches:
+            row.extend([match.player1_fantasy_points, match.player2_fantasy_points])
+        return row
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """Flatten into one row per match for columnar export"""
+        rows = []
+        for match in self.matches:
+            row = {'simulation_id': self.simulation_id}
+            row.update(match.__dict__)
+            rows.append(row)
+        return rows
+
 
 class TennisSlateSimulator:
     """
     Simulates full slates of tennis matches for DFS analysis
     """
     
-    def __init__(self, data_source: Optional[str] = None):
-        """Initialize the slate simulator"""
+    def __init__(self, data_source: Optional[str] = None, seed: Optional[int] = None):
+        """Initialize the slate simulator with optional random seed"""
         print("🎾 Initializing Tennis Slate Simulator...")
+        if seed is not None:
+            random.seed(seed)
+
+        self.data_source = data_source
+        self.seed = seed
         self.simulator = FantasyTennisSimulator(data_source)
         self.results_history: List[SlateSimulation] = []
+        self.covariance: Optional[OnlineCovariance] = None
+        self.match_cache = MatchBlockCache()
+        # Unseeded simulators draw a block seed base without consuming the global RNG
+        self._block_seed_base = seed if seed is not None else random.Random().getrandbits(32)
         print("✅ Slate Simulator ready!")
+
+    def get_run_metadata(self, matches: Optional[List[Match]] = None,
+                         num_simulations: Optional[int] = None) -> Dict[str, Any]:
+        """Describe the configuration of a run for storage alongside its results"""
+        metadata = {
+            'seed': self.seed,
+            'data_source': self.data_source,
+            'data_version': self.simulator.data_version,
+            'surface_adjustments': self.simulator.surface_adjustments,
+        }
+        if matches is not None:
+            metadata['matches'] = [asdict(m) for m in matches]
+        if num_simulations is not None:
+            metadata['num_simulations'] = num_simulations
+        return metadata
+
+    def open_result_writer(self, filename: str, matches: Optional[List[Match]] = None,
+                           num_simulations: Optional[int] = None, format: str = 'auto',
+                           row_group_size: int = 10000) -> ColumnarResultWriter:
+        """
+        Open a streaming columnar writer for slate results
+
+        Pass the writer to simulate_multiple_slates to flush row groups while
+        the simulation runs. Config and seed are recorded in the file metadata.
+        """
+        return ColumnarResultWriter(
+            filename, RESULT_COLUMNS,
+            metadata=self.get_run_metadata(matches, num_simulations),
+            format=format, row_group_size=row_group_size
+        )
+
+    def create_scenario_store(self, filename: str, matches: List[Match], num_simulations: int,
+                              include_stats: bool = True) -> ScenarioStore:
+        """
+        Create a memory-mapped scenario store sized for this run
+
+        Pass it to simulate_multiple_slates; the optimizer, contest simulator and
+        notebooks can open the file with ScenarioStore.open while rows are appended.
+        """
+        players = get_slate_players(matches)
+        opponents = {}
+        for match in matches:
+            opponents[match.player1] = match.player2
+            opponents[match.player2] = match.player1
+        return ScenarioStore.create(
+            filename, players, num_simulations, opponents=opponents, include_stats=include_stats,
+            metadata=self.get_run_metadata(matches, num_simulations)
+        )
     
     def simulate_match(self, match: Match, verbose: bool = False) -> MatchResult:
         """Simulate a single match and return structured result"""
         if verbose:
             print(f"   🎾 Simulating: {match.player1} vs {match.player2} on {match.surface}")
+
+        self.simulator.ensure_matchups((match.player1, match.player2))
         
         # Run the simulation
         p1_stats, p2_stats, sets = self.simulator.simulate_match_detailed(
-            match.player1, match.player2, match.surface, verbose=False
+            match.player1, match.player2, match.surface, best_of_5=match.best_of_5, verbose=False
         )
         
         # Determine winner
@@ -152,13 +266,13 @@ class TennisSlateSimulator:
             loser_name=loser_name,
             final_score=final_score,
             duration_minutes=duration_minutes,
-            player1_fantasy_points=p1_stats.calculate_fantasy_points(),
+            player1_fantasy_points=p1_stats.calculate_fantasy_points(match.best_of_5),
             player1_sets_won=p1_stats.sets_won,
             player1_games_won=p1_stats.games_won,
             player1_aces=p1_stats.aces,
             player1_double_faults=p1_stats.double_faults,
             player1_breaks=p1_stats.breaks,
-            player2_fantasy_points=p2_stats.calculate_fantasy_points(),
+            player2_fantasy_points=p2_stats.calculate_fantasy_points(match.best_of_5),
             player2_sets_won=p2_stats.sets_won,
             player2_games_won=p2_stats.games_won,
             player2_aces=p2_stats.aces,
@@ -204,24 +318,198 @@ class TennisSlateSimulator:
         return slate_sim
     
     def simulate_multiple_slates(self, matches: List[Match], num_simulations: int = 100, 
-                               verbose: bool = True) -> List[SlateSimulation]:
-        """Simulate the same slate multiple times"""
+                               verbose: bool = True,
+                               writer: Optional[ColumnarResultWriter] = None,
+                               checkpoint_path: Optional[str] = None,
+                               checkpoint_every: int = 1000,
+                               resume_from: Optional[str] = None,
+                               scenario_store: Optional[ScenarioStore] = None,
+                               progress_callback: Optional[ProgressCallback] = None,
+                               progress_every: int = 10) -> List[SlateSimulation]:
+        """
+        Simulate the same slate multiple times
+
+        Args:
+            matches: Matches on the slate
+            num_simulations: Number of slate simulations to run
+            verbose: Print progress
+            writer: Optional streaming writer (see open_result_writer); each slate
+                is written as soon as it completes. The caller closes the writer.
+            checkpoint_path: Write aggregate + RNG state here every `checkpoint_every`
+                simulations (atomic rename) and when the run finishes
+            checkpoint_every: Simulations between checkpoints
+            resume_from: Checkpoint to continue from; the run picks up at the next
+                simulation and ends with the same aggregates and history as an
+                uninterrupted run (the history replaces `self.results_history`)
+            scenario_store: Optional memory-mapped store (see create_scenario_store);
+                each slate is appended as a scenario row as soon as it completes
+            progress_callback: Receives a ProgressEvent every `progress_every`
+                simulations; returning False stops the run (after a checkpoint, when
+                checkpointing). Verbose runs print progress when no callback is given.
+            progress_every: Simulations between progress events
+
+        Player fantasy-point covariance is accumulated online in `self.covariance`
+        (reset when the slate's players change).
+
+        Returns:
+            Simulations run by this call (after the resume point when resuming)
+        """
         if verbose:
             print(f"\n🎯 Running {num_simulations} simulations of {len(matches)}-match slate")
-        
+
+        players = get_slate_players(matches)
+        self.simulator.ensure_matchups(players)
+        match_dicts = [asdict(m) for m in matches]
+        start = 1
+        total_fantasy_points = 0.0
+
+        if resume_from is not None:
+            checkpoint = load_checkpoint(resume_from)
+            checkpoint.validate(match_dicts)
+            random.setstate(checkpoint.rng_state)
+            self.covariance = OnlineCovariance.from_state(checkpoint.covariance_state)
+            total_fantasy_points = checkpoint.total_fantasy_points
+            self.results_history = list(checkpoint.results_history)
+            start = checkpoint.completed + 1
+            if scenario_store is not None:
+                scenario_store.truncate(checkpoint.completed)
+            if verbose:
+                print(f"♻️ Resuming from checkpoint at simulation {start}/{num_simulations}")
+        elif self.covariance is None or self.covariance.players != players:
+            self.covariance = OnlineCovariance(players)
+
+        callback = progress_callback or (print_progress if verbose else None)
+        tracker = ProgressTracker(num_simulations, callback, every=progress_every,
+                                  label='slate', start_at=start - 1)
+
+        def save(completed: int):
+            if writer is not None:
+                writer.flush()
+            if scenario_store is not None:
+                scenario_store.flush()
+            save_checkpoint(checkpoint_path, SlateCheckpoint(
+                matches=match_dicts,
+                num_simulations=num_simulations,
+                completed=completed,
+                rng_state=random.getstate(),
+                seed=self.seed,
+                covariance_state=self.covariance.get_state(),
+                total_fantasy_points=total_fantasy_points,
+                results_history=self.results_history
+            ))
+
         simulations = []
-        for i in range(1, num_simulations + 1):
-            if verbose and i % 10 == 0:
-                print(f"   Completed {i}/{num_simulations} simulations...")
-            
+        for i in range(start, num_simulations + 1):
+            started = time.perf_counter()
             slate_sim = self.simulate_slate(matches, simulation_id=i, verbose=False)
+            busy = time.perf_counter() - started
             simulations.append(slate_sim)
-        
-        if verbose:
-            print(f"✅ All {num_simulations} simulations complete!")
+
+            self.covariance.update(slate_sim.fantasy_points_row())
+
+            total_fantasy_points += slate_sim.total_fantasy_points
+
+            if writer is not None:
+                writer.write_rows(slate_sim.to_rows())
+            if scenario_store is not None:
+                scenario_store.append_simulation(slate_sim)
+
+            keep_going = tracker.step(matches=len(matches), busy_seconds=busy)
+
+            if checkpoint_path and (i % checkpoint_every == 0 or i == num_simulations or not keep_going):
+                save(i)
+
+            if not keep_going:
+                if verbose:
+                    print(f"⏹️ Stopped by progress callback at {i}/{num_simulations} simulations")
+                break
+        else:
+            if verbose:
+                print(f"✅ All {num_simulations} simulations complete!")
+
+        tracker.finish()
         
         return simulations
     
+    def get_match_block_key(self, match: Match) -> str:
+        """Cache key of a match's outcome block (players, surface, format, config, data fingerprint, seed)"""
+        config = {
+            'data_source': self.data_source,
+            # Versions restart in every process; the source files' sizes and mtimes keep
+            # blocks persisted by MatchBlockCache(cache_dir=...) from outliving the data
+            'source_fingerprint': self.simulator.analyzer.source_fingerprint,
+            'time_weighted_stats': self.simulator.analyzer.time_weighted_stats,
+            'data_version': self.simulator.data_version,
+            'cache_version': self.simulator.cache_version,  # player data edited in place and invalidated
+            'surface_adjustments': self.simulator.surface_adjustments
+        }
+        return match_block_key(match.player1, match.player2, match.surface, match.best_of_5,
+                               config, self._block_seed_base)
+
+    def simulate_match_block(self, match: Match, num_simulations: int) -> List[MatchResult]:
+        """N outcomes of one match, from the cache or simulated from the block's own seed"""
+        key = self.get_match_block_key(match)
+        block = self.match_cache.get(key, num_simulations)
+        if block is None:
+            with seeded_random(block_seed(key)):
+                block = [self.simulate_match(match) for _ in range(num_simulations)]
+            self.match_cache.put(key, block)
+        return block
+
+    def resimulate_slate(self, matches: List[Match], num_simulations: int = 100,
+                         verbose: bool = True) -> List[SlateSimulation]:
+        """
+        Build slate simulations from per-match outcome blocks
+
+        Unchanged matches come from `self.match_cache`; only new or changed matches
+        (withdrawal, replacement opponent, surface or format fix) are simulated.
+        Results replace the history and the player covariance.
+        """
+        self.simulator.ensure_matchups(get_slate_players(matches))
+        hits_before = self.match_cache.hits
+        blocks = [self.simulate_match_block(match, num_simulations) for match in matches]
+        reused = self.match_cache.hits - hits_before
+
+        simulations = assemble_slate_simulations(blocks, num_simulations)
+
+        self.results_history = simulations
+        self.covariance = OnlineCovariance(get_slate_players(matches))
+        self.covariance.update_batch([sim.fantasy_points_row() for sim in simulations])
+
+        if verbose:
+            print(f"♻️ Rebuilt {num_simulations} slate simulations: "
+                  f"{reused}/{len(matches)} matches from cache, {len(matches) - reused} simulated")
+
+        return simulations
+
+    def simulate_until(self, matches: List[Match], deadline: Union[datetime, float],
+                       batch_size: int = 25, max_workers: Optional[int] = None,
+                       target_std_error: Optional[float] = None,
+                       progress_callback: Optional[ProgressCallback] = None,
+                       verbose: bool = True) -> DeadlineResult:
+        """
+        Simulate as much as fits before a wall-clock deadline ("simulate until lock")
+
+        Batches of match outcomes are spread over a process pool (all cores by
+        default); each new batch goes to the match with the largest standard error
+        on a player's mean fantasy points.
+
+        Args:
+            matches: Matches on the slate
+            deadline: datetime to stop at, or a budget in seconds
+            batch_size: Match outcomes per scheduled batch
+            max_workers: Worker processes (defaults to the CPU count; 1 runs in-process)
+            target_std_error: Stop early once every player's standard error is below this
+            progress_callback: Receives ProgressEvents (counted in match simulations)
+
+        Returns:
+            DeadlineResult with per-player estimates, the precision reached and the
+            raw outcomes (see DeadlineResult.to_scenario_matrix)
+        """
+        return run_until_deadline(self, matches, deadline, batch_size=batch_size,
+                                  max_workers=max_workers, target_std_error=target_std_error,
+                                  progress_callback=progress_callback, verbose=verbose)
+
     def get_player_statistics(self, player_name: str, num_recent_sims: int = None) -> Dict[str, Any]:
         """Get aggregated statistics for a specific player across simulations"""
         if num_recent_sims:
@@ -256,8 +544,34 @@ class TennisSlateSimulator:
             'surfaces_played': list(set(r['surface'] for r in player_results))
         }
     
+    def get_player_correlations(self) -> Dict[str, Dict[str, float]]:
+        """Correlation of fantasy points between every pair of slate players"""
+        if self.covariance is None or self.covariance.count < 2:
+            return {}
+        corr = self.covariance.correlation()
+        players = self.covariance.players
+        return {p1: {p2: float(corr[i, j]) for j, p2 in enumerate(players)}
+                for i, p1 in enumerate(players)}
+
+    def get_scenario_matrix(self, num_recent_sims: int = None) -> ScenarioMatrix:
+        """Simulated fantasy points as a (simulations x players) matrix for lineup tools"""
+        sims = self.results_history[-num_recent_sims:] if num_recent_sims else self.results_history
+        return ScenarioMatrix.from_simulations(sims)
+
+    def get_showdown_scorer(self, salaries: Dict[str, int], rules: Optional[ShowdownRules] = None,
+                            num_recent_sims: int = None) -> ShowdownScorer:
+        """Captain-mode scorer over the simulated scenarios (no re-simulation needed)"""
+        return ShowdownScorer(self.get_scenario_matrix(num_recent_sims), salaries, rules)
+
     def export_results(self, filename: str = None, format: str = 'json') -> str:
-        """Export simulation results to file"""
+        """
+        Export simulation results to file
+
+        Formats: 'json', 'csv', 'parquet' (requires pyarrow) or 'binary'
+        (compact columnar fallback). The columnar formats are streamed in
+        row groups and record the run config and seed. 'scenarios' writes the
+        packed, zlib-compressed scenario matrix (CompactScenarioMatrix.load).
+        """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"slate_simulations_{timestamp}"
@@ -290,9 +604,23 @@ class TennisSlateSimulator:
                         'p2_breaks': match.player2_breaks
                     })
             
+            import pandas as pd  # Only CSV export needs pandas; keeps simulator imports light
+
             filepath = f"{filename}.csv"
             df = pd.DataFrame(rows)
             df.to_csv(filepath, index=False)
+
+        elif format in ('parquet', 'binary'):
+            with self.open_result_writer(filename, format=format) as writer:
+                for sim in self.results_history:
+                    writer.write_rows(sim.to_rows())
+            filepath = writer.filepath
+
+        elif format == 'scenarios':
+            filepath = CompactScenarioMatrix.from_matrix(self.get_scenario_matrix()).save(f"{filename}.scnz")
+
+        else:
+            raise ValueError(f"Unknown export format: {format}")
         
         print(f"📁 Results exported to: {filepath}")
         return filepath
@@ -300,6 +628,7 @@ class TennisSlateSimulator:
     def clear_history(self):
         """Clear simulation history"""
         self.results_history = []
+        self.covariance = None
         print("🗑️ Simulation history cleared")
     
     def summary(self) -> Dict[str, Any]: